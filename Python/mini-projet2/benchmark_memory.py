@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Mesure de l'empreinte mémoire des entités du modèle.
+Système de location de véhicules - Benchmark
+
+Pour chaque classe (Car, Truck, Motorcycle, Customer, Rental), compare la
+taille d'une instance à attributs en __slots__ à celle d'une instance
+portant les mêmes attributs dans un __dict__ (disposition des classes
+avant le passage aux slots). Les valeurs des attributs sont partagées
+entre les deux mesures: seul le coût du conteneur est comparé.
+
+Usage:
+    python benchmark_memory.py            # 100 000 instances par classe
+    python benchmark_memory.py -n 20000   # Nombre d'instances personnalisé
+"""
+
+import sys
+import argparse
+import tracemalloc
+from datetime import date, timedelta
+from typing import Callable, List, Tuple
+
+from models.vehicle import Car, Truck, Motorcycle, VehicleCategory
+from models.customer import Customer
+from models.rental import Rental
+
+
+def build_car(i: int) -> Car:
+    return Car(
+        brand="Renault", model="Clio", category=VehicleCategory.ECONOMY,
+        daily_rate=35.0, year=2022, license_plate=f"AB-{i:06d}", vehicle_id=f"CAR{i}"
+    )
+
+
+def build_truck(i: int) -> Truck:
+    return Truck(
+        brand="Renault", model="Master", category=VehicleCategory.UTILITY,
+        daily_rate=80.0, year=2021, license_plate=f"TR-{i:06d}",
+        cargo_capacity=12.0, max_weight=3000, vehicle_id=f"TRK{i}"
+    )
+
+
+def build_motorcycle(i: int) -> Motorcycle:
+    return Motorcycle(
+        brand="Honda", model="CB125R", category=VehicleCategory.ECONOMY,
+        daily_rate=35.0, year=2022, license_plate=f"MO-{i:06d}",
+        engine_size=125, motorcycle_type="standard", vehicle_id=f"MOTO{i}"
+    )
+
+
+def build_customer(i: int) -> Customer:
+    return Customer(
+        first_name="Jean", last_name="Dupont", birth_date=date(1990, 5, 15),
+        license_number=f"{i:012d}", license_types={"B"}, license_date=date(2010, 6, 20),
+        email=f"client{i}@email.com", phone="0612345678", customer_id=f"CUST{i}"
+    )
+
+
+def build_rental(i: int) -> Rental:
+    start = date.today() + timedelta(days=1)
+    return Rental(
+        customer_id=f"CUST{i}", vehicle_id=f"CAR{i}", start_date=start,
+        end_date=start + timedelta(days=3), daily_rate=35.0, rental_id=f"R{i}"
+    )
+
+
+ENTITIES: List[Tuple[type, Callable[[int], object]]] = [
+    (Car, build_car),
+    (Truck, build_truck),
+    (Motorcycle, build_motorcycle),
+    (Customer, build_customer),
+    (Rental, build_rental),
+]
+
+
+def slot_names(cls: type) -> List[str]:
+    """Retourne les attributs déclarés dans les __slots__ de la hiérarchie."""
+    names = []
+    for klass in reversed(cls.__mro__):
+        names.extend(getattr(klass, '__slots__', ()))
+    return names
+
+
+def measure(factory: Callable[[], object], count: int) -> Tuple[float, list]:
+    """
+    Mesure la mémoire allouée par count appels à factory.
+
+    Returns:
+        Tuple (octets par objet, objets créés)
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # Retirer la liste qui retient les objets
+    return (after - before - sys.getsizeof(objects)) / count, objects
+
+
+def benchmark_entity(cls: type, build: Callable[[int], object], count: int) -> Tuple[float, float, float]:
+    """
+    Mesure une classe du modèle.
+
+    Returns:
+        Tuple (octets par entité complète, octets par conteneur avec
+        __dict__, octets par conteneur avec __slots__)
+    """
+    numbers = iter(range(count))
+    full_size, entities = measure(lambda: build(next(numbers)), count)
+
+    # Même attributs, mêmes valeurs, stockés dans un __dict__
+    names = slot_names(cls)
+    dict_class = type(f"{cls.__name__}WithDict", (), {})
+    sources = iter(entities)
+
+    def copy_to_dict():
+        source = next(sources)
+        shadow = dict_class()
+        for name in names:
+            setattr(shadow, name, getattr(source, name))
+        return shadow
+
+    dict_size, _ = measure(copy_to_dict, count)
+    slots_size = sys.getsizeof(entities[0])
+    return full_size, dict_size, slots_size
+
+
+def main() -> int:
+    """Point d'entrée principal."""
+    parser = argparse.ArgumentParser(description="Empreinte mémoire des entités du modèle")
+    parser.add_argument("-n", "--count", type=int, default=100_000,
+                        help="Nombre d'instances par classe (défaut: 100000)")
+    args = parser.parse_args()
+
+    print("=" * 72)
+    print("[MEMOIRE] OCTETS PAR ENTITE")
+    print("=" * 72)
+    print(f"[PYTHON] Python: {sys.version.split()[0]} - {args.count} instances par classe")
+    print("-" * 72)
+    print(f"{'Classe':<12}{'Entité complète':>18}{'Avec __dict__':>16}{'Avec __slots__':>16}{'Gain':>10}")
+
+    for cls, build in ENTITIES:
+        full_size, dict_size, slots_size = benchmark_entity(cls, build, args.count)
+        saving = 1 - slots_size / dict_size if dict_size else 0
+        print(f"{cls.__name__:<12}{full_size:>18.0f}{dict_size:>16.0f}{slots_size:>16.0f}{saving:>10.0%}")
+
+    print("-" * 72)
+    print("Entité complète: instance et valeurs de ses attributs (__slots__).")
+    print("Avec __dict__ / __slots__: conteneur seul, valeurs partagées.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,12 +4,35 @@ Contient la classe centrale CarRentalSystem.
 """
 
 from datetime import date, datetime, timedelta
-from typing import Optional, List, Dict, Tuple
+from typing import Callable, Optional, List, Dict, Tuple
+import functools
+import heapq
+import threading
 from collections import defaultdict
 
 from models.vehicle import Vehicle, Car, Truck, Motorcycle, VehicleState, VehicleCategory
 from models.customer import Customer
 from models.rental import Rental, RentalStatus
+from models.indexes import (
+    VehicleBookingIndex, RentalIndex, RevenueAggregates, SearchIndex, MaintenanceQueue
+)
+from models.events import ChangeEvent, ChangeType, EventBus
+from models.eligibility import EligibilityService
+from models.columnar import RentalColumns
+
+
+def _mutation(method: Callable) -> Callable:
+    """
+    Exécute une opération de modification sous le verrou du système.
+    
+    Un calcul de rapports en arrière-plan prend le même verrou pour chaque
+    étape: il ne voit jamais les index ou collections en cours de mise à jour.
+    """
+    @functools.wraps(method)
+    def locked(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return locked
 
 
 class CarRentalSystem:
@@ -23,15 +46,117 @@ class CarRentalSystem:
     - Génération de rapports
     """
     
+    # Champs couverts par les index de recherche textuelle
+    VEHICLE_SEARCH_FIELDS = ("brand", "model", "license_plate")
+    CUSTOMER_SEARCH_FIELDS = ("first_name", "last_name", "email", "phone")
+    
     def __init__(self, agency_name: str = "AutoLoc"):
         self._agency_name = agency_name
         self._vehicles: Dict[str, Vehicle] = {}
         self._customers: Dict[str, Customer] = {}
         self._rentals: Dict[str, Rental] = {}
+        self._booking_index = VehicleBookingIndex()
+        self._rental_index = RentalIndex()
+        self._revenue = RevenueAggregates()
+        self._rental_columns = RentalColumns()
+        self._vehicle_search = SearchIndex(self.VEHICLE_SEARCH_FIELDS)
+        self._customer_search = SearchIndex(self.CUSTOMER_SEARCH_FIELDS)
+        self._maintenance_queue = MaintenanceQueue()
+        self._eligibility = EligibilityService()
         self._created_at = datetime.now()
+        
+        # Sérialise les modifications et les étapes des calculs en arrière-plan
+        self._lock = threading.RLock()
+        
+        # Compteur de génération: incrémenté à chaque modification
+        self._generation = 0
+        self._statistics_cache: Optional[Tuple[Tuple[int, date], Dict]] = None
+        
+        # Notifications de changement, livrées par lots aux abonnés
+        self._events = EventBus()
+    
+    @property
+    def generation(self) -> int:
+        """Numéro de génération des données (change à chaque modification)."""
+        return self._generation
+    
+    @property
+    def events(self) -> EventBus:
+        """Bus des événements de changement (voir models.events)."""
+        return self._events
+    
+    @_mutation
+    def mark_changed(self) -> None:
+        """
+        Signale une modification des données.
+        
+        Appelé par toutes les opérations du système; à appeler aussi après
+        une modification directe d'un véhicule ou d'un client (maintenance,
+        blocage...) pour invalider les rapports en cache. Publie un
+        événement DATA_CHANGED, faute de connaître l'entité modifiée.
+        """
+        # Un kilométrage a pu changer: resynchroniser la file d'entretien
+        for vehicle in self._vehicles.values():
+            self._maintenance_queue.update(vehicle)
+        self._notify(ChangeEvent(ChangeType.DATA_CHANGED))
+    
+    def _notify(self, *events: ChangeEvent) -> None:
+        """Enregistre une modification et publie ses événements en un lot."""
+        self._generation += 1
+        with self._events.batch():
+            for event in events:
+                self._events.publish(event)
+    
+    @_mutation
+    def restore_data(
+        self,
+        vehicles: Dict[str, Vehicle],
+        customers: Dict[str, Customer],
+        rentals: Dict[str, Rental]
+    ) -> None:
+        """
+        Remplace les données du système par des données chargées.
+        
+        Les index de réservations et de locations ainsi que les agrégats de
+        chiffre d'affaires sont reconstruits, afin que l'historique restauré
+        (locations terminées ou annulées) apparaisse dans les rapports.
+        
+        Args:
+            vehicles: Véhicules {id: vehicle}
+            customers: Clients {id: customer}
+            rentals: Locations {id: rental}
+        """
+        self._vehicles = dict(vehicles)
+        self._customers = dict(customers)
+        self._rentals = dict(rentals)
+        self._booking_index = VehicleBookingIndex()
+        self._rental_index = RentalIndex()
+        self._revenue = RevenueAggregates()
+        self._rental_columns = RentalColumns()
+        self._vehicle_search = SearchIndex(self.VEHICLE_SEARCH_FIELDS)
+        self._customer_search = SearchIndex(self.CUSTOMER_SEARCH_FIELDS)
+        self._maintenance_queue = MaintenanceQueue()
+        self._eligibility.invalidate()
+        
+        for vehicle in self._vehicles.values():
+            self._index_vehicle(vehicle)
+        for customer in self._customers.values():
+            self._index_customer(customer)
+        
+        for rental in self._rentals.values():
+            self._rental_index.add(rental)
+            self._rental_columns.add(rental)
+            if rental.status in (RentalStatus.RESERVED, RentalStatus.ACTIVE):
+                self._booking_index.add(rental)
+            elif rental.status == RentalStatus.COMPLETED:
+                vehicle = self._vehicles.get(rental.vehicle_id)
+                self._revenue.record(rental, vehicle.get_vehicle_type() if vehicle else None)
+        
+        self._notify(ChangeEvent(ChangeType.DATA_RESTORED))
     
     # === Gestion des véhicules ===
     
+    @_mutation
     def add_vehicle(self, vehicle: Vehicle) -> bool:
         """
         Ajoute un véhicule à la flotte.
@@ -45,8 +170,11 @@ class CarRentalSystem:
         if vehicle.id in self._vehicles:
             return False
         self._vehicles[vehicle.id] = vehicle
+        self._index_vehicle(vehicle)
+        self._notify(ChangeEvent(ChangeType.VEHICLE_ADDED, vehicle.id))
         return True
     
+    @_mutation
     def remove_vehicle(self, vehicle_id: str) -> bool:
         """
         Retire un véhicule de la flotte.
@@ -65,6 +193,9 @@ class CarRentalSystem:
             return False  # Ne peut pas retirer un véhicule loué
         
         del self._vehicles[vehicle_id]
+        self._vehicle_search.remove(vehicle_id)
+        self._maintenance_queue.remove(vehicle_id)
+        self._notify(ChangeEvent(ChangeType.VEHICLE_REMOVED, vehicle_id))
         return True
     
     def get_vehicle(self, vehicle_id: str) -> Optional[Vehicle]:
@@ -118,6 +249,29 @@ class CarRentalSystem:
         
         return available
     
+    def get_eligible_vehicles(
+        self,
+        customer_id: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> List[Vehicle]:
+        """
+        Retourne les véhicules disponibles que le client peut louer.
+        
+        Args:
+            customer_id: ID du client
+            start_date: Date de début souhaitée
+            end_date: Date de fin souhaitée
+            
+        Returns:
+            Liste des véhicules (vide si le client n'existe pas)
+        """
+        customer = self._customers.get(customer_id)
+        if not customer:
+            return []
+        available = self.get_available_vehicles(start_date=start_date, end_date=end_date)
+        return self._eligibility.filter_vehicles(customer, available)
+    
     def _is_vehicle_available_for_period(
         self,
         vehicle_id: str,
@@ -125,18 +279,60 @@ class CarRentalSystem:
         end_date: date
     ) -> bool:
         """Vérifie si un véhicule est disponible sur une période donnée."""
-        for rental in self._rentals.values():
-            if rental.vehicle_id != vehicle_id:
+        return self._booking_index.is_available(vehicle_id, start_date, end_date)
+    
+    def get_free_windows(
+        self,
+        start_date: date,
+        end_date: date,
+        min_days: int = 1,
+        vehicle_type: Optional[str] = None,
+        category: Optional[VehicleCategory] = None
+    ) -> Dict[str, List[Tuple[date, date]]]:
+        """
+        Retourne les créneaux libres de chaque véhicule sur un horizon.
+        
+        Remplace les appels répétés à get_available_vehicles pour chaque
+        période candidate: les réservations de chaque véhicule sont
+        parcourues une seule fois.
+        
+        Args:
+            start_date: Début de l'horizon (inclus)
+            end_date: Fin de l'horizon (incluse)
+            min_days: Durée minimale d'un créneau en jours
+            vehicle_type: Type de véhicule (Voiture, Camion, Moto)
+            category: Catégorie de véhicule
+        
+        Returns:
+            Dictionnaire {ID véhicule: [(début, fin), ...]} limité aux
+            véhicules ayant au moins un créneau
+        """
+        if end_date < start_date or min_days < 1:
+            return {}
+        
+        windows = {}
+        
+        for vehicle in self._vehicles.values():
+            # Un véhicule loué peut se libérer sur l'horizon, pas un véhicule
+            # en maintenance ou hors service
+            if vehicle.state not in (VehicleState.AVAILABLE, VehicleState.RENTED):
+                continue
+            
+            # Filtrer par type
+            if vehicle_type and vehicle.get_vehicle_type() != vehicle_type:
                 continue
             
-            if rental.status in [RentalStatus.CANCELLED, RentalStatus.COMPLETED]:
+            # Filtrer par catégorie
+            if category and vehicle.category != category:
                 continue
             
-            # Vérifier le chevauchement des dates
-            if not (end_date < rental.start_date or start_date > rental.end_date):
-                return False
+            free = self._booking_index.free_windows(
+                vehicle.id, start_date, end_date, min_days
+            )
+            if free:
+                windows[vehicle.id] = free
         
-        return True
+        return windows
     
     def search_vehicles(
         self,
@@ -155,15 +351,24 @@ class CarRentalSystem:
             min_year: Année minimum
             
         Returns:
-            Liste des véhicules correspondants
+            Liste des véhicules correspondants, les plus pertinents en
+            premier si une marque est donnée (accents et casse ignorés)
         """
+        candidates = self._vehicles.values()
+        
+        # Les critères textuels passent par l'index (accents et casse ignorés)
+        if brand:
+            candidates = [
+                self._vehicles[vid]
+                for vid in self._vehicle_search.search(brand, fields=("brand",))
+            ]
+        if model:
+            matching = set(self._vehicle_search.search(model, fields=("model",)))
+            candidates = [v for v in candidates if v.id in matching]
+        
         results = []
         
-        for vehicle in self._vehicles.values():
-            if brand and brand.lower() not in vehicle.brand.lower():
-                continue
-            if model and model.lower() not in vehicle.model.lower():
-                continue
+        for vehicle in candidates:
             if max_daily_rate and vehicle.daily_rate > max_daily_rate:
                 continue
             if min_year and vehicle.year < min_year:
@@ -173,8 +378,93 @@ class CarRentalSystem:
         
         return results
     
+    def find_vehicles(self, query: str, limit: Optional[int] = None) -> List[Vehicle]:
+        """
+        Recherche plein texte des véhicules (marque, modèle, immatriculation).
+        
+        Args:
+            query: Texte recherché; chaque mot doit apparaître dans un champ
+            limit: Nombre maximum de résultats
+            
+        Returns:
+            Véhicules correspondants, les plus pertinents en premier
+        """
+        return [self._vehicles[vid] for vid in self._vehicle_search.search(query, limit=limit)]
+    
+    @_mutation
+    def reindex_vehicle(self, vehicle_id: str) -> bool:
+        """
+        Met à jour l'index de recherche après une modification directe
+        d'un véhicule.
+        
+        Returns:
+            True si le véhicule existe
+        """
+        vehicle = self._vehicles.get(vehicle_id)
+        if not vehicle:
+            return False
+        self._index_vehicle(vehicle)
+        self._notify(ChangeEvent(ChangeType.VEHICLE_UPDATED, vehicle_id))
+        return True
+    
+    def _index_vehicle(self, vehicle: Vehicle) -> None:
+        """Indexe les champs de recherche et l'entretien d'un véhicule."""
+        self._vehicle_search.add(vehicle.id, {
+            "brand": vehicle.brand,
+            "model": vehicle.model,
+            "license_plate": vehicle.license_plate,
+        })
+        self._maintenance_queue.update(vehicle)
+    
+    @_mutation
+    def send_vehicle_to_maintenance(self, vehicle_id: str, description: str) -> bool:
+        """
+        Envoie un véhicule en maintenance.
+        
+        Returns:
+            True si le véhicule existe et n'est pas loué
+        """
+        vehicle = self._vehicles.get(vehicle_id)
+        if not vehicle or not vehicle.send_to_maintenance(description):
+            return False
+        self._notify(ChangeEvent(ChangeType.VEHICLE_UPDATED, vehicle_id))
+        return True
+    
+    @_mutation
+    def complete_vehicle_maintenance(self, vehicle_id: str, description: str, cost: float = 0.0) -> bool:
+        """
+        Termine la maintenance d'un véhicule.
+        
+        Returns:
+            True si le véhicule était en maintenance
+        """
+        vehicle = self._vehicles.get(vehicle_id)
+        if not vehicle or not vehicle.complete_maintenance(description, cost):
+            return False
+        self._maintenance_queue.update(vehicle)
+        self._notify(ChangeEvent(ChangeType.VEHICLE_UPDATED, vehicle_id))
+        return True
+    
+    def get_vehicles_due_for_maintenance(self, within_km: float = 0.0) -> List[Tuple[Vehicle, float]]:
+        """
+        Retourne les véhicules dont l'entretien est dû dans moins de within_km km.
+        
+        Args:
+            within_km: Marge en kilomètres (0: entretien déjà nécessaire)
+            
+        Returns:
+            Liste de tuples (véhicule, kilomètres restants), du plus urgent
+            au moins urgent
+        """
+        return [
+            (self._vehicles[vehicle_id], remaining)
+            for vehicle_id, remaining in self._maintenance_queue.due_within(within_km)
+            if vehicle_id in self._vehicles
+        ]
+    
     # === Gestion des clients ===
     
+    @_mutation
     def add_customer(self, customer: Customer) -> bool:
         """
         Ajoute un client.
@@ -188,8 +478,11 @@ class CarRentalSystem:
         if customer.id in self._customers:
             return False
         self._customers[customer.id] = customer
+        self._index_customer(customer)
+        self._notify(ChangeEvent(ChangeType.CUSTOMER_ADDED, customer.id))
         return True
     
+    @_mutation
     def remove_customer(self, customer_id: str) -> bool:
         """
         Retire un client.
@@ -208,6 +501,9 @@ class CarRentalSystem:
             return False  # Ne peut pas retirer un client avec des locations actives
         
         del self._customers[customer_id]
+        self._customer_search.remove(customer_id)
+        self._eligibility.invalidate(customer_id)
+        self._notify(ChangeEvent(ChangeType.CUSTOMER_REMOVED, customer_id))
         return True
     
     def get_customer(self, customer_id: str) -> Optional[Customer]:
@@ -231,31 +527,107 @@ class CarRentalSystem:
             email: Email recherché
             
         Returns:
-            Liste des clients correspondants
+            Liste des clients correspondants, les plus pertinents en
+            premier (accents et casse ignorés)
         """
-        results = []
+        ids: Optional[List[str]] = None
+        
+        if name:
+            ids = self._customer_search.search(name, fields=("first_name", "last_name"))
+        if email:
+            matching = self._customer_search.search(email, fields=("email",))
+            if ids is None:
+                ids = matching
+            else:
+                matching_set = set(matching)
+                ids = [cid for cid in ids if cid in matching_set]
+        
+        if ids is None:
+            return list(self._customers.values())
+        return [self._customers[cid] for cid in ids]
+    
+    def find_customers(self, query: str, limit: Optional[int] = None) -> List[Customer]:
+        """
+        Recherche plein texte des clients (nom, prénom, email, téléphone).
         
-        for customer in self._customers.values():
-            if name:
-                search_name = name.lower()
-                if (search_name not in customer.first_name.lower() and 
-                    search_name not in customer.last_name.lower()):
-                    continue
-            if email and email.lower() not in customer.email.lower():
-                continue
+        Args:
+            query: Texte recherché; chaque mot doit apparaître dans un champ
+            limit: Nombre maximum de résultats
+            
+        Returns:
+            Clients correspondants, les plus pertinents en premier
+        """
+        return [self._customers[cid] for cid in self._customer_search.search(query, limit=limit)]
+    
+    @_mutation
+    def reindex_customer(self, customer_id: str) -> bool:
+        """
+        Met à jour l'index de recherche après une modification directe
+        d'un client (nom, email, téléphone).
+        
+        Returns:
+            True si le client existe
+        """
+        customer = self._customers.get(customer_id)
+        if not customer:
+            return False
+        self._index_customer(customer)
+        self._notify(ChangeEvent(ChangeType.CUSTOMER_UPDATED, customer_id))
+        return True
+    
+    @_mutation
+    def block_customer(self, customer_id: str, reason: str) -> bool:
+        """
+        Bloque un client.
+        
+        Args:
+            customer_id: ID du client
+            reason: Raison du blocage
             
-            results.append(customer)
+        Returns:
+            True si le client existe
+        """
+        customer = self._customers.get(customer_id)
+        if not customer:
+            return False
+        customer.block(reason)
+        self._notify(ChangeEvent(ChangeType.CUSTOMER_BLOCKED, customer_id, reason=reason))
+        return True
+    
+    @_mutation
+    def unblock_customer(self, customer_id: str) -> bool:
+        """
+        Débloque un client.
         
-        return results
+        Returns:
+            True si le client existe
+        """
+        customer = self._customers.get(customer_id)
+        if not customer:
+            return False
+        customer.unblock()
+        self._notify(ChangeEvent(ChangeType.CUSTOMER_UNBLOCKED, customer_id))
+        return True
+    
+    def _index_customer(self, customer: Customer) -> None:
+        """Indexe les champs de recherche d'un client."""
+        self._customer_search.add(customer.id, {
+            "first_name": customer.first_name,
+            "last_name": customer.last_name,
+            "email": customer.email,
+            "phone": customer.phone,
+        })
     
     # === Gestion des locations ===
     
+    @_mutation
     def create_rental(
         self,
         customer_id: str,
         vehicle_id: str,
         start_date: date,
-        end_date: date
+        end_date: date,
+        notes: str = ""
     ) -> Tuple[Optional[Rental], str]:
         """
         Crée une nouvelle location.
@@ -265,6 +637,7 @@ class CarRentalSystem:
             vehicle_id: ID du véhicule
             start_date: Date de début
             end_date: Date de fin
+            notes: Remarques sur la location
             
         Returns:
             Tuple (Rental ou None, message d'erreur/succès)
@@ -280,10 +653,7 @@ class CarRentalSystem:
             return None, "Véhicule non trouvé"
         
         # Vérifier que le client peut louer ce véhicule
-        can_rent, reason = customer.can_rent_vehicle(
-            vehicle.get_required_license(),
-            vehicle.get_minimum_driver_age()
-        )
+        can_rent, reason = self._eligibility.can_rent(customer, vehicle)
         if not can_rent:
             return None, reason
         
@@ -308,18 +678,32 @@ class CarRentalSystem:
         discount = customer.get_loyalty_discount()
         if discount > 0:
             rental.apply_discount(discount)
+        if notes:
+            rental.notes = notes
         
         # Enregistrer la location
         self._rentals[rental.id] = rental
+        self._booking_index.add(rental)
+        self._rental_index.add(rental)
         customer.add_rental(rental.id)
         
         # Si la location commence aujourd'hui, marquer le véhicule comme loué
         if start_date == date.today():
             vehicle.rent()
             rental.start_rental()
+            self._rental_index.update_status(rental, RentalStatus.RESERVED)
+        self._rental_columns.add(rental)
+        
+        self._notify(
+            ChangeEvent(ChangeType.RENTAL_CREATED, rental.id,
+                        customer_id=customer_id, vehicle_id=vehicle_id),
+            ChangeEvent(ChangeType.CUSTOMER_UPDATED, customer_id),
+            ChangeEvent(ChangeType.VEHICLE_UPDATED, vehicle_id)
+        )
         
         return rental, f"Location créée avec succès (ID: {rental.id})"
     
+    @_mutation
     def start_rental(self, rental_id: str) -> Tuple[bool, str]:
         """
         Démarre une location réservée.
@@ -345,8 +729,15 @@ class CarRentalSystem:
             return False, "Impossible de louer le véhicule"
         
         rental.start_rental()
+        self._rental_index.update_status(rental, RentalStatus.RESERVED)
+        self._rental_columns.update(rental)
+        self._notify(
+            self._status_event(rental, RentalStatus.RESERVED),
+            ChangeEvent(ChangeType.VEHICLE_UPDATED, vehicle.id)
+        )
         return True, "Location démarrée"
     
+    @_mutation
     def complete_rental(
         self,
         rental_id: str,
@@ -377,20 +768,34 @@ class CarRentalSystem:
             return None, "Client non trouvé"
         
         return_date = return_date or date.today()
+        previous_status = rental.status
         
         try:
             total_cost = rental.complete_rental(return_date, end_mileage)
         except ValueError as e:
             return None, str(e)
         
+        self._booking_index.remove(rental)
+        self._rental_index.update_status(rental, previous_status)
+        self._rental_columns.update(rental)
+        self._revenue.record(rental, vehicle.get_vehicle_type())
+        
         # Retourner le véhicule
         vehicle.return_vehicle(end_mileage)
+        self._maintenance_queue.update(vehicle)
         
         # Mettre à jour le client
         customer.complete_rental(rental_id)
         
+        self._notify(
+            self._status_event(rental, previous_status),
+            ChangeEvent(ChangeType.VEHICLE_UPDATED, vehicle.id),
+            ChangeEvent(ChangeType.CUSTOMER_UPDATED, customer.id)
+        )
+        
         return total_cost, f"Location terminée. Coût total: {total_cost:.2f}€"
     
+    @_mutation
     def cancel_rental(self, rental_id: str) -> Tuple[Optional[float], str]:
         """
         Annule une location.
@@ -407,12 +812,17 @@ class CarRentalSystem:
         
         vehicle = self._vehicles.get(rental.vehicle_id)
         customer = self._customers.get(rental.customer_id)
+        previous_status = rental.status
         
         try:
             cancellation_fee = rental.cancel_rental()
         except ValueError as e:
             return None, str(e)
         
+        self._booking_index.remove(rental)
+        self._rental_index.update_status(rental, previous_status)
+        self._rental_columns.update(rental)
+        
         # Si le véhicule était loué, le libérer
         if vehicle and vehicle.state == VehicleState.RENTED:
             vehicle.return_vehicle()
@@ -421,10 +831,17 @@ class CarRentalSystem:
         if customer:
             customer.complete_rental(rental_id)
         
+        self._notify(
+            self._status_event(rental, previous_status),
+            ChangeEvent(ChangeType.VEHICLE_UPDATED, rental.vehicle_id),
+            ChangeEvent(ChangeType.CUSTOMER_UPDATED, rental.customer_id)
+        )
+        
         if cancellation_fee > 0:
             return cancellation_fee, f"Location annulée. Frais d'annulation: {cancellation_fee:.2f}€"
         return 0, "Location annulée sans frais"
     
+    @_mutation
     def extend_rental(
         self,
         rental_id: str,
@@ -452,10 +869,67 @@ class CarRentalSystem:
         ):
             return False, "Véhicule non disponible pour la période de prolongation"
         
+        # L'index lit la date de fin sur la location: pas de réindexation
         if rental.extend_rental(new_end_date):
+            self._rental_columns.update(rental)
+            self._notify(ChangeEvent(ChangeType.RENTAL_UPDATED, rental_id))
             return True, f"Location prolongée jusqu'au {new_end_date}"
         return False, "Impossible de prolonger la location"
     
+    @_mutation
+    def update_rental(
+        self,
+        rental_id: str,
+        end_date: Optional[date] = None,
+        notes: Optional[str] = None
+    ) -> Tuple[bool, str]:
+        """
+        Modifie la date de fin et/ou les remarques d'une location.
+        
+        Une date de fin plus tardive est soumise aux mêmes vérifications de
+        disponibilité qu'une prolongation; une date plus proche raccourcit
+        la location.
+        
+        Args:
+            rental_id: ID de la location
+            end_date: Nouvelle date de fin (None pour la conserver)
+            notes: Nouvelles remarques (None pour les conserver)
+            
+        Returns:
+            Tuple (succès, message)
+        """
+        rental = self._rentals.get(rental_id)
+        if not rental:
+            return False, "Location non trouvée"
+        
+        if end_date is not None and end_date != rental.end_date:
+            if rental.status not in (RentalStatus.RESERVED, RentalStatus.ACTIVE):
+                return False, "Seule une location réservée ou en cours peut être modifiée"
+            if end_date > rental.end_date and not self._is_vehicle_available_for_period(
+                rental.vehicle_id, rental.end_date + timedelta(days=1), end_date
+            ):
+                return False, "Véhicule non disponible pour la période de prolongation"
+            try:
+                rental.end_date = end_date
+            except ValueError as e:
+                return False, str(e)
+            # L'index des réservations lit la date de fin sur la location
+            self._rental_columns.update(rental)
+        
+        if notes is not None:
+            rental.notes = notes
+        
+        self._notify(ChangeEvent(ChangeType.RENTAL_UPDATED, rental_id))
+        return True, "Location modifiée"
+    
+    @staticmethod
+    def _status_event(rental: Rental, old_status: RentalStatus) -> ChangeEvent:
+        """Événement de changement de statut d'une location."""
+        return ChangeEvent(
+            ChangeType.RENTAL_STATUS_CHANGED, rental.id,
+            old_status=old_status, new_status=rental.status
+        )
+    
     def get_rental(self, rental_id: str) -> Optional[Rental]:
         """Récupère une location par son ID."""
         return self._rentals.get(rental_id)
@@ -464,28 +938,137 @@ class CarRentalSystem:
         """Retourne la liste de toutes les locations."""
         return list(self._rentals.values())
     
+    def get_rentals_by_status(self, status: RentalStatus) -> List[Rental]:
+        """Retourne les locations ayant un statut donné."""
+        return [self._rentals[rental_id]
+                for rental_id in self._rental_index.status_rental_ids(status)]
+    
+    def count_rentals_by_status(self, status: RentalStatus) -> int:
+        """Retourne le nombre de locations ayant un statut donné."""
+        return self._rental_index.count_by_status(status)
+    
     def get_active_rentals(self) -> List[Rental]:
         """Retourne les locations en cours."""
-        return [r for r in self._rentals.values() 
-                if r.status == RentalStatus.ACTIVE]
+        return self.get_rentals_by_status(RentalStatus.ACTIVE)
     
     def get_overdue_rentals(self) -> List[Rental]:
         """Retourne les locations en retard."""
-        return [r for r in self._rentals.values() 
-                if r.is_overdue()]
+        # Seules les locations actives peuvent être en retard
+        return [r for r in self.get_active_rentals() if r.is_overdue()]
     
     def get_customer_rentals(self, customer_id: str) -> List[Rental]:
         """Retourne les locations d'un client."""
-        return [r for r in self._rentals.values() 
-                if r.customer_id == customer_id]
+        return [self._rentals[rental_id]
+                for rental_id in self._rental_index.customer_rental_ids(customer_id)]
     
     def get_vehicle_rentals(self, vehicle_id: str) -> List[Rental]:
         """Retourne les locations d'un véhicule."""
-        return [r for r in self._rentals.values() 
-                if r.vehicle_id == vehicle_id]
+        return [self._rentals[rental_id]
+                for rental_id in self._rental_index.vehicle_rental_ids(vehicle_id)]
+    
+    # === Classements ===
+    
+    def get_top_customers(self, limit: int = 10, by_revenue: bool = False) -> List[Tuple[Customer, float]]:
+        """
+        Retourne les meilleurs clients.
+        
+        Les compteurs sont tenus à jour par les index: le classement coûte
+        O(n log limit), sans tri complet. À égalité, l'ordre d'ajout est
+        conservé.
+        
+        Args:
+            limit: Nombre de clients retournés
+            by_revenue: Classer par chiffre d'affaires plutôt que par
+                nombre de locations
+            
+        Returns:
+            Liste de tuples (client, nombre de locations ou chiffre d'affaires)
+        """
+        if by_revenue:
+            score = self._revenue.customer_revenue
+        else:
+            score = self._rental_index.count_by_customer
+        top = heapq.nlargest(limit, list(self._customers), key=score)
+        return [(self._customers[customer_id], score(customer_id)) for customer_id in top]
+    
+    def get_top_vehicles(self, limit: int = 10, by_revenue: bool = False) -> List[Tuple[Vehicle, float]]:
+        """
+        Retourne les véhicules les plus loués.
+        
+        Args:
+            limit: Nombre de véhicules retournés
+            by_revenue: Classer par chiffre d'affaires plutôt que par
+                nombre de locations
+            
+        Returns:
+            Liste de tuples (véhicule, nombre de locations ou chiffre d'affaires)
+        """
+        if by_revenue:
+            score = self._revenue.vehicle_revenue
+        else:
+            score = self._rental_index.count_by_vehicle
+        top = heapq.nlargest(limit, list(self._vehicles), key=score)
+        return [(self._vehicles[vehicle_id], score(vehicle_id)) for vehicle_id in top]
+    
+    # === Occupation de la flotte ===
+    
+    def get_vehicle_booked_days(self, start_date: date, end_date: date) -> Dict[str, int]:
+        """
+        Retourne le nombre de jours loués de chaque véhicule sur une période.
+        
+        Calculé sur le stockage en colonnes des locations (vectorisé si
+        NumPy est installé); les véhicules non loués sont omis.
+        
+        Args:
+            start_date: Premier jour de la période
+            end_date: Dernier jour de la période (inclus)
+            
+        Returns:
+            Dictionnaire {vehicle_id: jours loués}
+        """
+        return self._rental_columns.booked_days(start_date, end_date)
+    
+    def get_occupancy_rate(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> float:
+        """
+        Calcule le taux d'occupation de la flotte sur une période.
+        
+        Parcourt les colonnes de toutes les locations: ce calcul est tenu à
+        l'écart du rapport de chiffre d'affaires, qui ne lit que des cumuls.
+        
+        Args:
+            start_date: Premier jour de la période (début du mois par défaut)
+            end_date: Dernier jour de la période (aujourd'hui par défaut)
+            
+        Returns:
+            Pourcentage des jours-véhicules de la période couverts par une
+            location (réservée, en cours ou terminée)
+        """
+        start_date, end_date = self._report_period(start_date, end_date)
+        period_days = (end_date - start_date).days + 1
+        if period_days <= 0 or not self._vehicles:
+            return 0
+        # Les véhicules retirés de la flotte ne comptent pas
+        booked_days = sum(
+            days for vehicle_id, days in self.get_vehicle_booked_days(start_date, end_date).items()
+            if vehicle_id in self._vehicles
+        )
+        return booked_days / (len(self._vehicles) * period_days) * 100
     
     # === Rapports ===
     
+    @staticmethod
+    def _report_period(
+        start_date: Optional[date],
+        end_date: Optional[date]
+    ) -> Tuple[date, date]:
+        """Complète une période de rapport: par défaut, le mois en cours."""
+        today = date.today()
+        return start_date or date(today.year, today.month, 1), end_date or today
+    
     def generate_available_vehicles_report(self) -> Dict:
         """
         Génère un rapport des véhicules disponibles.
@@ -558,37 +1141,12 @@ class CarRentalSystem:
         Returns:
             Dictionnaire contenant le rapport
         """
-        # Par défaut, le mois en cours
-        if not start_date:
-            today = date.today()
-            start_date = date(today.year, today.month, 1)
-        if not end_date:
-            end_date = date.today()
-        
-        completed_rentals = [
-            r for r in self._rentals.values()
-            if r.status == RentalStatus.COMPLETED
-            and r.actual_return_date
-            and start_date <= r.actual_return_date <= end_date
-        ]
-        
-        total_revenue = sum(r.total_cost for r in completed_rentals)
-        total_penalties = sum(r.penalty for r in completed_rentals)
-        total_base = sum(r.calculate_base_cost() for r in completed_rentals)
-        
-        # Revenus par type de véhicule
-        revenue_by_type = defaultdict(float)
-        for rental in completed_rentals:
-            vehicle = self._vehicles.get(rental.vehicle_id)
-            if vehicle:
-                revenue_by_type[vehicle.get_vehicle_type()] += rental.total_cost
+        start_date, end_date = self._report_period(start_date, end_date)
         
-        # Revenus par mois
-        revenue_by_month = defaultdict(float)
-        for rental in completed_rentals:
-            if rental.actual_return_date:
-                month_key = rental.actual_return_date.strftime("%Y-%m")
-                revenue_by_month[month_key] += rental.total_cost
+        # Cumuls maintenus à chaque clôture de location
+        totals = self._revenue.summarize(start_date, end_date)
+        total_revenue = totals['total_revenue']
+        completed_count = totals['total_rentals_completed']
         
         return {
             'report_type': 'Chiffre d\'affaires',
@@ -598,21 +1156,35 @@ class CarRentalSystem:
                 'end': end_date.isoformat()
             },
             'total_revenue': total_revenue,
-            'total_base_revenue': total_base,
-            'total_penalties': total_penalties,
-            'total_rentals_completed': len(completed_rentals),
-            'average_rental_value': total_revenue / len(completed_rentals) if completed_rentals else 0,
-            'revenue_by_vehicle_type': dict(revenue_by_type),
-            'revenue_by_month': dict(revenue_by_month)
+            'total_base_revenue': totals['total_base_revenue'],
+            'total_penalties': totals['total_penalties'],
+            'total_rentals_completed': completed_count,
+            'average_rental_value': total_revenue / completed_count if completed_count else 0,
+            'revenue_by_vehicle_type': totals['revenue_by_vehicle_type'],
+            'revenue_by_month': totals['revenue_by_month']
         }
     
     def generate_statistics_report(self) -> Dict:
         """
         Génère un rapport de statistiques générales.
         
+        Le rapport est mis en cache tant que les données (numéro de
+        génération) et la date du jour ne changent pas. Le dictionnaire
+        retourné est partagé: ne pas le modifier.
+        
         Returns:
             Dictionnaire contenant le rapport
         """
+        cache_key = (self._generation, date.today())
+        if self._statistics_cache and self._statistics_cache[0] == cache_key:
+            return self._statistics_cache[1]
+        
+        report = self._build_statistics_report()
+        self._statistics_cache = (cache_key, report)
+        return report
+    
+    def _build_statistics_report(self) -> Dict:
+        """Calcule le rapport de statistiques en un seul passage par collection."""
         total_vehicles = len(self._vehicles)
         total_customers = len(self._customers)
         total_rentals = len(self._rentals)
@@ -620,35 +1192,38 @@ class CarRentalSystem:
         # Statistiques des véhicules
         vehicles_by_state = defaultdict(int)
         vehicles_by_type = defaultdict(int)
-        vehicles_needing_maintenance = 0
+        vehicles_needing_maintenance = len(self._maintenance_queue.due_within(0))
         
         for vehicle in self._vehicles.values():
             vehicles_by_state[vehicle.state.value] += 1
             vehicles_by_type[vehicle.get_vehicle_type()] += 1
-            if vehicle.needs_maintenance():
-                vehicles_needing_maintenance += 1
         
-        # Statistiques des locations
-        rentals_by_status = defaultdict(int)
-        for rental in self._rentals.values():
-            rentals_by_status[rental.status.value] += 1
+        # Statistiques des locations (compteurs de l'index)
+        rentals_by_status = {}
+        for status in RentalStatus:
+            count = self._rental_index.count_by_status(status)
+            if count:
+                rentals_by_status[status.value] = count
         
         # Statistiques des clients
-        loyal_customers = sum(1 for c in self._customers.values() if c.is_loyal_customer())
-        blocked_customers = sum(1 for c in self._customers.values() if c.is_blocked)
+        loyal_customers = 0
+        blocked_customers = 0
+        for customer in self._customers.values():
+            if customer.is_loyal_customer():
+                loyal_customers += 1
+            if customer.is_blocked:
+                blocked_customers += 1
         
         # Calcul du taux d'utilisation
-        active_rentals = len(self.get_active_rentals())
+        active_rentals = self._rental_index.count_by_status(RentalStatus.ACTIVE)
         utilization_rate = (active_rentals / total_vehicles * 100) if total_vehicles > 0 else 0
         
         # Véhicule le plus loué
-        vehicle_rental_counts = defaultdict(int)
-        for rental in self._rentals.values():
-            vehicle_rental_counts[rental.vehicle_id] += 1
-        
         most_rented_vehicle = None
-        if vehicle_rental_counts:
-            most_rented_id = max(vehicle_rental_counts, key=lambda k: vehicle_rental_counts[k])
+        most_rented_count = 0
+        most_rented = self._rental_index.most_rented_vehicle()
+        if most_rented:
+            most_rented_id, most_rented_count = most_rented
             most_rented_vehicle = self._vehicles.get(most_rented_id)
         
         return {
@@ -669,16 +1244,68 @@ class CarRentalSystem:
             },
             'rentals': {
                 'total_rentals': total_rentals,
-                'by_status': dict(rentals_by_status),
+                'by_status': rentals_by_status,
                 'active_rentals': active_rentals,
                 'overdue_rentals': len(self.get_overdue_rentals())
             },
             'highlights': {
                 'most_rented_vehicle': str(most_rented_vehicle) if most_rented_vehicle else None,
-                'most_rented_count': max(vehicle_rental_counts.values()) if vehicle_rental_counts else 0
+                'most_rented_count': most_rented_count
             }
         }
     
+    # Nombre de clients retenus dans le classement d'un instantané
+    SNAPSHOT_TOP_CUSTOMERS = 10
+    
+    def generate_report_snapshot(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None
+    ) -> Optional[Dict]:
+        """
+        Calcule en une fois l'ensemble des rapports de la page des rapports.
+        
+        Chaque rapport n'est calculé qu'une fois et partagé par toutes les
+        sections. Le calcul peut s'exécuter hors du thread de l'interface:
+        chaque étape s'exécute sous le verrou du système, les modifications
+        attendent donc la fin de l'étape en cours.
+        
+        Args:
+            start_date: Date de début de la période analysée
+            end_date: Date de fin de la période analysée
+            progress: Appelée avec (étapes terminées, nombre d'étapes)
+            is_cancelled: Consultée entre deux étapes pour abandonner le calcul
+            
+        Returns:
+            Dictionnaire des rapports, ou None si le calcul a été annulé
+        """
+        steps = [
+            ('statistics', self.generate_statistics_report),
+            ('revenue', self.generate_revenue_report),
+            ('period_revenue', lambda: self.generate_revenue_report(start_date, end_date)),
+            ('occupancy', lambda: self.get_occupancy_rate(start_date, end_date)),
+            ('availability', self.generate_available_vehicles_report),
+            ('top_customers', lambda: self.get_top_customers(self.SNAPSHOT_TOP_CUSTOMERS)),
+            ('maintenance', lambda: [
+                vehicle for vehicle, _ in self.get_vehicles_due_for_maintenance()
+            ]),
+        ]
+        
+        snapshot = {'generation': self._generation, 'period': (start_date, end_date)}
+        for done, (name, compute) in enumerate(steps):
+            if is_cancelled and is_cancelled():
+                return None
+            if progress:
+                progress(done, len(steps))
+            with self._lock:
+                snapshot[name] = compute()
+        
+        if progress:
+            progress(len(steps), len(steps))
+        return snapshot
+    
     def print_report(self, report: Dict) -> str:
         """
         Formate un rapport pour l'affichage.
@@ -717,6 +1344,7 @@ class CarRentalSystem:
     
     # === Utilitaires ===
     
+    @_mutation
     def check_and_update_rentals(self) -> None:
         """
         Vérifie et met à jour le statut des locations.
@@ -724,13 +1352,21 @@ class CarRentalSystem:
         """
         today = date.today()
         
-        for rental in self._rentals.values():
-            # Démarrer les locations qui commencent aujourd'hui
-            if rental.status == RentalStatus.RESERVED and rental.start_date <= today:
-                vehicle = self._vehicles.get(rental.vehicle_id)
-                if vehicle and vehicle.is_available():
-                    vehicle.rent()
-                    rental.start_rental()
+        # Un seul lot d'événements pour toutes les locations démarrées
+        with self._events.batch():
+            for rental in self.get_rentals_by_status(RentalStatus.RESERVED):
+                # Démarrer les locations qui commencent aujourd'hui
+                if rental.start_date <= today:
+                    vehicle = self._vehicles.get(rental.vehicle_id)
+                    if vehicle and vehicle.is_available():
+                        vehicle.rent()
+                        rental.start_rental()
+                        self._rental_index.update_status(rental, RentalStatus.RESERVED)
+                        self._rental_columns.update(rental)
+                        self._notify(
+                            self._status_event(rental, RentalStatus.RESERVED),
+                            ChangeEvent(ChangeType.VEHICLE_UPDATED, vehicle.id)
+                        )
     
     def get_summary(self) -> Dict:
         """Retourne un résumé rapide de l'état du système."""
@@ -739,6 +1375,6 @@ class CarRentalSystem:
             'total_vehicles': len(self._vehicles),
             'available_vehicles': len(self.get_available_vehicles()),
             'total_customers': len(self._customers),
-            'active_rentals': len(self.get_active_rentals()),
+            'active_rentals': self.count_rentals_by_status(RentalStatus.ACTIVE),
             'overdue_rentals': len(self.get_overdue_rentals())
         }
@@ -0,0 +1,175 @@
+"""
+Exécution différée et en arrière-plan des requêtes de filtrage.
+
+Chaque frappe dans un champ de recherche relance un minuteur: seule la
+dernière requête est exécutée, sur un thread du QThreadPool. Les requêtes
+devenues obsolètes sont retirées de la file si elles n'ont pas démarré,
+et leur résultat est ignoré sinon.
+"""
+
+import logging
+from typing import Any, Callable, Dict, Optional
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+
+class _QuerySignals(QObject):
+    """Signaux d'une requête (un QRunnable ne peut pas émettre lui-même)."""
+    
+    finished = pyqtSignal(int, object)
+    failed = pyqtSignal(int, str)
+
+
+class _QueryRunnable(QRunnable):
+    """Exécute une requête sur un thread du pool."""
+    
+    def __init__(self, generation: int, query: Callable[[Callable[[], bool]], Any],
+                 is_stale: Callable[[], bool]):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = _QuerySignals()
+        self._generation = generation
+        self._query = query
+        self._is_stale = is_stale
+    
+    def run(self):
+        if self._is_stale():
+            self.signals.finished.emit(self._generation, None)
+            return
+        try:
+            result = self._query(self._is_stale)
+        except Exception as e:
+            self.signals.failed.emit(self._generation, str(e))
+            return
+        self.signals.finished.emit(self._generation, result)
+
+
+class DebouncedQuery(QObject):
+    """
+    Requête différée exécutée en arrière-plan.
+    
+    submit() remplace la requête en attente et relance le minuteur; à son
+    expiration, la requête part sur le pool de threads. result_ready n'est
+    émis que pour la requête la plus récente.
+    
+    Une requête reçoit une fonction is_stale qu'elle peut consulter pour
+    abandonner un calcul long dès qu'une requête plus récente existe.
+    query_failed est émis si la requête la plus récente lève une exception.
+    """
+    
+    result_ready = pyqtSignal(object)
+    query_failed = pyqtSignal(str)
+    
+    DEFAULT_DELAY_MS = 200
+    
+    def __init__(self, delay_ms: int = DEFAULT_DELAY_MS, pool: Optional[QThreadPool] = None, parent=None):
+        super().__init__(parent)
+        self._pool = pool or QThreadPool.globalInstance()
+        self._generation = 0
+        self._pending: Optional[Callable[[Callable[[], bool]], Any]] = None
+        # Requêtes confiées au pool, conservées jusqu'à leur fin d'exécution
+        self._running: Dict[int, _QueryRunnable] = {}
+        
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self._start)
+    
+    @property
+    def generation(self) -> int:
+        """Numéro de la requête la plus récente."""
+        return self._generation
+    
+    @property
+    def busy(self) -> bool:
+        """Indique si la requête la plus récente est en attente ou en cours."""
+        return self._timer.isActive() or self._generation in self._running
+    
+    def submit(self, query: Callable[[Callable[[], bool]], Any]) -> None:
+        """
+        Planifie une requête, qui remplace toute requête précédente.
+        
+        Args:
+            query: Fonction exécutée sur un thread du pool; elle reçoit
+                is_stale et retourne le résultat transmis à result_ready
+        """
+        self._generation += 1
+        self._pending = query
+        self._timer.start()
+    
+    def cancel(self) -> None:
+        """Abandonne la requête en attente ou en cours."""
+        self._generation += 1
+        self._pending = None
+        self._timer.stop()
+        self._withdraw_running()
+    
+    def _withdraw_running(self) -> None:
+        """Retire du pool les requêtes précédentes qui n'ont pas démarré."""
+        for generation, runnable in list(self._running.items()):
+            if self._pool.tryTake(runnable):
+                del self._running[generation]
+    
+    def _start(self) -> None:
+        """Envoie la requête en attente sur le pool de threads."""
+        query, self._pending = self._pending, None
+        if query is None:
+            return
+        
+        self._withdraw_running()
+        generation = self._generation
+        runnable = _QueryRunnable(
+            generation, self._bind(generation, query), lambda: generation != self._generation
+        )
+        runnable.signals.finished.connect(self._on_finished)
+        runnable.signals.failed.connect(self._on_failed)
+        self._running[generation] = runnable
+        self._pool.start(runnable)
+    
+    def _bind(self, generation: int, query: Callable) -> Callable[[Callable[[], bool]], Any]:
+        """Adapte une requête soumise à la signature attendue par le runnable."""
+        return query
+    
+    def _on_finished(self, generation: int, result: Any) -> None:
+        """Transmet le résultat s'il correspond à la requête la plus récente."""
+        self._running.pop(generation, None)
+        if generation == self._generation:
+            self.result_ready.emit(result)
+    
+    def _on_failed(self, generation: int, message: str) -> None:
+        """Journalise l'échec de la requête la plus récente."""
+        self._running.pop(generation, None)
+        if generation == self._generation:
+            logger.warning(f"Échec de la requête: {message}")
+            self.query_failed.emit(message)
+
+
+class BackgroundTask(DebouncedQuery):
+    """
+    Calcul long exécuté en arrière-plan, avec avancement et annulation.
+    
+    La tâche soumise reçoit is_stale et une fonction report_progress(done,
+    total); progress n'est émis que pour la tâche la plus récente. Soumettre
+    une nouvelle tâche ou appeler cancel() abandonne la précédente.
+    """
+    
+    progress = pyqtSignal(int, int)
+    
+    # Relais interne: l'avancement est émis depuis le thread du pool
+    _progress_reported = pyqtSignal(int, int, int)
+    
+    def __init__(self, delay_ms: int = 0, pool: Optional[QThreadPool] = None, parent=None):
+        super().__init__(delay_ms, pool, parent)
+        self._progress_reported.connect(self._on_progress)
+    
+    def _bind(self, generation: int, task: Callable) -> Callable[[Callable[[], bool]], Any]:
+        def report_progress(done: int, total: int) -> None:
+            self._progress_reported.emit(generation, done, total)
+        return lambda is_stale: task(is_stale, report_progress)
+    
+    def _on_progress(self, generation: int, done: int, total: int) -> None:
+        """Relaie l'avancement de la tâche la plus récente."""
+        if generation == self._generation:
+            self.progress.emit(done, total)
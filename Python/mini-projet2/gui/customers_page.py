@@ -3,19 +3,25 @@ Page de gestion des clients.
 """
 
 from datetime import date
-from typing import Optional
+from typing import List, Optional
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QFrame, QPushButton, QTableWidget, QTableWidgetItem,
+    QLabel, QFrame, QPushButton, QTableView,
     QHeaderView, QDialog, QFormLayout, QLineEdit,
     QCheckBox, QMessageBox, QDateEdit,
     QGroupBox, QScrollArea
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QDate
+from PyQt6.QtCore import QDate
 
 from car_rental_system import CarRentalSystem
 from models.customer import Customer
-from gui.icons import get_icon, create_action_button
+from models.events import ChangeEvent, ChangeType
+from gui.icons import get_icon
+from gui.async_query import DebouncedQuery
+from gui.table_models import (
+    CustomerTableModel, ObjectFilterProxyModel, StatusBadgeDelegate,
+    ActionButtonsDelegate, CUSTOMER_STATUS_BADGES, ACTION_BUTTONS
+)
 
 
 class CustomerDialog(QDialog):
@@ -254,8 +260,6 @@ class CustomerDialog(QDialog):
 class CustomersPage(QWidget):
     """Page de gestion des clients."""
     
-    data_changed = pyqtSignal()
-    
     def __init__(self, system: CarRentalSystem):
         super().__init__()
         self.system = system
@@ -321,12 +325,21 @@ class CustomersPage(QWidget):
         layout.addLayout(search_layout)
         
         # Tableau des clients
-        self.table = QTableWidget()
-        self.table.setColumnCount(9)
-        self.table.setHorizontalHeaderLabels([
-            "ID", "Nom complet", "Âge", "Email", "Téléphone", 
-            "Permis", "Locations", "Statut", "Actions"
-        ])
+        # Modèle/vue: seules les lignes visibles sont rendues et le filtrage
+        # est fait par un proxy (différé, en arrière-plan), sans reconstruire
+        # le tableau
+        self.table = QTableView()
+        self.model = CustomerTableModel(self.system)
+        self.proxy = ObjectFilterProxyModel(self, DebouncedQuery(parent=self))
+        self.proxy.setSourceModel(self.model)
+        self.table.setModel(self.proxy)
+        
+        self.status_delegate = StatusBadgeDelegate(CUSTOMER_STATUS_BADGES, self.table)
+        self.table.setItemDelegateForColumn(CustomerTableModel.STATUS_COLUMN, self.status_delegate)
+        
+        self.actions_delegate = ActionButtonsDelegate(ACTION_BUTTONS, size=28, spacing=6, parent=self.table)
+        self.actions_delegate.action_triggered.connect(self.on_action_triggered)
+        self.table.setItemDelegateForColumn(CustomerTableModel.ACTIONS_COLUMN, self.actions_delegate)
         
         # Configuration du tableau
         header = self.table.horizontalHeader()
@@ -350,7 +363,7 @@ class CustomersPage(QWidget):
         self.table.setColumnWidth(7, 100)  # Statut
         self.table.setColumnWidth(8, 120)  # Actions
         
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.table.setAlternatingRowColors(True)
         v_header = self.table.verticalHeader()
         if v_header:
@@ -362,116 +375,44 @@ class CustomersPage(QWidget):
     
     def refresh_data(self):
         """Rafraîchit les données du tableau."""
-        self.all_customers = self.system.get_all_customers()
+        self.model.set_objects(self.system.get_all_customers())
         self.apply_filter()
     
+    def apply_events(self, events: List[ChangeEvent]) -> bool:
+        """
+        Met à jour les seules lignes concernées par des changements.
+        
+        Returns:
+            True si la page est à jour
+        """
+        updated = []
+        for event in events:
+            if event.change_type in (ChangeType.DATA_RESTORED, ChangeType.DATA_CHANGED):
+                self.refresh_data()
+                return True
+            if event.change_type == ChangeType.CUSTOMER_ADDED:
+                customer = self.system.get_customer(event.entity_id)
+                if customer:
+                    self.model.add_object(customer)
+            elif event.change_type == ChangeType.CUSTOMER_REMOVED:
+                self.model.remove_object(event.entity_id)
+            elif event.change_type in (
+                ChangeType.CUSTOMER_UPDATED, ChangeType.CUSTOMER_BLOCKED, ChangeType.CUSTOMER_UNBLOCKED
+            ):
+                updated.append(event.entity_id)
+        self.model.update_objects(updated)
+        return True
+    
     def apply_filter(self):
-        """Applique le filtre de recherche."""
-        customers = self.all_customers
-        
-        search = self.search_edit.text().lower()
-        if search:
-            customers = [c for c in customers 
-                        if search in c.first_name.lower()
-                        or search in c.last_name.lower()
-                        or search in c.email.lower()
-                        or search in c.phone]
-        
-        self.display_customers(customers)
+        """Applique le filtre de recherche via le proxy."""
+        self.proxy.set_filter(self.search_edit.text())
     
-    def display_customers(self, customers: list):
-        """Affiche les clients dans le tableau."""
-        self.table.setRowCount(len(customers))
-        
-        for row, customer in enumerate(customers):
-            self.table.setItem(row, 0, QTableWidgetItem(customer.id))
-            self.table.setItem(row, 1, QTableWidgetItem(customer.full_name))
-            self.table.setItem(row, 2, QTableWidgetItem(f"{customer.age} ans"))
-            self.table.setItem(row, 3, QTableWidgetItem(customer.email))
-            self.table.setItem(row, 4, QTableWidgetItem(customer.phone))
-            self.table.setItem(row, 5, QTableWidgetItem(", ".join(sorted(customer.license_types))))
-            self.table.setItem(row, 6, QTableWidgetItem(str(customer.get_total_rentals())))
-            
-            # Statut avec badge
-            status_widget = QWidget()
-            status_layout = QHBoxLayout(status_widget)
-            status_layout.setContentsMargins(2, 2, 2, 2)
-            status_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            status_label = QLabel()
-            if customer.is_blocked:
-                status_label.setText("Bloqué")
-                status_label.setStyleSheet("""
-                    QLabel {
-                        background-color: #fef2f2;
-                        color: #dc2626;
-                        padding: 2px 8px;
-                        border-radius: 10px;
-                        font-weight: 600;
-                        font-size: 11px;
-                        border: 1px solid #fecaca;
-                    }
-                """)
-            elif customer.is_loyal_customer():
-                status_label.setText("Fidèle")
-                status_label.setStyleSheet("""
-                    QLabel {
-                        background-color: #f0fdf4;
-                        color: #16a34a;
-                        padding: 2px 8px;
-                        border-radius: 10px;
-                        font-weight: 600;
-                        font-size: 11px;
-                        border: 1px solid #bbf7d0;
-                    }
-                """)
-            else:
-                status_label.setText("Actif")
-                status_label.setStyleSheet("""
-                    QLabel {
-                        background-color: #eff6ff;
-                        color: #2563eb;
-                        padding: 2px 8px;
-                        border-radius: 10px;
-                        font-weight: 600;
-                        font-size: 11px;
-                        border: 1px solid #bfdbfe;
-                    }
-                """)
-            status_layout.addWidget(status_label)
-            self.table.setCellWidget(row, 7, status_widget)
-            
-            # Boutons d'action
-            actions_widget = QWidget()
-            actions_layout = QHBoxLayout(actions_widget)
-            actions_layout.setContentsMargins(4, 0, 4, 0)
-            actions_layout.setSpacing(6)
-            actions_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            edit_btn = create_action_button(
-                "edit", "Modifier",
-                icon_color="#3b82f6",
-                bg_color="#eff6ff",
-                hover_color="#dbeafe",
-                border_color="#bfdbfe",
-                size=28
-            )
-            edit_btn.clicked.connect(lambda checked, c=customer: self.edit_customer(c))
-            
-            delete_btn = create_action_button(
-                "delete", "Supprimer",
-                icon_color="#ef4444",
-                bg_color="#fef2f2",
-                hover_color="#fee2e2",
-                border_color="#fecaca",
-                size=28
-            )
-            delete_btn.clicked.connect(lambda checked, c=customer: self.delete_customer(c))
-            
-            actions_layout.addWidget(edit_btn)
-            actions_layout.addWidget(delete_btn)
-            
-            self.table.setCellWidget(row, 8, actions_widget)
+    def on_action_triggered(self, action: str, customer: Customer):
+        """Exécute l'action cliquée sur une ligne du tableau."""
+        if action == "edit":
+            self.edit_customer(customer)
+        elif action == "delete":
+            self.delete_customer(customer)
     
     def add_customer(self):
         """Ouvre le dialogue pour ajouter un client."""
@@ -479,8 +420,6 @@ class CustomersPage(QWidget):
         if dialog.exec() == QDialog.DialogCode.Accepted:
             customer = dialog.get_customer()
             if self.system.add_customer(customer):
-                self.refresh_data()
-                self.data_changed.emit()
                 QMessageBox.information(self, "Succès", "Client ajouté avec succès!")
             else:
                 QMessageBox.warning(self, "Erreur", "Impossible d'ajouter le client.")
@@ -495,7 +434,6 @@ class CustomersPage(QWidget):
             old_blocked = customer.is_blocked
             old_blocked_reason = customer.blocked_reason
             
-            self.system.remove_customer(customer.id)
             new_customer = dialog.get_customer()
             # Restaurer l'état via la méthode publique
             new_customer.restore_state(
@@ -505,9 +443,9 @@ class CustomersPage(QWidget):
                 blocked_reason=old_blocked_reason
             )
             
-            self.system.add_customer(new_customer)
-            self.refresh_data()
-            self.data_changed.emit()
+            with self.system.events.batch():
+                self.system.remove_customer(customer.id)
+                self.system.add_customer(new_customer)
             QMessageBox.information(self, "Succès", "Client modifié avec succès!")
     
     def delete_customer(self, customer: Customer):
@@ -520,8 +458,6 @@ class CustomersPage(QWidget):
         
         if reply == QMessageBox.StandardButton.Yes:
             if self.system.remove_customer(customer.id):
-                self.refresh_data()
-                self.data_changed.emit()
                 QMessageBox.information(self, "Succès", "Client supprimé!")
             else:
                 QMessageBox.warning(
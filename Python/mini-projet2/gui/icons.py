@@ -8,6 +8,8 @@ from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor, QFont
 from PyQt6.QtCore import Qt, QSize, QRect
 from PyQt6.QtSvg import QSvgRenderer
 from io import BytesIO
+from collections import OrderedDict
+from typing import Dict, Iterable, Tuple
 
 
 # Icônes SVG personnalisées (Material Design style)
@@ -170,14 +172,38 @@ SVG_ICONS = {
 }
 
 
-def create_icon_from_svg(svg_content: str, color: str = "#ffffff", size: int = 24) -> QIcon:
+# Cache LRU des icônes: (nom, couleur, taille, ratio de pixels) -> QIcon
+ICON_CACHE_SIZE = 512
+_icon_cache: "OrderedDict[Tuple[str, str, int, float], QIcon]" = OrderedDict()
+_icon_cache_stats = {"hits": 0, "misses": 0}
+
+# Icônes (nom, couleur, taille) de la première page affichée, préchargées
+# par prewarm_icons: barre latérale (inactive et active) et tableau de bord
+SIDEBAR_ICONS = ("dashboard", "car", "customers", "rental", "reports")
+PREWARM_ICONS = (
+    *((name, "#94a3b8", 20) for name in SIDEBAR_ICONS),
+    *((name, "#ffffff", 20) for name in SIDEBAR_ICONS),
+    ("car", "#1e293b", 20),
+    ("chart", "#1e293b", 20),
+)
+
+
+def create_icon_from_svg(
+    svg_content: str,
+    color: str = "#ffffff",
+    size: int = 24,
+    device_pixel_ratio: float = 1.0
+) -> QIcon:
     """Crée une QIcon à partir d'un contenu SVG."""
     # Remplacer la couleur
     svg_data = svg_content.format(color=color).encode('utf-8')
     
+    # Taille réelle en pixels de l'écran
+    pixel_size = max(1, round(size * device_pixel_ratio))
+    
     # Utiliser une résolution plus élevée pour un meilleur rendu
     scale = 2  # Facteur d'échelle pour la qualité
-    render_size = size * scale
+    render_size = pixel_size * scale
     
     # Créer le pixmap avec une résolution plus élevée
     pixmap = QPixmap(render_size, render_size)
@@ -194,19 +220,75 @@ def create_icon_from_svg(svg_content: str, color: str = "#ffffff", size: int = 2
     
     # Redimensionner pour la taille finale avec une bonne qualité
     final_pixmap = pixmap.scaled(
-        size, size,
+        pixel_size, pixel_size,
         Qt.AspectRatioMode.KeepAspectRatio,
         Qt.TransformationMode.SmoothTransformation
     )
+    final_pixmap.setDevicePixelRatio(device_pixel_ratio)
     
     return QIcon(final_pixmap)
 
 
+def _device_pixel_ratio() -> float:
+    """Ratio de pixels de l'écran de l'application (1.0 sans application)."""
+    app = QApplication.instance()
+    return app.devicePixelRatio() if app else 1.0
+
+
 def get_icon(name: str, color: str = "#ffffff", size: int = 24) -> QIcon:
-    """Récupère une icône par son nom."""
-    if name in SVG_ICONS:
-        return create_icon_from_svg(SVG_ICONS[name], color, size)
-    return QIcon()
+    """
+    Récupère une icône par son nom.
+    
+    Les icônes sont mémorisées dans un cache LRU: le rendu SVG n'a lieu
+    qu'au premier appel pour une combinaison (nom, couleur, taille, ratio).
+    """
+    if name not in SVG_ICONS:
+        return QIcon()
+    
+    key = (name, color, size, _device_pixel_ratio())
+    icon = _icon_cache.get(key)
+    if icon is not None:
+        _icon_cache.move_to_end(key)
+        _icon_cache_stats["hits"] += 1
+        return icon
+    
+    _icon_cache_stats["misses"] += 1
+    icon = create_icon_from_svg(SVG_ICONS[name], color, size, key[3])
+    _icon_cache[key] = icon
+    if len(_icon_cache) > ICON_CACHE_SIZE:
+        _icon_cache.popitem(last=False)
+    return icon
+
+
+def prewarm_icons(icons: Iterable[Tuple[str, str, int]] = PREWARM_ICONS) -> int:
+    """
+    Précharge les icônes données dans le cache.
+    
+    À appeler une fois la fenêtre affichée (par exemple via
+    QTimer.singleShot), pour ne pas retarder le démarrage.
+    
+    Args:
+        icons: Triplets (nom, couleur, taille) à précharger
+    
+    Returns:
+        Nombre d'icônes rendues
+    """
+    rendered = _icon_cache_stats["misses"]
+    for name, color, size in icons:
+        get_icon(name, color, size)
+    return _icon_cache_stats["misses"] - rendered
+
+
+def get_icon_cache_stats() -> Dict[str, int]:
+    """Retourne les compteurs du cache d'icônes (succès, échecs, taille)."""
+    return {**_icon_cache_stats, "size": len(_icon_cache)}
+
+
+def clear_icon_cache() -> None:
+    """Vide le cache d'icônes et remet les compteurs à zéro."""
+    _icon_cache.clear()
+    _icon_cache_stats["hits"] = 0
+    _icon_cache_stats["misses"] = 0
 
 
 def create_colored_icon(icon_name: str, color: str, size: int = 32) -> QIcon:
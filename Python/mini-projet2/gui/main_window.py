@@ -7,7 +7,7 @@ from PyQt6.QtWidgets import (
     QStackedWidget, QPushButton, QLabel, QFrame,
     QMessageBox, QApplication, QSplitter
 )
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, QTimer
 from PyQt6.QtGui import QIcon, QFont, QAction, QPixmap
 
 from car_rental_system import CarRentalSystem
@@ -21,7 +21,7 @@ from gui.vehicles_page import VehiclesPage
 from gui.customers_page import CustomersPage
 from gui.rentals_page import RentalsPage
 from gui.reports_page import ReportsPage
-from gui.icons import get_icon, ICON_COLORS
+from gui.icons import get_icon, prewarm_icons, ICON_COLORS
 
 
 class SidebarButton(QPushButton):
@@ -49,6 +49,15 @@ class SidebarButton(QPushButton):
 class MainWindow(QMainWindow):
     """Fenêtre principale de l'application."""
     
+    # Pages dans l'ordre de la navigation: (attribut, classe)
+    PAGES = [
+        ("dashboard_page", DashboardPage),
+        ("vehicles_page", VehiclesPage),
+        ("customers_page", CustomersPage),
+        ("rentals_page", RentalsPage),
+        ("reports_page", ReportsPage),
+    ]
+    
     def __init__(self):
         super().__init__()
         
@@ -61,8 +70,15 @@ class MainWindow(QMainWindow):
         # Configurer l'interface
         self.setup_ui()
         
+        # Les changements sont livrés par lots au prochain tour de boucle
+        self.system.events.set_scheduler(lambda flush: QTimer.singleShot(0, flush))
+        self.system.events.subscribe(self.on_system_events)
+        
         # Appliquer le style
         self.setStyleSheet(get_full_stylesheet())
+        
+        # Précharger les icônes une fois la fenêtre affichée, hors démarrage
+        QTimer.singleShot(0, prewarm_icons)
     
     def setup_ui(self):
         """Configure l'interface principale."""
@@ -184,27 +200,19 @@ class MainWindow(QMainWindow):
         content_layout = QVBoxLayout(content_frame)
         content_layout.setContentsMargins(0, 0, 0, 0)
         
-        # Stack pour les pages
+        # Stack pour les pages: chaque page est construite à sa première
+        # ouverture, un widget vide occupe sa place jusque-là
         self.stack = QStackedWidget()
         
-        # Créer les pages
-        self.dashboard_page = DashboardPage(self.system)
-        self.vehicles_page = VehiclesPage(self.system)
-        self.customers_page = CustomersPage(self.system)
-        self.rentals_page = RentalsPage(self.system)
-        self.reports_page = ReportsPage(self.system)
-        
-        # Connecter les signaux de mise à jour
-        self.vehicles_page.data_changed.connect(self.refresh_all)
-        self.customers_page.data_changed.connect(self.refresh_all)
-        self.rentals_page.data_changed.connect(self.refresh_all)
-        
-        # Ajouter les pages au stack
-        self.stack.addWidget(self.dashboard_page)
-        self.stack.addWidget(self.vehicles_page)
-        self.stack.addWidget(self.customers_page)
-        self.stack.addWidget(self.rentals_page)
-        self.stack.addWidget(self.reports_page)
+        # Version des données affichées par chaque page construite, et
+        # version atteinte par les derniers événements reçus
+        self._page_versions = {}
+        self._last_seen_version = self.data_version()
+        for attribute, _ in self.PAGES:
+            setattr(self, attribute, None)
+            self.stack.addWidget(QWidget())
+        
+        self.ensure_page(0)
         
         content_layout.addWidget(self.stack)
         
@@ -223,30 +231,78 @@ class MainWindow(QMainWindow):
             status_bar.showMessage("Prêt")
             status_bar.setStyleSheet("background-color: #ffffff; border-top: 1px solid #e2e8f0;")
     
+    def data_version(self):
+        """Version des données: change à chaque modification ou changement de jour."""
+        return self.system.generation, date.today()
+    
+    def ensure_page(self, index: int) -> QWidget:
+        """
+        Retourne la page d'un index, en la construisant si nécessaire.
+        
+        La construction remplace le widget vide réservé dans le stack; la
+        page se rafraîchit dans son constructeur.
+        """
+        attribute, page_class = self.PAGES[index]
+        page = getattr(self, attribute)
+        if page is not None:
+            return page
+        
+        # Livrer les événements en attente avant de construire la page
+        self.system.events.flush()
+        page = page_class(self.system)
+        
+        placeholder = self.stack.widget(index)
+        is_current = self.stack.currentIndex() == index
+        self.stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self.stack.insertWidget(index, page)
+        if is_current:
+            self.stack.setCurrentIndex(index)
+        
+        setattr(self, attribute, page)
+        self._page_versions[index] = self.data_version()
+        return page
+    
+    def is_page_stale(self, index: int) -> bool:
+        """Indique si une page construite affiche des données périmées."""
+        return self._page_versions.get(index) != self.data_version()
+    
+    def refresh_page_if_stale(self, index: int):
+        """Rafraîchit une page seulement si ses données sont périmées."""
+        page = getattr(self, self.PAGES[index][0])
+        if page is not None and self.is_page_stale(index):
+            self.system.events.flush()
+            page.refresh_data()
+            self._page_versions[index] = self.data_version()
+    
     def switch_page(self, index: int):
         """Change la page affichée."""
+        self.ensure_page(index)
         self.stack.setCurrentIndex(index)
         
         # Mettre à jour les boutons avec les icônes
         for i, btn in enumerate(self.nav_buttons):
             btn.set_active(i == index)
         
-        # Rafraîchir la page si nécessaire
-        if index == 0:
-            self.dashboard_page.refresh_data()
-        elif index == 1:
-            self.vehicles_page.refresh_data()
-        elif index == 2:
-            self.customers_page.refresh_data()
-        elif index == 3:
-            self.rentals_page.refresh_data()
-        elif index == 4:
-            self.reports_page.refresh_data()
+        # Rafraîchir la page si les données ont changé depuis son affichage
+        self.refresh_page_if_stale(index)
     
-    def refresh_all(self):
-        """Rafraîchit toutes les pages."""
-        self.dashboard_page.refresh_data()
-        # Les autres pages se rafraîchissent à l'ouverture
+    def on_system_events(self, events):
+        """
+        Applique un lot de changements aux pages construites.
+        
+        Seules les pages à jour avant ce lot peuvent être corrigées ligne
+        par ligne (apply_events); les autres restent périmées et seront
+        rafraîchies à leur prochaine ouverture.
+        """
+        version = self.data_version()
+        for index, (attribute, _) in enumerate(self.PAGES):
+            page = getattr(self, attribute)
+            if page is None or self._page_versions.get(index) != self._last_seen_version:
+                continue
+            if hasattr(page, "apply_events") and page.apply_events(events):
+                self._page_versions[index] = version
+        self._last_seen_version = version
     
     def load_demo_data(self):
         """Charge des données de démonstration."""
@@ -3,19 +3,26 @@ Page de gestion des locations et réservations.
 """
 
 from datetime import date
+from typing import List, Optional, Tuple
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QFrame, QPushButton, QTableWidget, QTableWidgetItem,
+    QLabel, QFrame, QPushButton, QTableView,
     QHeaderView, QDialog, QFormLayout, QComboBox,
     QDoubleSpinBox, QCheckBox, QMessageBox, QDateEdit,
     QGroupBox, QTextEdit, QScrollArea,
     QDialogButtonBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QDate
+from PyQt6.QtCore import QDate
 
 from car_rental_system import CarRentalSystem
 from models.rental import Rental, RentalStatus
-from gui.icons import get_icon, create_action_button
+from models.events import ChangeEvent, ChangeType
+from gui.icons import get_icon
+from gui.async_query import DebouncedQuery
+from gui.table_models import (
+    RentalTableModel, StatusBadgeDelegate, ActionButtonsDelegate,
+    RENTAL_STATUS_BADGES, ACTION_BUTTONS
+)
 
 
 class NewRentalDialog(QDialog):
@@ -201,8 +208,7 @@ class NewRentalDialog(QDialog):
             self.vehicle_combo.addItem("-- Sélectionner d'abord un client --", None)
             return
         
-        customer = self.system.get_customer(customer_id)
-        if not customer:
+        if not self.system.get_customer(customer_id):
             return
         
         start_qdate = self.start_date_edit.date()
@@ -210,22 +216,16 @@ class NewRentalDialog(QDialog):
         start = date(start_qdate.year(), start_qdate.month(), start_qdate.day())
         end = date(end_qdate.year(), end_qdate.month(), end_qdate.day())
         
-        available = self.system.get_available_vehicles(start_date=start, end_date=end)
+        # Véhicules disponibles que le client peut louer (éligibilité en cache)
+        eligible = self.system.get_eligible_vehicles(customer_id, start, end)
         
         self.vehicle_combo.addItem("-- Sélectionner un véhicule --", None)
         
-        for vehicle in available:
-            # Vérifier si le client peut louer ce véhicule
-            can_rent, reason = customer.can_rent_vehicle(
-                vehicle.get_required_license(),
-                vehicle.get_minimum_driver_age()
+        for vehicle in eligible:
+            self.vehicle_combo.addItem(
+                f"{vehicle.get_vehicle_type()} - {vehicle.brand} {vehicle.model} ({vehicle.daily_rate:.2f}€/jour)",
+                vehicle.id
             )
-            
-            if can_rent:
-                self.vehicle_combo.addItem(
-                    f"{vehicle.get_vehicle_type()} - {vehicle.brand} {vehicle.model} ({vehicle.daily_rate:.2f}€/jour)",
-                    vehicle.id
-                )
         
         if self.vehicle_combo.count() == 1:
             self.vehicle_combo.clear()
@@ -285,10 +285,11 @@ class NewRentalDialog(QDialog):
         start = date(start_qdate.year(), start_qdate.month(), start_qdate.day())
         end = date(end_qdate.year(), end_qdate.month(), end_qdate.day())
         
-        rental, message = self.system.create_rental(customer_id, vehicle_id, start, end)
+        rental, message = self.system.create_rental(
+            customer_id, vehicle_id, start, end, self.notes_edit.toPlainText()
+        )
         
         if rental:
-            rental.notes = self.notes_edit.toPlainText()
             self.rental = rental
             self.accept()
         else:
@@ -389,16 +390,12 @@ class EditRentalDialog(QDialog):
         end_qdate = self.end_date_edit.date()
         new_end = date(end_qdate.year(), end_qdate.month(), end_qdate.day())
         
-        if new_end != self.rental.end_date:
-            if new_end > self.rental.end_date:
-                success = self.rental.extend_rental(new_end)
-                if not success:
-                    QMessageBox.warning(self, "Erreur", "Impossible de prolonger cette location.")
-                    return
-            else:
-                self.rental.end_date = new_end
-        
-        self.rental.notes = self.notes_edit.toPlainText()
+        success, message = self.system.update_rental(
+            self.rental.id, new_end, self.notes_edit.toPlainText()
+        )
+        if not success:
+            QMessageBox.warning(self, "Erreur", message)
+            return
         self.accept()
 
 
@@ -663,7 +660,12 @@ class CompleteRentalDialog(QDialog):
 class RentalsPage(QWidget):
     """Page de gestion des locations."""
     
-    data_changed = pyqtSignal()
+    # Changements qui modifient les listes des filtres client/véhicule
+    FILTER_CHANGES = {
+        ChangeType.VEHICLE_ADDED, ChangeType.VEHICLE_REMOVED,
+        ChangeType.CUSTOMER_ADDED, ChangeType.CUSTOMER_REMOVED,
+        ChangeType.DATA_RESTORED, ChangeType.DATA_CHANGED,
+    }
     
     def __init__(self, system: CarRentalSystem):
         super().__init__()
@@ -778,12 +780,22 @@ class RentalsPage(QWidget):
         layout.addWidget(filter_frame)
         
         # Tableau des locations
-        self.table = QTableWidget()
-        self.table.setColumnCount(10)
-        self.table.setHorizontalHeaderLabels([
-            "ID", "Client", "Véhicule", "Début", "Fin", 
-            "Statut", "Coût", "Jours restants", "Notes", "Actions"
-        ])
+        # Modèle/vue: seules les lignes visibles sont rendues, les badges et
+        # boutons sont dessinés par des délégués
+        self.table = QTableView()
+        self.model = RentalTableModel(self.system, self)
+        self.table.setModel(self.model)
+        
+        # Filtrage différé en arrière-plan: seul le dernier résultat est affiché
+        self.rental_query = DebouncedQuery(parent=self)
+        self.rental_query.result_ready.connect(self.display_rentals)
+        
+        self.status_delegate = StatusBadgeDelegate(RENTAL_STATUS_BADGES, self.table)
+        self.table.setItemDelegateForColumn(RentalTableModel.STATUS_COLUMN, self.status_delegate)
+        
+        self.actions_delegate = ActionButtonsDelegate(ACTION_BUTTONS, parent=self.table)
+        self.actions_delegate.action_triggered.connect(self.on_action_triggered)
+        self.table.setItemDelegateForColumn(RentalTableModel.ACTIONS_COLUMN, self.actions_delegate)
         
         header = self.table.horizontalHeader()
         if header:
@@ -808,7 +820,7 @@ class RentalsPage(QWidget):
         self.table.setColumnWidth(8, 50)   # Notes
         self.table.setColumnWidth(9, 180)  # Actions
         
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.table.setAlternatingRowColors(True)
         v_header = self.table.verticalHeader()
         if v_header:
@@ -870,6 +882,35 @@ class RentalsPage(QWidget):
         self.update_stats()
         self.apply_filters()
     
+    def apply_events(self, events: List[ChangeEvent]) -> bool:
+        """
+        Met à jour la page à partir des changements du système.
+        
+        Une modification de location ne rafraîchit que sa ligne; une
+        création ou un changement de statut relance le filtrage, qui peut
+        faire entrer ou sortir des lignes.
+        
+        Returns:
+            True si la page est à jour
+        """
+        types = {event.change_type for event in events}
+        if types & self.FILTER_CHANGES:
+            self.refresh_data()
+            return True
+        if not types & {ChangeType.RENTAL_CREATED, ChangeType.RENTAL_STATUS_CHANGED,
+                        ChangeType.RENTAL_UPDATED}:
+            return True
+        
+        self.update_stats()
+        if types & {ChangeType.RENTAL_CREATED, ChangeType.RENTAL_STATUS_CHANGED}:
+            self.apply_filters()
+        else:
+            self.model.update_objects(
+                event.entity_id for event in events
+                if event.change_type == ChangeType.RENTAL_UPDATED
+            )
+        return True
+    
     def update_filters(self):
         """Met à jour les listes des filtres."""
         # Sauvegarder les sélections
@@ -902,12 +943,10 @@ class RentalsPage(QWidget):
     
     def update_stats(self):
         """Met à jour les statistiques."""
-        rentals = self.system.get_all_rentals()
-        
-        active = len([r for r in rentals if r.status == RentalStatus.ACTIVE])
-        reserved = len([r for r in rentals if r.status == RentalStatus.RESERVED])
-        overdue = len([r for r in rentals if r.is_overdue()])
-        completed = len([r for r in rentals if r.status == RentalStatus.COMPLETED])
+        active = self.system.count_rentals_by_status(RentalStatus.ACTIVE)
+        reserved = self.system.count_rentals_by_status(RentalStatus.RESERVED)
+        overdue = len(self.system.get_overdue_rentals())
+        completed = self.system.count_rentals_by_status(RentalStatus.COMPLETED)
         
         self.update_stat_card(self.stat_active, str(active))
         self.update_stat_card(self.stat_reserved, str(reserved))
@@ -915,234 +954,100 @@ class RentalsPage(QWidget):
         self.update_stat_card(self.stat_completed, str(completed))
     
     def apply_filters(self):
-        """Applique les filtres et affiche les résultats."""
-        rentals = self.system.get_all_rentals()
+        """Planifie le filtrage, exécuté en arrière-plan après un court délai."""
+        status_filter = self.status_filter.currentData()
+        customer_filter = self.customer_filter.currentData()
+        vehicle_filter = self.vehicle_filter.currentData()
+        overdue_only = self.overdue_only.isChecked()
         
+        # Lecture du système sur le thread de l'interface: la requête ne
+        # manipule que cette copie
+        rows = self.collect_rentals(status_filter, customer_filter, vehicle_filter, overdue_only)
+        self.rental_query.submit(lambda is_stale: self.filter_rentals(
+            rows, status_filter, customer_filter, vehicle_filter
+        ))
+    
+    def collect_rentals(
+        self,
+        status_filter: Optional[RentalStatus],
+        customer_filter: Optional[str],
+        vehicle_filter: Optional[str],
+        overdue_only: bool
+    ) -> List[Tuple[Rental, RentalStatus, str, str, date]]:
+        """
+        Relève les locations candidates et les champs utilisés par le filtre.
+        
+        Returns:
+            Liste de tuples (location, statut, client, véhicule, date de début)
+        """
+        # Partir de l'index le plus sélectif disponible
+        if overdue_only:
+            rentals = self.system.get_overdue_rentals()
+        elif customer_filter:
+            rentals = self.system.get_customer_rentals(customer_filter)
+        elif vehicle_filter:
+            rentals = self.system.get_vehicle_rentals(vehicle_filter)
+        elif status_filter:
+            rentals = self.system.get_rentals_by_status(status_filter)
+        else:
+            rentals = self.system.get_all_rentals()
+        
+        return [(r, r.status, r.customer_id, r.vehicle_id, r.start_date) for r in rentals]
+    
+    @staticmethod
+    def filter_rentals(
+        rows: List[Tuple[Rental, RentalStatus, str, str, date]],
+        status_filter: Optional[RentalStatus],
+        customer_filter: Optional[str],
+        vehicle_filter: Optional[str]
+    ) -> List[Rental]:
+        """
+        Retourne les locations filtrées et triées pour l'affichage.
+        
+        Ne lit que les tuples relevés par collect_rentals: peut s'exécuter
+        sur un thread du pool.
+        """
         # Filtre par statut
-        status_filter = self.status_filter.currentData()
         if status_filter:
-            rentals = [r for r in rentals if r.status == status_filter]
+            rows = [row for row in rows if row[1] == status_filter]
         
         # Filtre par client
-        customer_filter = self.customer_filter.currentData()
         if customer_filter:
-            rentals = [r for r in rentals if r.customer_id == customer_filter]
+            rows = [row for row in rows if row[2] == customer_filter]
         
         # Filtre par véhicule
-        vehicle_filter = self.vehicle_filter.currentData()
         if vehicle_filter:
-            rentals = [r for r in rentals if r.vehicle_id == vehicle_filter]
-        
-        # Filtre en retard
-        if self.overdue_only.isChecked():
-            rentals = [r for r in rentals if r.is_overdue()]
+            rows = [row for row in rows if row[3] == vehicle_filter]
         
         # Tri: actives et réservées d'abord, puis par date
-        rentals.sort(key=lambda r: (
-            0 if r.status == RentalStatus.ACTIVE else (1 if r.status == RentalStatus.RESERVED else 2),
-            r.start_date
+        rows = sorted(rows, key=lambda row: (
+            0 if row[1] == RentalStatus.ACTIVE else (1 if row[1] == RentalStatus.RESERVED else 2),
+            row[4]
         ))
         
-        self.display_rentals(rentals)
+        return [row[0] for row in rows]
     
     def display_rentals(self, rentals: list):
         """Affiche les locations dans le tableau."""
-        self.table.setRowCount(len(rentals))
-        
-        for row, rental in enumerate(rentals):
-            customer = self.system.get_customer(rental.customer_id)
-            vehicle = self.system.get_vehicle(rental.vehicle_id)
-            
-            # ID
-            id_item = QTableWidgetItem(rental.id)
-            id_item.setData(Qt.ItemDataRole.UserRole, rental)
-            self.table.setItem(row, 0, id_item)
-            
-            # Client
-            self.table.setItem(row, 1, QTableWidgetItem(customer.full_name if customer else "Inconnu"))
-            
-            # Véhicule
-            self.table.setItem(row, 2, QTableWidgetItem(f"{vehicle.brand} {vehicle.model}" if vehicle else "Inconnu"))
-            
-            # Dates
-            self.table.setItem(row, 3, QTableWidgetItem(str(rental.start_date)))
-            self.table.setItem(row, 4, QTableWidgetItem(str(rental.end_date)))
-            
-            # Statut avec badge
-            status_widget = QWidget()
-            status_layout = QHBoxLayout(status_widget)
-            status_layout.setContentsMargins(2, 2, 2, 2)
-            status_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            status_label = QLabel(rental.status.value)
-            if rental.status == RentalStatus.ACTIVE:
-                status_label.setStyleSheet("""
-                    QLabel {
-                        background-color: #f0fdf4;
-                        color: #16a34a;
-                        padding: 2px 8px;
-                        border-radius: 10px;
-                        font-weight: 600;
-                        font-size: 11px;
-                        border: 1px solid #bbf7d0;
-                    }
-                """)
-            elif rental.status == RentalStatus.RESERVED:
-                status_label.setStyleSheet("""
-                    QLabel {
-                        background-color: #eff6ff;
-                        color: #2563eb;
-                        padding: 2px 8px;
-                        border-radius: 10px;
-                        font-weight: 600;
-                        font-size: 11px;
-                        border: 1px solid #bfdbfe;
-                    }
-                """)
-            elif rental.status == RentalStatus.COMPLETED:
-                status_label.setStyleSheet("""
-                    QLabel {
-                        background-color: #f1f5f9;
-                        color: #64748b;
-                        padding: 2px 8px;
-                        border-radius: 10px;
-                        font-weight: 600;
-                        font-size: 11px;
-                        border: 1px solid #e2e8f0;
-                    }
-                """)
-            else:
-                status_label.setStyleSheet("""
-                    QLabel {
-                        background-color: #fef2f2;
-                        color: #dc2626;
-                        padding: 2px 8px;
-                        border-radius: 10px;
-                        font-weight: 600;
-                        font-size: 11px;
-                        border: 1px solid #fecaca;
-                    }
-                """)
-            status_layout.addWidget(status_label)
-            self.table.setCellWidget(row, 5, status_widget)
-            
-            # Coût
-            self.table.setItem(row, 6, QTableWidgetItem(f"{rental.total_cost:.2f}€"))
-            
-            # Jours restants / Retard
-            if rental.status == RentalStatus.ACTIVE:
-                if rental.is_overdue():
-                    late_item = QTableWidgetItem(f"-{abs(rental.days_remaining())} j")
-                    late_item.setForeground(Qt.GlobalColor.red)
-                else:
-                    late_item = QTableWidgetItem(f"{rental.days_remaining()} j")
-                    late_item.setForeground(Qt.GlobalColor.darkGreen)
-            elif rental.status == RentalStatus.RESERVED:
-                days_until = (rental.start_date - date.today()).days
-                late_item = QTableWidgetItem(f"dans {days_until} j")
-                late_item.setForeground(Qt.GlobalColor.darkBlue)
-            else:
-                late_item = QTableWidgetItem("-")
-            self.table.setItem(row, 7, late_item)
-            
-            # Notes
-            notes_item = QTableWidgetItem("" if rental.notes else "")
-            if rental.notes:
-                notes_item.setIcon(get_icon("documents", "#64748b", 16))
-            notes_item.setToolTip(rental.notes if rental.notes else "Pas de notes")
-            self.table.setItem(row, 8, notes_item)
-            
-            # Actions
-            actions_widget = QWidget()
-            actions_layout = QHBoxLayout(actions_widget)
-            actions_layout.setContentsMargins(4, 0, 4, 0)
-            actions_layout.setSpacing(4)
-            actions_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            # Bouton details
-            detail_btn = create_action_button(
-                "eye", "Voir les détails",
-                icon_color="#64748b",
-                bg_color="#f1f5f9",
-                hover_color="#e2e8f0",
-                border_color="#e2e8f0",
-                size=26
-            )
-            detail_btn.clicked.connect(lambda checked, r=rental: self.show_rental_details_for(r))
-            actions_layout.addWidget(detail_btn)
-            
-            if rental.status == RentalStatus.RESERVED:
-                # Demarrer
-                start_btn = create_action_button(
-                    "play", "Démarrer la location",
-                    icon_color="#ffffff",
-                    bg_color="#22c55e",
-                    hover_color="#16a34a",
-                    border_color="#16a34a",
-                    size=26
-                )
-                start_btn.clicked.connect(lambda checked, r=rental: self.start_rental(r))
-                actions_layout.addWidget(start_btn)
-                
-                # Modifier
-                edit_btn = create_action_button(
-                    "edit", "Modifier",
-                    icon_color="#3b82f6",
-                    bg_color="#eff6ff",
-                    hover_color="#dbeafe",
-                    border_color="#bfdbfe",
-                    size=26
-                )
-                edit_btn.clicked.connect(lambda checked, r=rental: self.edit_rental(r))
-                actions_layout.addWidget(edit_btn)
-            
-            if rental.status == RentalStatus.ACTIVE:
-                # Terminer
-                complete_btn = create_action_button(
-                    "check", "Terminer la location",
-                    icon_color="#ffffff",
-                    bg_color="#22c55e",
-                    hover_color="#16a34a",
-                    border_color="#16a34a",
-                    size=26
-                )
-                complete_btn.clicked.connect(lambda checked, r=rental: self.complete_rental(r))
-                actions_layout.addWidget(complete_btn)
-                
-                # Prolonger
-                extend_btn = create_action_button(
-                    "calendar", "Prolonger",
-                    icon_color="#8b5cf6",
-                    bg_color="#f5f3ff",
-                    hover_color="#ede9fe",
-                    border_color="#ddd6fe",
-                    size=26
-                )
-                extend_btn.clicked.connect(lambda checked, r=rental: self.edit_rental(r))
-                actions_layout.addWidget(extend_btn)
-            
-            if rental.status in [RentalStatus.ACTIVE, RentalStatus.RESERVED]:
-                # Annuler
-                cancel_btn = create_action_button(
-                    "cancel", "Annuler",
-                    icon_color="#ffffff",
-                    bg_color="#ef4444",
-                    hover_color="#dc2626",
-                    border_color="#dc2626",
-                    size=26
-                )
-                cancel_btn.clicked.connect(lambda checked, r=rental: self.cancel_rental(r))
-                actions_layout.addWidget(cancel_btn)
-            
-            self.table.setCellWidget(row, 9, actions_widget)
+        self.model.set_rentals(rentals)
+    
+    def on_action_triggered(self, action: str, rental: Rental):
+        """Exécute l'action cliquée sur une ligne du tableau."""
+        handlers = {
+            "details": self.show_rental_details_for,
+            "start": self.start_rental,
+            "edit": self.edit_rental,
+            "complete": self.complete_rental,
+            "extend": self.edit_rental,
+            "cancel": self.cancel_rental,
+        }
+        handlers[action](rental)
     
     def show_rental_details(self, index):
         """Affiche les détails d'une location (double-clic)."""
-        item = self.table.item(index.row(), 0)
-        if item:
-            rental = item.data(Qt.ItemDataRole.UserRole)
-            if rental:
-                self.show_rental_details_for(rental)
+        rental = self.model.rental_at(index.row())
+        if rental:
+            self.show_rental_details_for(rental)
     
     def show_rental_details_for(self, rental: Rental):
         """Affiche le dialogue des détails."""
@@ -1161,8 +1066,6 @@ class RentalsPage(QWidget):
         
         dialog = NewRentalDialog(self, self.system)
         if dialog.exec() == QDialog.DialogCode.Accepted:
-            self.refresh_data()
-            self.data_changed.emit()
             QMessageBox.information(
                 self, "Succès", 
                 f"Location créée avec succès!\nID: {dialog.rental.id}\nCoût estimé: {dialog.rental.total_cost:.2f}€"
@@ -1172,16 +1075,12 @@ class RentalsPage(QWidget):
         """Ouvre le dialogue pour modifier une location."""
         dialog = EditRentalDialog(self, self.system, rental)
         if dialog.exec() == QDialog.DialogCode.Accepted:
-            self.refresh_data()
-            self.data_changed.emit()
             QMessageBox.information(self, "Succès", "Location modifiée avec succès!")
     
     def start_rental(self, rental: Rental):
         """Démarre une location."""
         success, message = self.system.start_rental(rental.id)
         if success:
-            self.refresh_data()
-            self.data_changed.emit()
             QMessageBox.information(self, "Succès", "Location démarrée!")
         else:
             QMessageBox.warning(self, "Erreur", message)
@@ -1190,8 +1089,6 @@ class RentalsPage(QWidget):
         """Termine une location."""
         dialog = CompleteRentalDialog(self, self.system, rental)
         if dialog.exec() == QDialog.DialogCode.Accepted:
-            self.refresh_data()
-            self.data_changed.emit()
             QMessageBox.information(self, "Succès", "Location terminée avec succès!")
     
     def cancel_rental(self, rental: Rental):
@@ -1204,6 +1101,4 @@ class RentalsPage(QWidget):
         
         if reply == QMessageBox.StandardButton.Yes:
             fee, message = self.system.cancel_rental(rental.id)
-            self.refresh_data()
-            self.data_changed.emit()
             QMessageBox.information(self, "Location annulée", message)
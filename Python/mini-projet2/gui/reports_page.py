@@ -3,17 +3,19 @@ Page des rapports et statistiques.
 """
 
 from datetime import date
+from typing import Dict, Tuple
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QFrame, QPushButton, QTableWidget, QTableWidgetItem,
     QHeaderView, QDateEdit, QGroupBox,
-    QScrollArea, QComboBox
+    QScrollArea, QComboBox, QProgressBar
 )
 from PyQt6.QtCore import Qt, QDate
 from PyQt6.QtGui import QFont, QColor
 
 from car_rental_system import CarRentalSystem
 from gui.icons import get_icon, ICON_COLORS
+from gui.async_query import BackgroundTask
 
 
 class StatCard(QFrame):
@@ -128,6 +130,24 @@ class ReportSection(QFrame):
     def add_widget(self, widget: QWidget):
         """Ajoute un widget au contenu."""
         self.content_layout.addWidget(widget)
+    
+    def clear(self):
+        """Efface le contenu."""
+        while self.content_layout.count():
+            item = self.content_layout.takeAt(0)
+            if item:
+                widget = item.widget()
+                if widget:
+                    widget.deleteLater()
+                else:
+                    sub_layout = item.layout()
+                    if sub_layout:
+                        while sub_layout.count():
+                            sub_item = sub_layout.takeAt(0)
+                            if sub_item:
+                                sub_widget = sub_item.widget()
+                                if sub_widget:
+                                    sub_widget.deleteLater()
 
 
 class ReportsPage(QWidget):
@@ -136,6 +156,13 @@ class ReportsPage(QWidget):
     def __init__(self, system: CarRentalSystem):
         super().__init__()
         self.system = system
+        
+        # Calcul des rapports en arrière-plan
+        self.report_task = BackgroundTask(parent=self)
+        self.report_task.progress.connect(self.on_report_progress)
+        self.report_task.result_ready.connect(self.display_snapshot)
+        self.report_task.query_failed.connect(lambda message: self.set_computing(False))
+        
         self.setup_ui()
         self.refresh_data()
     
@@ -253,6 +280,19 @@ class ReportsPage(QWidget):
         
         filter_layout.addStretch()
         
+        # Avancement du calcul, visible pendant le calcul
+        self.report_progress = QProgressBar()
+        self.report_progress.setFixedWidth(160)
+        self.report_progress.setTextVisible(False)
+        self.report_progress.setVisible(False)
+        filter_layout.addWidget(self.report_progress)
+        
+        self.cancel_btn = QPushButton("Annuler")
+        self.cancel_btn.setProperty("secondary", True)
+        self.cancel_btn.clicked.connect(self.cancel_refresh)
+        self.cancel_btn.setVisible(False)
+        filter_layout.addWidget(self.cancel_btn)
+        
         apply_btn = QPushButton("Appliquer")
         apply_btn.clicked.connect(self.refresh_data)
         filter_layout.addWidget(apply_btn)
@@ -406,21 +446,62 @@ class ReportsPage(QWidget):
             elif period == "Tout":
                 self.start_date.setDate(QDate(2020, 1, 1))
             self.end_date.setDate(today)
+            # Remplace un calcul en cours sur l'ancienne période
+            self.refresh_data()
+        elif self.report_task.busy:
+            self.cancel_refresh()
+    
+    def selected_period(self) -> Tuple[date, date]:
+        """Retourne la période sélectionnée."""
+        start_qdate = self.start_date.date()
+        end_qdate = self.end_date.date()
+        start = date(start_qdate.year(), start_qdate.month(), start_qdate.day())
+        end = date(end_qdate.year(), end_qdate.month(), end_qdate.day())
+        return start, end
     
     def refresh_data(self):
-        """Rafraîchit toutes les données."""
-        self.refresh_stats()
-        self.refresh_revenue_section()
-        self.refresh_vehicle_type_section()
-        self.refresh_fleet_section()
-        self.refresh_customers_section()
-        self.refresh_top_customers()
-        self.refresh_maintenance()
+        """Lance le calcul des rapports en arrière-plan (remplace un calcul en cours)."""
+        start, end = self.selected_period()
+        self.report_progress.setValue(0)
+        self.set_computing(True)
+        self.report_task.submit(
+            lambda is_stale, report_progress: self.system.generate_report_snapshot(
+                start, end, report_progress, is_stale
+            )
+        )
     
-    def refresh_stats(self):
+    def cancel_refresh(self):
+        """Abandonne le calcul en cours; les rapports affichés sont conservés."""
+        self.report_task.cancel()
+        self.set_computing(False)
+    
+    def set_computing(self, computing: bool):
+        """Affiche ou masque l'avancement du calcul."""
+        self.report_progress.setVisible(computing)
+        self.cancel_btn.setVisible(computing)
+    
+    def on_report_progress(self, done: int, total: int):
+        """Met à jour la barre d'avancement."""
+        self.report_progress.setMaximum(total)
+        self.report_progress.setValue(done)
+    
+    def display_snapshot(self, snapshot: Dict):
+        """Affiche un instantané calculé par generate_report_snapshot."""
+        self.set_computing(False)
+        if snapshot is None:
+            return
+        self.refresh_stats(snapshot)
+        self.refresh_revenue_section(snapshot)
+        self.refresh_vehicle_type_section(snapshot)
+        self.refresh_fleet_section(snapshot)
+        self.refresh_customers_section(snapshot)
+        self.refresh_top_customers(snapshot)
+        self.refresh_maintenance(snapshot)
+    
+    def refresh_stats(self, snapshot: Dict):
         """Rafraîchit les statistiques rapides."""
-        stats = self.system.generate_statistics_report()
-        revenue = self.system.generate_revenue_report()
+        stats = snapshot['statistics']
+        revenue = snapshot['revenue']
         
         self.stat_revenue.set_value(f"{revenue.get('total_revenue', 0):.0f} €")
         self.stat_rentals.set_value(str(revenue.get('total_rentals_completed', 0)))
@@ -429,63 +510,24 @@ class ReportsPage(QWidget):
         utilization = stats.get('fleet', {}).get('utilization_rate', 0)
         self.stat_utilization.set_value(f"{utilization:.1f}%")
     
-    def refresh_revenue_section(self):
+    def refresh_revenue_section(self, snapshot: Dict):
         """Rafraîchit la section chiffre d'affaires."""
-        # Effacer le contenu
-        while self.revenue_section.content_layout.count():
-            item = self.revenue_section.content_layout.takeAt(0)
-            if item:
-                widget = item.widget()
-                if widget:
-                    widget.deleteLater()
-                else:
-                    sub_layout = item.layout()
-                    if sub_layout:
-                        while sub_layout.count():
-                            sub_item = sub_layout.takeAt(0)
-                            if sub_item:
-                                sub_widget = sub_item.widget()
-                                if sub_widget:
-                                    sub_widget.deleteLater()
-        
-        start_qdate = self.start_date.date()
-        end_qdate = self.end_date.date()
-        start = date(start_qdate.year(), start_qdate.month(), start_qdate.day())
-        end = date(end_qdate.year(), end_qdate.month(), end_qdate.day())
+        self.revenue_section.clear()
         
-        report = self.system.generate_revenue_report(start, end)
+        report = snapshot['period_revenue']
         
         self.revenue_section.add_stat_row("Chiffre d'affaires total", f"{report.get('total_revenue', 0):.2f} €", True)
         self.revenue_section.add_stat_row("Revenus de base", f"{report.get('total_base_revenue', 0):.2f} €")
         self.revenue_section.add_stat_row("Pénalités perçues", f"{report.get('total_penalties', 0):.2f} €")
         self.revenue_section.add_stat_row("Locations terminées", str(report.get('total_rentals_completed', 0)))
         self.revenue_section.add_stat_row("Valeur moyenne", f"{report.get('average_rental_value', 0):.2f} €")
+        self.revenue_section.add_stat_row("Taux d'occupation", f"{snapshot['occupancy']:.1f}%")
     
-    def refresh_vehicle_type_section(self):
+    def refresh_vehicle_type_section(self, snapshot: Dict):
         """Rafraîchit la section revenus par type."""
-        # Effacer le contenu
-        while self.vehicle_type_section.content_layout.count():
-            item = self.vehicle_type_section.content_layout.takeAt(0)
-            if item:
-                widget = item.widget()
-                if widget:
-                    widget.deleteLater()
-                else:
-                    sub_layout = item.layout()
-                    if sub_layout:
-                        while sub_layout.count():
-                            sub_item = sub_layout.takeAt(0)
-                            if sub_item:
-                                sub_widget = sub_item.widget()
-                                if sub_widget:
-                                    sub_widget.deleteLater()
+        self.vehicle_type_section.clear()
         
-        start_qdate = self.start_date.date()
-        end_qdate = self.end_date.date()
-        start = date(start_qdate.year(), start_qdate.month(), start_qdate.day())
-        end = date(end_qdate.year(), end_qdate.month(), end_qdate.day())
-        
-        report = self.system.generate_revenue_report(start, end)
+        report = snapshot['period_revenue']
         
         for vtype, revenue in report.get('revenue_by_vehicle_type', {}).items():
             self.vehicle_type_section.add_stat_row(vtype, f"{revenue:.2f} €")
@@ -495,28 +537,12 @@ class ReportsPage(QWidget):
             empty_label.setStyleSheet("color: #94a3b8; font-style: italic;")
             self.vehicle_type_section.add_widget(empty_label)
     
-    def refresh_fleet_section(self):
+    def refresh_fleet_section(self, snapshot: Dict):
         """Rafraîchit la section flotte."""
-        # Effacer le contenu
-        while self.fleet_section.content_layout.count():
-            item = self.fleet_section.content_layout.takeAt(0)
-            if item:
-                widget = item.widget()
-                if widget:
-                    widget.deleteLater()
-                else:
-                    sub_layout = item.layout()
-                    if sub_layout:
-                        while sub_layout.count():
-                            sub_item = sub_layout.takeAt(0)
-                            if sub_item:
-                                sub_widget = sub_item.widget()
-                                if sub_widget:
-                                    sub_widget.deleteLater()
+        self.fleet_section.clear()
         
-        report = self.system.generate_available_vehicles_report()
-        stats = self.system.generate_statistics_report()
-        fleet = stats.get('fleet', {})
+        report = snapshot['availability']
+        fleet = snapshot['statistics'].get('fleet', {})
         
         self.fleet_section.add_stat_row("Total véhicules", str(fleet.get('total_vehicles', 0)), True)
         self.fleet_section.add_stat_row("Disponibles", str(report.get('total_available', 0)))
@@ -528,27 +554,11 @@ class ReportsPage(QWidget):
         for vtype, count in fleet.get('by_type', {}).items():
             self.fleet_section.add_stat_row(f"  {vtype}", str(count))
     
-    def refresh_customers_section(self):
+    def refresh_customers_section(self, snapshot: Dict):
         """Rafraîchit la section clients."""
-        # Effacer le contenu
-        while self.customers_section.content_layout.count():
-            item = self.customers_section.content_layout.takeAt(0)
-            if item:
-                widget = item.widget()
-                if widget:
-                    widget.deleteLater()
-                else:
-                    sub_layout = item.layout()
-                    if sub_layout:
-                        while sub_layout.count():
-                            sub_item = sub_layout.takeAt(0)
-                            if sub_item:
-                                sub_widget = sub_item.widget()
-                                if sub_widget:
-                                    sub_widget.deleteLater()
+        self.customers_section.clear()
         
-        stats = self.system.generate_statistics_report()
-        customers_stats = stats.get('customers', {})
+        customers_stats = snapshot['statistics'].get('customers', {})
         
         self.customers_section.add_stat_row("Total clients", str(customers_stats.get('total_customers', 0)), True)
         self.customers_section.add_stat_row("Clients fidèles", str(customers_stats.get('loyal_customers', 0)))
@@ -563,25 +573,21 @@ class ReportsPage(QWidget):
         self.customers_section.add_stat_row("10+ locations", "10% de réduction")
         self.customers_section.add_stat_row("20+ locations", "15% de réduction")
     
-    def refresh_top_customers(self):
+    def refresh_top_customers(self, snapshot: Dict):
         """Rafraîchit le tableau des meilleurs clients."""
-        customers = sorted(
-            self.system.get_all_customers(),
-            key=lambda c: c.get_total_rentals(),
-            reverse=True
-        )[:10]
+        customers = snapshot['top_customers']
         
         self.top_customers_table.setRowCount(len(customers))
         
-        for row, c in enumerate(customers):
+        for row, (c, rental_count) in enumerate(customers):
             # Rang et nom du client
             rank_prefix = ["#1", "#2", "#3"][row] if row < 3 else f"#{row + 1}"
             name_item = QTableWidgetItem(f"{rank_prefix} {c.full_name}")
             name_item.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold if row < 3 else QFont.Weight.Normal))
             self.top_customers_table.setItem(row, 0, name_item)
             
-            # Nombre de locations
-            rentals_item = QTableWidgetItem(str(c.get_total_rentals()))
+            # Nombre de locations, calculé avec le classement
+            rentals_item = QTableWidgetItem(str(int(rental_count)))
             rentals_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
             self.top_customers_table.setItem(row, 1, rentals_item)
             
@@ -623,11 +629,9 @@ class ReportsPage(QWidget):
             for col in range(1, 5):
                 self.top_customers_table.setItem(0, col, QTableWidgetItem(""))
     
-    def refresh_maintenance(self):
+    def refresh_maintenance(self, snapshot: Dict):
         """Rafraîchit le tableau de maintenance."""
-        vehicles_needing_maintenance = [
-            v for v in self.system.get_all_vehicles() if v.needs_maintenance()
-        ]
+        vehicles_needing_maintenance = snapshot['maintenance']
         
         self.maintenance_table.setRowCount(len(vehicles_needing_maintenance))
         
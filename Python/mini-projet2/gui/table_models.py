@@ -0,0 +1,652 @@
+"""
+Modèles de tableaux (architecture modèle/vue) et délégués de rendu.
+
+Les tableaux ne créent plus de QTableWidgetItem ni de widgets par ligne:
+la vue ne demande au modèle que les cellules visibles, et les badges de
+statut ainsi que les boutons d'action sont dessinés par des délégués.
+"""
+
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyle, QToolTip
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen
+from PyQt6.QtCore import (
+    Qt, QAbstractTableModel, QSortFilterProxyModel, QEvent, QModelIndex,
+    QRect, pyqtSignal
+)
+
+from car_rental_system import CarRentalSystem
+from models.vehicle import Vehicle, VehicleState
+from models.customer import Customer
+from models.rental import Rental, RentalStatus
+from gui.icons import get_icon
+from gui.async_query import DebouncedQuery
+
+
+# Rôles de données personnalisés
+ObjectRole = Qt.ItemDataRole.UserRole
+ActionsRole = Qt.ItemDataRole.UserRole + 1
+
+
+# Couleurs des badges: texte -> (fond, texte, bordure)
+RENTAL_STATUS_BADGES = {
+    RentalStatus.ACTIVE.value: ("#f0fdf4", "#16a34a", "#bbf7d0"),
+    RentalStatus.RESERVED.value: ("#eff6ff", "#2563eb", "#bfdbfe"),
+    RentalStatus.COMPLETED.value: ("#f1f5f9", "#64748b", "#e2e8f0"),
+    RentalStatus.CANCELLED.value: ("#fef2f2", "#dc2626", "#fecaca"),
+}
+
+
+VEHICLE_STATE_BADGES = {
+    VehicleState.AVAILABLE.value: ("#f0fdf4", "#16a34a", "#bbf7d0"),
+    VehicleState.RENTED.value: ("#fefce8", "#ca8a04", "#fef08a"),
+    VehicleState.MAINTENANCE.value: ("#eff6ff", "#2563eb", "#bfdbfe"),
+    VehicleState.OUT_OF_SERVICE.value: ("#fef2f2", "#dc2626", "#fecaca"),
+}
+
+CUSTOMER_STATUS_BADGES = {
+    "Bloqué": ("#fef2f2", "#dc2626", "#fecaca"),
+    "Fidèle": ("#f0fdf4", "#16a34a", "#bbf7d0"),
+    "Actif": ("#eff6ff", "#2563eb", "#bfdbfe"),
+}
+
+
+# Boutons d'action: nom -> (icône, tooltip, couleur icône, fond, bordure)
+ACTION_BUTTONS = {
+    "details": ("eye", "Voir les détails", "#64748b", "#f1f5f9", "#e2e8f0"),
+    "start": ("play", "Démarrer la location", "#ffffff", "#22c55e", "#16a34a"),
+    "edit": ("edit", "Modifier", "#3b82f6", "#eff6ff", "#bfdbfe"),
+    "complete": ("check", "Terminer la location", "#ffffff", "#22c55e", "#16a34a"),
+    "extend": ("calendar", "Prolonger", "#8b5cf6", "#f5f3ff", "#ddd6fe"),
+    "cancel": ("cancel", "Annuler", "#ffffff", "#ef4444", "#dc2626"),
+    "delete": ("delete", "Supprimer", "#ef4444", "#fef2f2", "#fecaca"),
+}
+
+
+class StatusBadgeDelegate(QStyledItemDelegate):
+    """Délégué dessinant le texte de la cellule sous forme de badge arrondi."""
+    
+    def __init__(self, badges: Dict[str, Tuple[str, str, str]], parent=None):
+        super().__init__(parent)
+        self._badges = {
+            text: tuple(QColor(c) for c in colors) for text, colors in badges.items()
+        }
+        self._default = tuple(QColor(c) for c in ("#f1f5f9", "#64748b", "#e2e8f0"))
+        self._font = QFont()
+        self._font.setPointSizeF(8.5)
+        self._font.setWeight(QFont.Weight.DemiBold)
+        self._metrics = QFontMetrics(self._font)
+    
+    def paint(self, painter: QPainter, option, index: QModelIndex):
+        """Dessine le badge centré dans la cellule."""
+        # Fond et sélection standards, sans le texte
+        self.initStyleOption(option, index)
+        option.text = ""
+        style = option.widget.style() if option.widget else None
+        if style:
+            style.drawControl(QStyle.ControlElement.CE_ItemViewItem, option, painter, option.widget)
+        
+        text = index.data(Qt.ItemDataRole.DisplayRole)
+        if not text:
+            return
+        
+        background, foreground, border = self._badges.get(text, self._default)
+        width = self._metrics.horizontalAdvance(text) + 16
+        height = self._metrics.height() + 4
+        rect = QRect(0, 0, min(width, option.rect.width() - 4), height)
+        rect.moveCenter(option.rect.center())
+        
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(border, 1))
+        painter.setBrush(background)
+        painter.drawRoundedRect(rect, height / 2, height / 2)
+        painter.setFont(self._font)
+        painter.setPen(foreground)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+        painter.restore()
+
+
+class ActionButtonsDelegate(QStyledItemDelegate):
+    """
+    Délégué dessinant des boutons d'action dans une cellule.
+    
+    Le modèle fournit la liste des actions de la ligne via ActionsRole;
+    un clic sur un bouton émet action_triggered(nom de l'action, objet de
+    la ligne lu via ObjectRole), ce qui reste valable derrière un proxy.
+    """
+    
+    action_triggered = pyqtSignal(str, object)
+    
+    def __init__(self, buttons: Dict[str, Tuple[str, str, str, str, str]],
+                 size: int = 26, spacing: int = 4, parent=None):
+        super().__init__(parent)
+        self._buttons = buttons
+        self._size = size
+        self._spacing = spacing
+        self._icon_size = int(size * 0.55)
+    
+    def _button_rects(self, rect: QRect, actions: List[str]) -> List[Tuple[str, QRect]]:
+        """Calcule la position de chaque bouton, centrés dans la cellule."""
+        total = len(actions) * self._size + max(len(actions) - 1, 0) * self._spacing
+        x = rect.x() + (rect.width() - total) // 2
+        y = rect.y() + (rect.height() - self._size) // 2
+        rects = []
+        for action in actions:
+            rects.append((action, QRect(x, y, self._size, self._size)))
+            x += self._size + self._spacing
+        return rects
+    
+    def paint(self, painter: QPainter, option, index: QModelIndex):
+        """Dessine les boutons de la ligne."""
+        self.initStyleOption(option, index)
+        style = option.widget.style() if option.widget else None
+        if style:
+            style.drawControl(QStyle.ControlElement.CE_ItemViewItem, option, painter, option.widget)
+        
+        actions = index.data(ActionsRole) or []
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        for action, rect in self._button_rects(option.rect, actions):
+            icon_name, _, icon_color, background, border = self._buttons[action]
+            painter.setPen(QPen(QColor(border), 1))
+            painter.setBrush(QColor(background))
+            painter.drawRoundedRect(rect, self._size // 4, self._size // 4)
+            
+            icon_rect = QRect(0, 0, self._icon_size, self._icon_size)
+            icon_rect.moveCenter(rect.center())
+            get_icon(icon_name, icon_color, self._icon_size * 2).paint(painter, icon_rect)
+        painter.restore()
+    
+    def _action_at(self, option, index: QModelIndex, pos) -> Optional[str]:
+        """Retourne l'action sous la position donnée."""
+        actions = index.data(ActionsRole) or []
+        for action, rect in self._button_rects(option.rect, actions):
+            if rect.contains(pos):
+                return action
+        return None
+    
+    def editorEvent(self, event, model, option, index: QModelIndex) -> bool:
+        """Déclenche l'action cliquée."""
+        if event.type() == QEvent.Type.MouseButtonRelease:
+            action = self._action_at(option, index, event.position().toPoint())
+            if action:
+                self.action_triggered.emit(action, index.data(ObjectRole))
+                return True
+        return super().editorEvent(event, model, option, index)
+    
+    def helpEvent(self, event, view, option, index: QModelIndex) -> bool:
+        """Affiche le tooltip du bouton survolé."""
+        if event.type() == QEvent.Type.ToolTip:
+            action = self._action_at(option, index, event.pos())
+            if action:
+                QToolTip.showText(event.globalPos(), self._buttons[action][1], view)
+                return True
+        return super().helpEvent(event, view, option, index)
+
+
+class ObjectTableModel(QAbstractTableModel):
+    """
+    Modèle de tableau générique sur une liste d'objets du domaine.
+    
+    Les sous-classes définissent HEADERS et _display. La recherche est
+    déléguée à une fonction renvoyant les objets correspondants triés par
+    pertinence (typiquement find_vehicles/find_customers du système).
+    """
+    
+    HEADERS: List[str] = []
+    ACTIONS_COLUMN = -1
+    
+    def __init__(self, search: Optional[Callable[[str], List[Any]]] = None, parent=None):
+        super().__init__(parent)
+        self._search = search
+        self._objects: List[Any] = []
+        self._rows: Dict[str, int] = {}
+    
+    def set_objects(self, objects: List[Any]) -> None:
+        """Remplace les objets affichés."""
+        self.beginResetModel()
+        self._objects = list(objects)
+        self._rows = {obj.id: row for row, obj in enumerate(self._objects)}
+        self.endResetModel()
+    
+    def update_objects(self, object_ids: Iterable[str]) -> None:
+        """Rafraîchit les lignes des objets modifiés (ignore les IDs absents)."""
+        rows = [self._rows[object_id] for object_id in object_ids if object_id in self._rows]
+        if not rows:
+            return
+        # Un seul signal pour le bloc de lignes: le proxy ne refiltre qu'une fois
+        self.dataChanged.emit(
+            self.index(min(rows), 0),
+            self.index(max(rows), self.columnCount() - 1)
+        )
+    
+    def add_object(self, obj: Any) -> None:
+        """Ajoute un objet en fin de tableau."""
+        if obj.id in self._rows:
+            self.update_objects([obj.id])
+            return
+        row = len(self._objects)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._objects.append(obj)
+        self._rows[obj.id] = row
+        self.endInsertRows()
+    
+    def remove_object(self, object_id: str) -> bool:
+        """
+        Retire un objet du tableau.
+        
+        Returns:
+            True si l'objet était affiché
+        """
+        row = self._rows.get(object_id)
+        if row is None:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._objects[row]
+        self._rows = {obj.id: index for index, obj in enumerate(self._objects)}
+        self.endRemoveRows()
+        return True
+    
+    def object_at(self, row: int) -> Optional[Any]:
+        """Retourne l'objet affiché à une ligne."""
+        if 0 <= row < len(self._objects):
+            return self._objects[row]
+        return None
+    
+    def objects(self) -> List[Any]:
+        """Retourne une copie de la liste des objets, dans l'ordre des lignes."""
+        return list(self._objects)
+    
+    def rank_rows(self, query: str) -> Dict[int, int]:
+        """
+        Lignes correspondant à une recherche.
+        
+        Returns:
+            Dictionnaire {ligne: rang de pertinence} (vide sans fonction
+            de recherche)
+        """
+        if self._search is None:
+            return {}
+        ranks = {}
+        for obj in self._search(query):
+            row = self._rows.get(obj.id)
+            if row is not None:
+                ranks[row] = len(ranks)
+        return ranks
+    
+    def matches_criteria(self, obj: Any, criteria: Tuple) -> bool:
+        """
+        Indique si un objet satisfait les critères de filtre (hors recherche).
+        
+        Ne lit que l'objet: peut s'exécuter sur un thread du pool.
+        """
+        return True
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._objects)
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section: int, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        
+        obj = self._objects[index.row()]
+        if role == ObjectRole:
+            return obj
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display(obj, index.column())
+        if role == ActionsRole and index.column() == self.ACTIONS_COLUMN:
+            return self._actions(obj)
+        return self._data(obj, index.column(), role)
+    
+    def _display(self, obj: Any, column: int) -> Optional[str]:
+        """Texte affiché dans une cellule."""
+        return None
+    
+    def _data(self, obj: Any, column: int, role) -> Any:
+        """Données des autres rôles (couleurs, icônes, tooltips)."""
+        return None
+    
+    def _actions(self, obj: Any) -> List[str]:
+        """Actions disponibles pour une ligne."""
+        return []
+
+
+class ObjectFilterProxyModel(QSortFilterProxyModel):
+    """
+    Couche de filtrage au-dessus d'un ObjectTableModel.
+    
+    Le filtre est incrémental: lorsque la recherche s'allonge sans que les
+    critères changent, seules les lignes déjà acceptées sont réévaluées.
+    Pendant une recherche, les lignes sont triées par pertinence.
+    
+    Avec une DebouncedQuery, le calcul du filtre est différé et exécuté en
+    arrière-plan; seul le résultat de la dernière requête est appliqué.
+    La recherche dans l'index et la copie des objets ont lieu sur le thread
+    de l'interface: la requête ne lit que ces copies.
+    """
+    
+    # Nombre de lignes évaluées entre deux vérifications d'obsolescence
+    STALE_CHECK_INTERVAL = 512
+    
+    def __init__(self, parent=None, query: Optional[DebouncedQuery] = None):
+        super().__init__(parent)
+        self._search = ""
+        self._criteria: Tuple = ()
+        self._accepted: Optional[Set[int]] = None
+        self._ranks: Dict[int, int] = {}
+        # Filtre demandé mais pas encore appliqué (requête différée)
+        self._requested: Optional[Tuple[str, Tuple]] = None
+        self._query = query
+        if query is not None:
+            query.result_ready.connect(self._apply_result)
+    
+    def setSourceModel(self, model: ObjectTableModel):
+        super().setSourceModel(model)
+        model.modelReset.connect(self._refilter)
+        # Lignes ajoutées, retirées ou modifiées: les critères sont à réévaluer
+        model.rowsInserted.connect(self._refilter)
+        model.rowsRemoved.connect(self._refilter)
+        model.dataChanged.connect(self._refilter)
+    
+    def set_filter(self, search: str = "", criteria: Tuple = ()) -> None:
+        """
+        Met à jour la recherche et les critères de filtre.
+        
+        Args:
+            search: Texte recherché (insensible à la casse)
+            criteria: Critères interprétés par matches_criteria du modèle
+        """
+        search = search.strip().lower()
+        if search == self._search and criteria == self._criteria and self._accepted is not None:
+            self._requested = None
+            if self._query is not None:
+                self._query.cancel()  # Revenu au filtre affiché
+            return
+        
+        narrowing = (
+            self._accepted is not None
+            and criteria == self._criteria
+            and self._search in search
+        )
+        candidates = self._accepted if narrowing else None
+        
+        if self._query is None:
+            self._apply_result(self._compute(*self._prepare(search, criteria, candidates)))
+        else:
+            self._requested = (search, criteria)
+            prepared = self._prepare(search, criteria, candidates)
+            self._query.submit(lambda is_stale: self._compute(*prepared, is_stale))
+    
+    def object_at(self, row: int) -> Optional[Any]:
+        """Retourne l'objet affiché à une ligne de la vue."""
+        source_index = self.mapToSource(self.index(row, 0))
+        return self.sourceModel().object_at(source_index.row())
+    
+    def _refilter(self) -> None:
+        """Réévalue toutes les lignes après un changement du modèle source."""
+        # Les lignes ont changé: une requête en cours porte sur l'ancien
+        # modèle. Le filtre demandé (éventuellement pas encore appliqué)
+        # est recalculé immédiatement.
+        search, criteria = self._requested or (self._search, self._criteria)
+        if self._query is not None:
+            self._query.cancel()
+        self._apply_result(self._compute(*self._prepare(search, criteria, None)))
+    
+    def _prepare(
+        self,
+        search: str,
+        criteria: Tuple,
+        candidates: Optional[Set[int]]
+    ) -> Tuple[str, Tuple, Dict[int, int], List[int], List[Any], Callable[[Any, Tuple], bool]]:
+        """
+        Rassemble sur le thread de l'interface les données d'un calcul de filtre.
+        
+        La recherche dans l'index du système et la copie des objets sont
+        faites ici: _compute ne lit ensuite aucune structure partagée.
+        
+        Returns:
+            Arguments de _compute (hors is_stale)
+        """
+        model = self.sourceModel()
+        
+        # La recherche textuelle passe par l'index du système
+        ranks = model.rank_rows(search) if search else {}
+        if search:
+            if candidates is None:
+                rows = list(ranks)
+            else:
+                rows = [row for row in candidates if row in ranks]
+        elif candidates is None:
+            rows = list(range(model.rowCount()))
+        else:
+            rows = list(candidates)
+        
+        objects = model.objects() if criteria else []
+        return search, criteria, ranks, rows, objects, model.matches_criteria
+    
+    def _compute(
+        self,
+        search: str,
+        criteria: Tuple,
+        ranks: Dict[int, int],
+        rows: List[int],
+        objects: List[Any],
+        matches: Callable[[Any, Tuple], bool],
+        is_stale: Callable[[], bool] = lambda: False
+    ) -> Optional[Tuple[str, Tuple, Set[int], Dict[int, int]]]:
+        """
+        Calcule les lignes acceptées parmi les candidates.
+        
+        Ne lit que les copies préparées par _prepare: peut s'exécuter sur
+        un thread du pool.
+        
+        Returns:
+            Tuple (recherche, critères, lignes acceptées, rangs), ou None
+            si la requête est devenue obsolète
+        """
+        if not criteria:
+            return search, criteria, set(rows), ranks
+        
+        accepted = set()
+        for count, row in enumerate(rows):
+            if count % self.STALE_CHECK_INTERVAL == 0 and is_stale():
+                return None
+            if matches(objects[row], criteria):
+                accepted.add(row)
+        return search, criteria, accepted, ranks
+    
+    def _apply_result(self, result) -> None:
+        """Applique un filtre calculé par _compute."""
+        if result is None:
+            return
+        self._search, self._criteria, self._accepted, self._ranks = result
+        if self._requested == (self._search, self._criteria):
+            self._requested = None
+        self.invalidateFilter()
+        
+        # Tri par pertinence pendant une recherche, ordre du modèle sinon
+        self.sort(0 if self._search else -1)
+    
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        return self._accepted is None or source_row in self._accepted
+    
+    def lessThan(self, left: QModelIndex, right: QModelIndex) -> bool:
+        return self._ranks.get(left.row(), 0) < self._ranks.get(right.row(), 0)
+
+
+class RentalTableModel(ObjectTableModel):
+    """
+    Modèle de tableau des locations.
+    
+    Ne conserve que la liste ordonnée des locations à afficher: les noms
+    des clients et véhicules sont résolus à la demande, uniquement pour
+    les cellules visibles.
+    """
+    
+    HEADERS = [
+        "ID", "Client", "Véhicule", "Début", "Fin",
+        "Statut", "Coût", "Jours restants", "Notes", "Actions"
+    ]
+    STATUS_COLUMN = 5
+    ACTIONS_COLUMN = 9
+    
+    def __init__(self, system: CarRentalSystem, parent=None):
+        super().__init__(parent=parent)
+        self._system = system
+        self._notes_icon = None
+    
+    def set_rentals(self, rentals: List[Rental]) -> None:
+        """Remplace les locations affichées."""
+        self.set_objects(rentals)
+    
+    def rental_at(self, row: int) -> Optional[Rental]:
+        """Retourne la location affichée à une ligne."""
+        return self.object_at(row)
+    
+    def _data(self, rental: Rental, column: int, role) -> Any:
+        if role == Qt.ItemDataRole.ForegroundRole and column == 7:
+            return self._remaining_color(rental)
+        if column == 8:
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return rental.notes if rental.notes else "Pas de notes"
+            if role == Qt.ItemDataRole.DecorationRole and rental.notes:
+                if self._notes_icon is None:
+                    self._notes_icon = get_icon("documents", "#64748b", 16)
+                return self._notes_icon
+        return None
+    
+    def _display(self, rental: Rental, column: int) -> Optional[str]:
+        """Texte affiché dans une cellule."""
+        if column == 0:
+            return rental.id
+        if column == 1:
+            customer = self._system.get_customer(rental.customer_id)
+            return customer.full_name if customer else "Inconnu"
+        if column == 2:
+            vehicle = self._system.get_vehicle(rental.vehicle_id)
+            return f"{vehicle.brand} {vehicle.model}" if vehicle else "Inconnu"
+        if column == 3:
+            return str(rental.start_date)
+        if column == 4:
+            return str(rental.end_date)
+        if column == self.STATUS_COLUMN:
+            return rental.status.value
+        if column == 6:
+            return f"{rental.total_cost:.2f}€"
+        if column == 7:
+            if rental.status == RentalStatus.ACTIVE:
+                if rental.is_overdue():
+                    return f"-{abs(rental.days_remaining())} j"
+                return f"{rental.days_remaining()} j"
+            if rental.status == RentalStatus.RESERVED:
+                return f"dans {(rental.start_date - date.today()).days} j"
+            return "-"
+        return None
+    
+    def _remaining_color(self, rental: Rental) -> Optional[QColor]:
+        """Couleur de la colonne des jours restants."""
+        if rental.status == RentalStatus.ACTIVE:
+            return QColor(Qt.GlobalColor.red) if rental.is_overdue() else QColor(Qt.GlobalColor.darkGreen)
+        if rental.status == RentalStatus.RESERVED:
+            return QColor(Qt.GlobalColor.darkBlue)
+        return None
+    
+    def _actions(self, rental: Rental) -> List[str]:
+        """Actions disponibles selon le statut de la location."""
+        actions = ["details"]
+        if rental.status == RentalStatus.RESERVED:
+            actions += ["start", "edit", "cancel"]
+        elif rental.status == RentalStatus.ACTIVE:
+            actions += ["complete", "extend", "cancel"]
+        return actions
+
+
+class VehicleTableModel(ObjectTableModel):
+    """Modèle de tableau des véhicules."""
+    
+    HEADERS = [
+        "ID", "Type", "Marque", "Modèle", "Catégorie",
+        "Tarif/jour", "État", "Année", "Actions"
+    ]
+    STATE_COLUMN = 6
+    ACTIONS_COLUMN = 8
+    
+    def __init__(self, system: CarRentalSystem, parent=None):
+        super().__init__(system.find_vehicles, parent)
+    
+    def matches_criteria(self, vehicle: Vehicle, criteria: Tuple) -> bool:
+        """Critères: (type de véhicule ou None, état ou None)."""
+        vehicle_type, state = criteria
+        if vehicle_type and vehicle.get_vehicle_type() != vehicle_type:
+            return False
+        return not state or vehicle.state == state
+    
+    def _display(self, vehicle: Vehicle, column: int) -> Optional[str]:
+        if column == 0:
+            return vehicle.id
+        if column == 1:
+            return vehicle.get_vehicle_type()
+        if column == 2:
+            return vehicle.brand
+        if column == 3:
+            return vehicle.model
+        if column == 4:
+            return vehicle.category.value
+        if column == 5:
+            return f"{vehicle.daily_rate:.2f} €"
+        if column == self.STATE_COLUMN:
+            return vehicle.state.value
+        if column == 7:
+            return str(vehicle.year)
+        return None
+    
+    def _actions(self, vehicle: Vehicle) -> List[str]:
+        return ["edit", "delete"]
+
+
+class CustomerTableModel(ObjectTableModel):
+    """Modèle de tableau des clients."""
+    
+    HEADERS = [
+        "ID", "Nom complet", "Âge", "Email", "Téléphone",
+        "Permis", "Locations", "Statut", "Actions"
+    ]
+    STATUS_COLUMN = 7
+    ACTIONS_COLUMN = 8
+    
+    def __init__(self, system: CarRentalSystem, parent=None):
+        super().__init__(system.find_customers, parent)
+    
+    def _display(self, customer: Customer, column: int) -> Optional[str]:
+        if column == 0:
+            return customer.id
+        if column == 1:
+            return customer.full_name
+        if column == 2:
+            return f"{customer.age} ans"
+        if column == 3:
+            return customer.email
+        if column == 4:
+            return customer.phone
+        if column == 5:
+            return ", ".join(sorted(customer.license_types))
+        if column == 6:
+            return str(customer.get_total_rentals())
+        if column == self.STATUS_COLUMN:
+            if customer.is_blocked:
+                return "Bloqué"
+            return "Fidèle" if customer.is_loyal_customer() else "Actif"
+        return None
+    
+    def _actions(self, customer: Customer) -> List[str]:
+        return ["edit", "delete"]
@@ -2,19 +2,24 @@
 Page de gestion des véhicules.
 """
 
-from typing import Optional
+from typing import List, Optional
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QFrame, QPushButton, QTableWidget, QTableWidgetItem,
+    QLabel, QFrame, QPushButton, QTableView,
     QHeaderView, QDialog, QFormLayout, QLineEdit, QComboBox,
     QSpinBox, QDoubleSpinBox, QCheckBox, QMessageBox,
     QScrollArea, QGroupBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
 
 from car_rental_system import CarRentalSystem
 from models.vehicle import Vehicle, Car, Truck, Motorcycle, VehicleCategory, VehicleState
-from gui.icons import get_icon, create_action_button
+from models.events import ChangeEvent, ChangeType
+from gui.icons import get_icon
+from gui.async_query import DebouncedQuery
+from gui.table_models import (
+    VehicleTableModel, ObjectFilterProxyModel, StatusBadgeDelegate,
+    ActionButtonsDelegate, VEHICLE_STATE_BADGES, ACTION_BUTTONS
+)
 
 
 class VehicleDialog(QDialog):
@@ -322,8 +327,6 @@ class VehicleDialog(QDialog):
 class VehiclesPage(QWidget):
     """Page de gestion des véhicules."""
     
-    data_changed = pyqtSignal()
-    
     def __init__(self, system: CarRentalSystem):
         super().__init__()
         self.system = system
@@ -405,12 +408,21 @@ class VehiclesPage(QWidget):
         layout.addLayout(filter_layout)
         
         # Tableau des véhicules
-        self.table = QTableWidget()
-        self.table.setColumnCount(9)
-        self.table.setHorizontalHeaderLabels([
-            "ID", "Type", "Marque", "Modèle", "Catégorie", 
-            "Tarif/jour", "État", "Année", "Actions"
-        ])
+        # Modèle/vue: seules les lignes visibles sont rendues et le filtrage
+        # est fait par un proxy (différé, en arrière-plan), sans reconstruire
+        # le tableau
+        self.table = QTableView()
+        self.model = VehicleTableModel(self.system)
+        self.proxy = ObjectFilterProxyModel(self, DebouncedQuery(parent=self))
+        self.proxy.setSourceModel(self.model)
+        self.table.setModel(self.proxy)
+        
+        self.state_delegate = StatusBadgeDelegate(VEHICLE_STATE_BADGES, self.table)
+        self.table.setItemDelegateForColumn(VehicleTableModel.STATE_COLUMN, self.state_delegate)
+        
+        self.actions_delegate = ActionButtonsDelegate(ACTION_BUTTONS, size=28, spacing=6, parent=self.table)
+        self.actions_delegate.action_triggered.connect(self.on_action_triggered)
+        self.table.setItemDelegateForColumn(VehicleTableModel.ACTIONS_COLUMN, self.actions_delegate)
         
         # Configuration du tableau
         header = self.table.horizontalHeader()
@@ -434,7 +446,7 @@ class VehiclesPage(QWidget):
         self.table.setColumnWidth(7, 60)   # Année
         self.table.setColumnWidth(8, 120)  # Actions
         
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.table.setAlternatingRowColors(True)
         v_header = self.table.verticalHeader()
         if v_header:
@@ -446,136 +458,47 @@ class VehiclesPage(QWidget):
     
     def refresh_data(self):
         """Rafraîchit les données du tableau."""
-        self.all_vehicles = self.system.get_all_vehicles()
+        self.model.set_objects(self.system.get_all_vehicles())
         self.apply_filters()
     
+    def apply_events(self, events: List[ChangeEvent]) -> bool:
+        """
+        Met à jour les seules lignes concernées par des changements.
+        
+        Returns:
+            True si la page est à jour
+        """
+        updated = []
+        for event in events:
+            if event.change_type in (ChangeType.DATA_RESTORED, ChangeType.DATA_CHANGED):
+                self.refresh_data()
+                return True
+            if event.change_type == ChangeType.VEHICLE_ADDED:
+                vehicle = self.system.get_vehicle(event.entity_id)
+                if vehicle:
+                    self.model.add_object(vehicle)
+            elif event.change_type == ChangeType.VEHICLE_REMOVED:
+                self.model.remove_object(event.entity_id)
+            elif event.change_type == ChangeType.VEHICLE_UPDATED:
+                updated.append(event.entity_id)
+        self.model.update_objects(updated)
+        return True
+    
     def apply_filters(self):
-        """Applique les filtres et affiche les véhicules."""
-        vehicles = self.all_vehicles
-        
-        # Filtre par type
+        """Applique les filtres (type, état, recherche) via le proxy."""
         type_filter = self.type_filter.currentText()
-        if type_filter != "Tous les types":
-            vehicles = [v for v in vehicles if v.get_vehicle_type() == type_filter]
-        
-        # Filtre par état
+        vehicle_type = type_filter if type_filter != "Tous les types" else None
         state_data = self.state_filter.currentData()
-        if state_data:
-            vehicles = [v for v in vehicles if v.state == state_data]
-        
-        # Filtre par recherche
-        search = self.search_edit.text().lower()
-        if search:
-            vehicles = [v for v in vehicles 
-                       if search in v.brand.lower() 
-                       or search in v.model.lower()
-                       or search in v.license_plate.lower()]
-        
-        self.display_vehicles(vehicles)
+        
+        criteria = (vehicle_type, state_data) if vehicle_type or state_data else ()
+        self.proxy.set_filter(self.search_edit.text(), criteria)
     
-    def display_vehicles(self, vehicles: list):
-        """Affiche les véhicules dans le tableau."""
-        self.table.setRowCount(len(vehicles))
-        
-        for row, vehicle in enumerate(vehicles):
-            self.table.setItem(row, 0, QTableWidgetItem(vehicle.id))
-            self.table.setItem(row, 1, QTableWidgetItem(vehicle.get_vehicle_type()))
-            self.table.setItem(row, 2, QTableWidgetItem(vehicle.brand))
-            self.table.setItem(row, 3, QTableWidgetItem(vehicle.model))
-            self.table.setItem(row, 4, QTableWidgetItem(vehicle.category.value))
-            self.table.setItem(row, 5, QTableWidgetItem(f"{vehicle.daily_rate:.2f} €"))
-            
-            # État avec badge
-            state_widget = QWidget()
-            state_layout = QHBoxLayout(state_widget)
-            state_layout.setContentsMargins(2, 2, 2, 2)
-            state_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            state_label = QLabel(vehicle.state.value)
-            if vehicle.state == VehicleState.AVAILABLE:
-                state_label.setStyleSheet("""
-                    QLabel {
-                        background-color: #f0fdf4;
-                        color: #16a34a;
-                        padding: 2px 8px;
-                        border-radius: 10px;
-                        font-weight: 600;
-                        font-size: 11px;
-                        border: 1px solid #bbf7d0;
-                    }
-                """)
-            elif vehicle.state == VehicleState.RENTED:
-                state_label.setStyleSheet("""
-                    QLabel {
-                        background-color: #fefce8;
-                        color: #ca8a04;
-                        padding: 2px 8px;
-                        border-radius: 10px;
-                        font-weight: 600;
-                        font-size: 11px;
-                        border: 1px solid #fef08a;
-                    }
-                """)
-            elif vehicle.state == VehicleState.MAINTENANCE:
-                state_label.setStyleSheet("""
-                    QLabel {
-                        background-color: #eff6ff;
-                        color: #2563eb;
-                        padding: 2px 8px;
-                        border-radius: 10px;
-                        font-weight: 600;
-                        font-size: 11px;
-                        border: 1px solid #bfdbfe;
-                    }
-                """)
-            else:
-                state_label.setStyleSheet("""
-                    QLabel {
-                        background-color: #fef2f2;
-                        color: #dc2626;
-                        padding: 2px 8px;
-                        border-radius: 10px;
-                        font-weight: 600;
-                        font-size: 11px;
-                        border: 1px solid #fecaca;
-                    }
-                """)
-            state_layout.addWidget(state_label)
-            self.table.setCellWidget(row, 6, state_widget)
-            
-            self.table.setItem(row, 7, QTableWidgetItem(str(vehicle.year)))
-            
-            # Boutons d'action
-            actions_widget = QWidget()
-            actions_layout = QHBoxLayout(actions_widget)
-            actions_layout.setContentsMargins(4, 0, 4, 0)
-            actions_layout.setSpacing(6)
-            actions_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            edit_btn = create_action_button(
-                "edit", "Modifier",
-                icon_color="#3b82f6",
-                bg_color="#eff6ff",
-                hover_color="#dbeafe",
-                border_color="#bfdbfe",
-                size=28
-            )
-            edit_btn.clicked.connect(lambda checked, v=vehicle: self.edit_vehicle(v))
-            
-            delete_btn = create_action_button(
-                "delete", "Supprimer",
-                icon_color="#ef4444",
-                bg_color="#fef2f2",
-                hover_color="#fee2e2",
-                border_color="#fecaca",
-                size=28
-            )
-            delete_btn.clicked.connect(lambda checked, v=vehicle: self.delete_vehicle(v))
-            
-            actions_layout.addWidget(edit_btn)
-            actions_layout.addWidget(delete_btn)
-            
-            self.table.setCellWidget(row, 8, actions_widget)
+    def on_action_triggered(self, action: str, vehicle: Vehicle):
+        """Exécute l'action cliquée sur une ligne du tableau."""
+        if action == "edit":
+            self.edit_vehicle(vehicle)
+        elif action == "delete":
+            self.delete_vehicle(vehicle)
     
     def add_vehicle(self):
         """Ouvre le dialogue pour ajouter un véhicule."""
@@ -583,8 +506,6 @@ class VehiclesPage(QWidget):
         if dialog.exec() == QDialog.DialogCode.Accepted:
             vehicle = dialog.get_vehicle()
             if vehicle and self.system.add_vehicle(vehicle):
-                self.refresh_data()
-                self.data_changed.emit()
                 QMessageBox.information(self, "Succès", "Véhicule ajouté avec succès!")
             else:
                 QMessageBox.warning(self, "Erreur", "Impossible d'ajouter le véhicule.")
@@ -595,13 +516,12 @@ class VehiclesPage(QWidget):
         if dialog.exec() == QDialog.DialogCode.Accepted:
             # Supprimer l'ancien et ajouter le nouveau
             old_state = vehicle.state  # Conserver l'état via le getter public
-            self.system.remove_vehicle(vehicle.id)
-            new_vehicle = dialog.get_vehicle()
-            if new_vehicle:
-                new_vehicle.state = old_state  # Utiliser le setter public
-                self.system.add_vehicle(new_vehicle)
-            self.refresh_data()
-            self.data_changed.emit()
+            with self.system.events.batch():
+                self.system.remove_vehicle(vehicle.id)
+                new_vehicle = dialog.get_vehicle()
+                if new_vehicle:
+                    new_vehicle.state = old_state  # Utiliser le setter public
+                    self.system.add_vehicle(new_vehicle)
             QMessageBox.information(self, "Succès", "Véhicule modifié avec succès!")
     
     def delete_vehicle(self, vehicle: Vehicle):
@@ -614,8 +534,6 @@ class VehiclesPage(QWidget):
         
         if reply == QMessageBox.StandardButton.Yes:
             if self.system.remove_vehicle(vehicle.id):
-                self.refresh_data()
-                self.data_changed.emit()
                 QMessageBox.information(self, "Succès", "Véhicule supprimé!")
             else:
                 QMessageBox.warning(
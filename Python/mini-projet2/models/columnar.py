@@ -0,0 +1,165 @@
+"""
+Module du stockage en colonnes des locations.
+
+Les champs utilisés par les calculs d'occupation de la flotte sont
+recopiés dans des tableaux typés (module array), une ligne par location:
+un calcul sur une période parcourt quelques tableaux compacts plutôt que
+tous les objets Rental. Si NumPy est installé, les calculs sont
+vectorisés; sinon, une boucle Python équivalente est utilisée.
+
+Le chiffre d'affaires et les nombres de locations par statut n'y figurent
+pas: ils sont déjà tenus à jour par RevenueAggregates et RentalIndex,
+dont la lecture ne dépend pas du nombre de locations.
+"""
+
+from array import array
+from datetime import date
+from typing import Dict, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel
+    np = None
+
+from models.rental import Rental, RentalStatus
+
+# Code numérique de chaque statut dans la colonne des statuts
+_STATUS_CODES: Dict[RentalStatus, int] = {status: code for code, status in enumerate(RentalStatus)}
+_ACTIVE = _STATUS_CODES[RentalStatus.ACTIVE]
+_COMPLETED = _STATUS_CODES[RentalStatus.COMPLETED]
+_CANCELLED = _STATUS_CODES[RentalStatus.CANCELLED]
+
+
+class RentalColumns:
+    """
+    Miroir en colonnes des locations du système.
+    
+    Colonnes: dates de début, de fin prévue et de retour (numéros de jour,
+    0 si pas de retour), code de statut et clé entière du véhicule. Une
+    location conserve sa ligne; update() la réécrit après un changement
+    de statut, une prolongation ou une clôture.
+    """
+    
+    def __init__(self):
+        self._rows: Dict[str, int] = {}
+        self._start = array('l')
+        self._end = array('l')
+        self._return = array('l')
+        self._status = array('b')
+        self._vehicle = array('l')
+        self._vehicle_keys: Dict[str, int] = {}
+        self._vehicle_ids: List[str] = []
+    
+    @property
+    def vectorized(self) -> bool:
+        """Indique si les calculs utilisent NumPy."""
+        return np is not None
+    
+    def add(self, rental: Rental) -> None:
+        """Ajoute une location (ou réécrit sa ligne si elle existe déjà)."""
+        if rental.id in self._rows:
+            self.update(rental)
+            return
+        
+        vehicle_key = self._vehicle_keys.get(rental.vehicle_id)
+        if vehicle_key is None:
+            vehicle_key = self._vehicle_keys[rental.vehicle_id] = len(self._vehicle_ids)
+            self._vehicle_ids.append(rental.vehicle_id)
+        
+        self._rows[rental.id] = len(self._start)
+        self._start.append(rental.start_date.toordinal())
+        self._end.append(rental.end_date.toordinal())
+        self._return.append(self._return_ordinal(rental))
+        self._status.append(_STATUS_CODES[rental.status])
+        self._vehicle.append(vehicle_key)
+    
+    def update(self, rental: Rental) -> bool:
+        """
+        Réécrit les champs modifiables d'une location.
+        
+        Returns:
+            True si la location était enregistrée
+        """
+        row = self._rows.get(rental.id)
+        if row is None:
+            return False
+        self._end[row] = rental.end_date.toordinal()
+        self._return[row] = self._return_ordinal(rental)
+        self._status[row] = _STATUS_CODES[rental.status]
+        return True
+    
+    @staticmethod
+    def _return_ordinal(rental: Rental) -> int:
+        return_date = rental.actual_return_date
+        return return_date.toordinal() if return_date else 0
+    
+    def booked_days(
+        self,
+        start_date: date,
+        end_date: date,
+        today: Optional[date] = None
+    ) -> Dict[str, int]:
+        """
+        Compte les jours de location de chaque véhicule sur une période.
+        
+        Une location occupe son véhicule du début jusqu'au retour effectif
+        (terminée), jusqu'à la fin prévue (réservée) ou jusqu'à aujourd'hui
+        au moins (en cours, éventuellement en retard). Les locations
+        annulées sont ignorées.
+        
+        Args:
+            start_date: Premier jour de la période
+            end_date: Dernier jour de la période (inclus)
+            today: Date du jour (aujourd'hui par défaut)
+        
+        Returns:
+            Dictionnaire {vehicle_id: jours loués} des véhicules loués
+        """
+        first = start_date.toordinal()
+        last = end_date.toordinal()
+        current = (today or date.today()).toordinal()
+        
+        # Copies de même longueur: une ligne ajoutée entre-temps est ignorée
+        count = len(self._start)
+        columns = [column[:count] for column in
+                   (self._start, self._end, self._return, self._status, self._vehicle)]
+        
+        if np is not None:
+            totals = self._booked_days_numpy(columns, first, last, current)
+        else:
+            totals = self._booked_days_python(columns, first, last, current)
+        return {self._vehicle_ids[key]: days for key, days in totals.items() if days}
+    
+    @staticmethod
+    def _booked_days_numpy(columns: List[array], first: int, last: int, current: int) -> Dict[int, int]:
+        """Calcul vectorisé des jours loués par clé de véhicule."""
+        starts, ends, returns, statuses, vehicles = (
+            np.frombuffer(column, dtype=column.typecode) for column in columns
+        )
+        ends = np.where(statuses == _ACTIVE, np.maximum(ends, current), ends)
+        ends = np.where(statuses == _COMPLETED, returns, ends)
+        
+        days = np.minimum(ends, last) - np.maximum(starts, first) + 1
+        days = np.where(statuses == _CANCELLED, 0, np.maximum(days, 0))
+        
+        totals = np.bincount(vehicles, weights=days)
+        return {key: int(total) for key, total in enumerate(totals)}
+    
+    @staticmethod
+    def _booked_days_python(columns: List[array], first: int, last: int, current: int) -> Dict[int, int]:
+        """Calcul équivalent sans NumPy."""
+        totals: Dict[int, int] = {}
+        for start, end, returned, status, vehicle in zip(*columns):
+            if status == _CANCELLED:
+                continue
+            if status == _COMPLETED:
+                end = returned
+            elif status == _ACTIVE and end < current:
+                end = current
+            days = min(end, last) - max(start, first) + 1
+            if days > 0:
+                totals[vehicle] = totals.get(vehicle, 0) + days
+        return totals
+    
+    def __len__(self) -> int:
+        return len(self._start)
@@ -3,7 +3,7 @@ Module de gestion des clients.
 """
 
 from datetime import date, datetime
-from typing import Optional, List, Set
+from typing import Any, Dict, Optional, List, Set
 import uuid
 
 # Constantes locales pour éviter les imports circulaires
@@ -45,6 +45,14 @@ class Customer:
         rental_history (List[str]): Historique des IDs de locations
     """
     
+    # Attributs fixes: pas de __dict__ par instance
+    __slots__ = (
+        '_id', '_first_name', '_last_name', '_birth_date', '_license_number',
+        '_license_types', '_license_date', '_email', '_phone', '_address',
+        '_rental_history', '_active_rentals', '_created_at', '_is_blocked',
+        '_blocked_reason', '_dirty', '_derived_day', '_derived'
+    )
+    
     def __init__(
         self,
         first_name: str,
@@ -73,6 +81,11 @@ class Customer:
         self._created_at = datetime.now()
         self._is_blocked = False
         self._blocked_reason: Optional[str] = None
+        self._dirty = True
+        
+        # Valeurs dérivées (âge, fidélité...) mémorisées pour la journée
+        self._derived_day: Optional[date] = None
+        self._derived: Dict[Any, Any] = {}
     
     # Propriétés
     @property
@@ -86,6 +99,7 @@ class Customer:
     @first_name.setter
     def first_name(self, value: str):
         self._first_name = value
+        self._dirty = True
     
     @property
     def last_name(self) -> str:
@@ -94,6 +108,7 @@ class Customer:
     @last_name.setter
     def last_name(self, value: str):
         self._last_name = value
+        self._dirty = True
     
     @property
     def full_name(self) -> str:
@@ -106,7 +121,10 @@ class Customer:
     @property
     def age(self) -> int:
         """Calcule l'âge actuel du client."""
-        return _calculate_years_difference(self._birth_date)
+        derived = self._derived_values()
+        if 'age' not in derived:
+            derived['age'] = _calculate_years_difference(self._birth_date, self._derived_day)
+        return derived['age']
     
     @property
     def license_number(self) -> str:
@@ -123,7 +141,12 @@ class Customer:
     @property
     def years_of_license(self) -> int:
         """Calcule le nombre d'années depuis l'obtention du permis."""
-        return _calculate_years_difference(self._license_date)
+        derived = self._derived_values()
+        if 'years_of_license' not in derived:
+            derived['years_of_license'] = _calculate_years_difference(
+                self._license_date, self._derived_day
+            )
+        return derived['years_of_license']
     
     @property
     def email(self) -> str:
@@ -132,6 +155,7 @@ class Customer:
     @email.setter
     def email(self, value: str):
         self._email = value
+        self._dirty = True
     
     @property
     def phone(self) -> str:
@@ -140,6 +164,7 @@ class Customer:
     @phone.setter
     def phone(self, value: str):
         self._phone = value
+        self._dirty = True
     
     @property
     def address(self) -> str:
@@ -148,6 +173,7 @@ class Customer:
     @address.setter
     def address(self, value: str):
         self._address = value
+        self._dirty = True
     
     @property
     def rental_history(self) -> List[str]:
@@ -165,10 +191,37 @@ class Customer:
     def blocked_reason(self) -> Optional[str]:
         return self._blocked_reason
     
+    @property
+    def is_dirty(self) -> bool:
+        """Indique si le client a été modifié depuis la dernière sauvegarde."""
+        return self._dirty
+    
+    def mark_clean(self) -> None:
+        """Marque le client comme sauvegardé."""
+        self._dirty = False
+    
+    def _derived_values(self) -> Dict[Any, Any]:
+        """
+        Retourne le cache des valeurs dérivées, vidé au changement de jour.
+        
+        Les valeurs qui dépendent de l'historique sont aussi oubliées à
+        chaque modification de celui-ci (_invalidate_derived).
+        """
+        today = date.today()
+        if self._derived_day != today:
+            self._derived_day = today
+            self._derived = {}
+        return self._derived
+    
+    def _invalidate_derived(self) -> None:
+        """Oublie les valeurs dérivées mémorisées."""
+        self._derived_day = None
+    
     # Méthodes
     def add_license_type(self, license_type: str) -> None:
         """Ajoute un type de permis au client."""
         self._license_types.add(license_type.upper())
+        self._dirty = True
     
     def has_license(self, license_type: str) -> bool:
         """Vérifie si le client possède un type de permis spécifique."""
@@ -239,11 +292,15 @@ class Customer:
         """Ajoute une location à l'historique et aux locations actives."""
         self._rental_history.append(rental_id)
         self._active_rentals.append(rental_id)
+        self._invalidate_derived()
+        self._dirty = True
     
     def complete_rental(self, rental_id: str) -> bool:
         """Marque une location comme terminée."""
         if rental_id in self._active_rentals:
             self._active_rentals.remove(rental_id)
+            self._invalidate_derived()
+            self._dirty = True
             return True
         return False
     
@@ -255,11 +312,13 @@ class Customer:
         """Bloque le client avec une raison."""
         self._is_blocked = True
         self._blocked_reason = reason
+        self._dirty = True
     
     def unblock(self) -> None:
         """Débloque le client."""
         self._is_blocked = False
         self._blocked_reason = None
+        self._dirty = True
     
     def restore_state(
         self,
@@ -283,10 +342,16 @@ class Customer:
         self._active_rentals = list(active_rentals)
         self._is_blocked = is_blocked
         self._blocked_reason = blocked_reason
+        self._invalidate_derived()
+        self._dirty = True
     
     def is_loyal_customer(self, min_rentals: int = _LOYALTY_TIER_1_RENTALS) -> bool:
         """Vérifie si le client est un client fidèle."""
-        return len(self._rental_history) >= min_rentals
+        derived = self._derived_values()
+        key = ('loyal', min_rentals)
+        if key not in derived:
+            derived[key] = len(self._rental_history) >= min_rentals
+        return derived[key]
     
     def get_loyalty_discount(self) -> float:
         """
@@ -295,14 +360,19 @@ class Customer:
         Returns:
             Pourcentage de réduction (0.0 à 0.15)
         """
-        total_rentals = len(self._rental_history)
-        if total_rentals >= _LOYALTY_TIER_3_RENTALS:
-            return _LOYALTY_TIER_3_DISCOUNT
-        elif total_rentals >= _LOYALTY_TIER_2_RENTALS:
-            return _LOYALTY_TIER_2_DISCOUNT
-        elif total_rentals >= _LOYALTY_TIER_1_RENTALS:
-            return _LOYALTY_TIER_1_DISCOUNT
-        return 0.0
+        derived = self._derived_values()
+        if 'loyalty_discount' not in derived:
+            total_rentals = len(self._rental_history)
+            if total_rentals >= _LOYALTY_TIER_3_RENTALS:
+                discount = _LOYALTY_TIER_3_DISCOUNT
+            elif total_rentals >= _LOYALTY_TIER_2_RENTALS:
+                discount = _LOYALTY_TIER_2_DISCOUNT
+            elif total_rentals >= _LOYALTY_TIER_1_RENTALS:
+                discount = _LOYALTY_TIER_1_DISCOUNT
+            else:
+                discount = 0.0
+            derived['loyalty_discount'] = discount
+        return derived['loyalty_discount']
     
     def __str__(self) -> str:
         return f"Client {self._id}: {self.full_name} ({self.age} ans)"
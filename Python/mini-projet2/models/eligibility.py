@@ -0,0 +1,116 @@
+"""
+Module de l'éligibilité des clients aux véhicules.
+
+L'éligibilité d'un client ne dépend que de la classe d'exigences d'un
+véhicule (permis requis, âge minimum): elle est évaluée une fois par
+client et par classe, puis conservée jusqu'au changement de jour ou
+jusqu'à une modification du client (permis, dates, blocage).
+"""
+
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from models.customer import Customer
+from models.vehicle import Vehicle
+
+# Classe d'exigences d'un véhicule: (permis requis, âge minimum)
+Requirement = Tuple[str, int]
+
+
+class EligibilityService:
+    """
+    Cache des éligibilités client × classe de véhicule.
+    
+    Chaque client est associé à une empreinte des données dont dépend son
+    éligibilité; si elle change (permis ajouté, client bloqué...), ses
+    résultats sont recalculés. Tout le cache est vidé au changement de
+    jour, l'âge et l'ancienneté du permis pouvant alors évoluer.
+    """
+    
+    def __init__(self):
+        self._day: Optional[date] = None
+        self._fingerprints: Dict[str, Tuple] = {}
+        self._results: Dict[str, Dict[Requirement, Tuple[bool, str]]] = {}
+        self._evaluations = 0
+    
+    @property
+    def evaluations(self) -> int:
+        """Nombre d'évaluations effectives (hors cache)."""
+        return self._evaluations
+    
+    @staticmethod
+    def requirement_of(vehicle: Vehicle) -> Requirement:
+        """Retourne la classe d'exigences d'un véhicule."""
+        return vehicle.get_required_license(), vehicle.get_minimum_driver_age()
+    
+    @staticmethod
+    def _fingerprint(customer: Customer) -> Tuple:
+        """Données du client dont dépend son éligibilité."""
+        return (
+            frozenset(customer.license_types),
+            customer.license_date,
+            customer.birth_date,
+            customer.is_blocked,
+            customer.blocked_reason
+        )
+    
+    def check(self, customer: Customer, requirement: Requirement) -> Tuple[bool, str]:
+        """
+        Vérifie si un client satisfait une classe d'exigences.
+        
+        Returns:
+            Tuple (peut_louer: bool, raison: str), comme can_rent_vehicle
+        """
+        today = date.today()
+        if today != self._day:
+            self.invalidate()
+            self._day = today
+        
+        fingerprint = self._fingerprint(customer)
+        if self._fingerprints.get(customer.id) != fingerprint:
+            self._fingerprints[customer.id] = fingerprint
+            self._results[customer.id] = {}
+        
+        results = self._results[customer.id]
+        result = results.get(requirement)
+        if result is None:
+            result = customer.can_rent_vehicle(*requirement)
+            results[requirement] = result
+            self._evaluations += 1
+        return result
+    
+    def can_rent(self, customer: Customer, vehicle: Vehicle) -> Tuple[bool, str]:
+        """Vérifie si un client peut louer un véhicule."""
+        return self.check(customer, self.requirement_of(vehicle))
+    
+    def filter_vehicles(self, customer: Customer, vehicles: Iterable[Vehicle]) -> List[Vehicle]:
+        """
+        Retourne les véhicules qu'un client peut louer.
+        
+        Les véhicules sont regroupés par classe d'exigences: le client est
+        évalué une seule fois par classe.
+        """
+        allowed_by_class: Dict[Requirement, bool] = {}
+        eligible = []
+        for vehicle in vehicles:
+            requirement = self.requirement_of(vehicle)
+            allowed = allowed_by_class.get(requirement)
+            if allowed is None:
+                allowed = allowed_by_class[requirement] = self.check(customer, requirement)[0]
+            if allowed:
+                eligible.append(vehicle)
+        return eligible
+    
+    def invalidate(self, customer_id: Optional[str] = None) -> None:
+        """
+        Oublie les résultats d'un client, ou de tous les clients.
+        
+        Args:
+            customer_id: ID du client (None pour vider tout le cache)
+        """
+        if customer_id is None:
+            self._fingerprints.clear()
+            self._results.clear()
+        else:
+            self._fingerprints.pop(customer_id, None)
+            self._results.pop(customer_id, None)
@@ -0,0 +1,193 @@
+"""
+Module des notifications de changement du système de location.
+
+Le système publie des événements typés à chaque modification; les
+abonnés les reçoivent par lots, ce qui permet à l'interface de ne mettre
+à jour que les lignes concernées.
+"""
+
+from contextlib import contextmanager
+from enum import Enum
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+class ChangeType(Enum):
+    """Types de changements publiés par le système."""
+    VEHICLE_ADDED = "vehicle_added"
+    VEHICLE_REMOVED = "vehicle_removed"
+    VEHICLE_UPDATED = "vehicle_updated"
+    CUSTOMER_ADDED = "customer_added"
+    CUSTOMER_REMOVED = "customer_removed"
+    CUSTOMER_UPDATED = "customer_updated"
+    CUSTOMER_BLOCKED = "customer_blocked"
+    CUSTOMER_UNBLOCKED = "customer_unblocked"
+    RENTAL_CREATED = "rental_created"
+    RENTAL_STATUS_CHANGED = "rental_status_changed"
+    RENTAL_UPDATED = "rental_updated"
+    DATA_RESTORED = "data_restored"
+    DATA_CHANGED = "data_changed"
+
+
+# Un ajout rend superflues les mises à jour de la même entité dans le lot
+_CREATION_TYPES = {
+    ChangeType.VEHICLE_ADDED: (ChangeType.VEHICLE_UPDATED,),
+    ChangeType.CUSTOMER_ADDED: (ChangeType.CUSTOMER_UPDATED,),
+    ChangeType.RENTAL_CREATED: (ChangeType.RENTAL_UPDATED, ChangeType.RENTAL_STATUS_CHANGED),
+}
+
+
+class ChangeEvent:
+    """
+    Événement de changement.
+    
+    Attributes:
+        change_type (ChangeType): Nature du changement
+        entity_id (str): ID de l'entité concernée (None pour un changement global)
+        details (dict): Informations complémentaires (ancien statut, IDs liés...)
+    """
+    
+    def __init__(self, change_type: ChangeType, entity_id: Optional[str] = None, **details: Any):
+        self.change_type = change_type
+        self.entity_id = entity_id
+        self.details = details
+    
+    @property
+    def key(self) -> Tuple[ChangeType, Optional[str]]:
+        """Clé de regroupement: type et entité."""
+        return self.change_type, self.entity_id
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ChangeEvent):
+            return NotImplemented
+        return self.key == other.key and self.details == other.details
+    
+    def __repr__(self) -> str:
+        return f"ChangeEvent({self.change_type.name}, {self.entity_id!r}, {self.details})"
+
+
+class EventBus:
+    """
+    Bus d'événements avec regroupement des rafales.
+    
+    Les événements publiés sont mis en attente puis livrés en un seul lot
+    à chaque abonné:
+    - dans un bloc batch(), à la sortie du bloc le plus externe;
+    - avec un planificateur (ex: QTimer.singleShot(0, ...)), au prochain
+      tour de la boucle d'événements;
+    - sinon, immédiatement.
+    
+    Dans un lot, les doublons (même type, même entité) sont fusionnés en
+    gardant les détails les plus récents (sauf les valeurs d'origine old_*)
+    et la position de la dernière occurrence, et les mises à jour d'une
+    entité créée dans le même lot sont omises.
+    """
+    
+    def __init__(self):
+        self._subscribers: List[Callable[[List[ChangeEvent]], None]] = []
+        self._pending: List[ChangeEvent] = []
+        self._batch_depth = 0
+        self._scheduler: Optional[Callable[[Callable[[], None]], None]] = None
+        self._flush_scheduled = False
+        self._batches_delivered = 0
+    
+    @property
+    def batches_delivered(self) -> int:
+        """Nombre de lots livrés aux abonnés."""
+        return self._batches_delivered
+    
+    def subscribe(self, callback: Callable[[List[ChangeEvent]], None]) -> None:
+        """Abonne une fonction qui recevra chaque lot d'événements."""
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+    
+    def unsubscribe(self, callback: Callable[[List[ChangeEvent]], None]) -> bool:
+        """
+        Désabonne une fonction.
+        
+        Returns:
+            True si la fonction était abonnée
+        """
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+            return True
+        return False
+    
+    def set_scheduler(self, scheduler: Optional[Callable[[Callable[[], None]], None]]) -> None:
+        """
+        Définit la fonction qui diffère la livraison des événements.
+        
+        Args:
+            scheduler: Reçoit la fonction de livraison à appeler plus tard
+                (None pour une livraison immédiate)
+        """
+        self._scheduler = scheduler
+    
+    def publish(self, event: ChangeEvent) -> None:
+        """Publie un événement."""
+        self._pending.append(event)
+        if self._batch_depth == 0:
+            self._dispatch()
+    
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Regroupe les événements publiés dans le bloc en un seul lot."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._pending:
+                self._dispatch()
+    
+    def _dispatch(self) -> None:
+        """Livre les événements en attente ou planifie leur livraison."""
+        if self._scheduler is None:
+            self.flush()
+        elif not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._scheduler(self.flush)
+    
+    def flush(self) -> None:
+        """Livre immédiatement les événements en attente."""
+        self._flush_scheduled = False
+        if not self._pending:
+            return
+        
+        events = self.coalesce(self._pending)
+        self._pending = []
+        self._batches_delivered += 1
+        for callback in list(self._subscribers):
+            callback(events)
+    
+    @staticmethod
+    def coalesce(events: List[ChangeEvent]) -> List[ChangeEvent]:
+        """
+        Fusionne un lot d'événements.
+        
+        Un événement fusionné prend la place de sa dernière occurrence: une
+        suite ajout → suppression → ajout d'une même entité est livrée
+        suppression puis ajout, ce qui laisse l'abonné dans l'état final.
+        
+        Returns:
+            Événements dans l'ordre de leur dernière occurrence
+        """
+        merged: Dict[Tuple[ChangeType, Optional[str]], ChangeEvent] = {}
+        for event in events:
+            previous = merged.get(event.key)
+            if previous is None:
+                merged[event.key] = ChangeEvent(event.change_type, event.entity_id, **event.details)
+                continue
+            # Les valeurs d'origine (old_*) restent celles du premier événement
+            for name, value in event.details.items():
+                if not name.startswith("old_") or name not in previous.details:
+                    previous.details[name] = value
+            # Déplacer l'événement à la position de sa dernière occurrence
+            del merged[event.key]
+            merged[event.key] = previous
+        
+        redundant = {
+            (update_type, event.entity_id)
+            for event in merged.values()
+            for update_type in _CREATION_TYPES.get(event.change_type, ())
+        }
+        return [event for key, event in merged.items() if key not in redundant]
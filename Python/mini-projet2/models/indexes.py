@@ -0,0 +1,580 @@
+"""
+Module d'index en mémoire pour le système de location.
+Évite de parcourir tout l'historique des locations à chaque requête.
+"""
+
+import heapq
+from bisect import bisect_left, bisect_right
+from calendar import monthrange
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from models.rental import Rental, RentalStatus
+from models.utils import normalize_search_text
+
+
+class VehicleBookingIndex:
+    """
+    Index des réservations en cours par véhicule.
+    
+    Pour chaque véhicule, conserve les locations réservées ou actives
+    triées par date de début. Les réservations d'un même véhicule ne se
+    chevauchent pas (garanti par CarRentalSystem), elles sont donc aussi
+    triées par date de fin: un test de chevauchement se fait en O(log n).
+    
+    La date de fin est lue directement sur la location, une prolongation
+    ne nécessite donc pas de réindexation.
+    """
+    
+    def __init__(self):
+        self._starts: Dict[str, List[date]] = {}
+        self._bookings: Dict[str, List[Rental]] = {}
+    
+    def add(self, rental: Rental) -> None:
+        """Indexe une location réservée ou active."""
+        starts = self._starts.setdefault(rental.vehicle_id, [])
+        bookings = self._bookings.setdefault(rental.vehicle_id, [])
+        
+        position = bisect_right(starts, rental.start_date)
+        starts.insert(position, rental.start_date)
+        bookings.insert(position, rental)
+    
+    def remove(self, rental: Rental) -> bool:
+        """
+        Retire une location de l'index.
+        
+        Returns:
+            True si la location était indexée
+        """
+        starts = self._starts.get(rental.vehicle_id)
+        if not starts:
+            return False
+        
+        bookings = self._bookings[rental.vehicle_id]
+        position = bisect_left(starts, rental.start_date)
+        while position < len(starts) and starts[position] == rental.start_date:
+            if bookings[position].id == rental.id:
+                del starts[position]
+                del bookings[position]
+                if not starts:
+                    del self._starts[rental.vehicle_id]
+                    del self._bookings[rental.vehicle_id]
+                return True
+            position += 1
+        return False
+    
+    def is_available(self, vehicle_id: str, start_date: date, end_date: date) -> bool:
+        """Vérifie qu'aucune réservation ne chevauche la période donnée."""
+        return self.find_conflict(vehicle_id, start_date, end_date) is None
+    
+    def get_bookings(self, vehicle_id: str) -> List[Rental]:
+        """Retourne les réservations d'un véhicule triées par date de début."""
+        return list(self._bookings.get(vehicle_id, []))
+    
+    def find_conflict(
+        self,
+        vehicle_id: str,
+        start_date: date,
+        end_date: date
+    ) -> Optional[Rental]:
+        """Retourne la réservation en conflit avec la période, s'il y en a une."""
+        starts = self._starts.get(vehicle_id)
+        if not starts:
+            return None
+        
+        # Parmi les réservations commençant au plus tard à end_date,
+        # la dernière est celle qui se termine le plus tard
+        position = bisect_right(starts, end_date)
+        if position == 0:
+            return None
+        
+        candidate = self._bookings[vehicle_id][position - 1]
+        if candidate.end_date >= start_date:
+            return candidate
+        return None
+    
+    def free_windows(
+        self,
+        vehicle_id: str,
+        start_date: date,
+        end_date: date,
+        min_days: int = 1
+    ) -> List[Tuple[date, date]]:
+        """
+        Retourne les créneaux libres d'un véhicule sur un horizon.
+        
+        Balaye une seule fois les réservations triées du véhicule: les
+        créneaux sont les trous entre réservations consécutives.
+        
+        Args:
+            vehicle_id: ID du véhicule
+            start_date: Début de l'horizon (inclus)
+            end_date: Fin de l'horizon (incluse)
+            min_days: Durée minimale d'un créneau en jours
+        
+        Returns:
+            Liste de couples (début, fin) inclusifs, triés chronologiquement
+        """
+        windows = []
+        starts = self._starts.get(vehicle_id, [])
+        bookings = self._bookings.get(vehicle_id, [])
+        
+        # La réservation qui précède l'horizon peut encore le chevaucher
+        position = max(bisect_right(starts, start_date) - 1, 0)
+        cursor = start_date
+        
+        for booking in bookings[position:]:
+            if booking.start_date > end_date:
+                break
+            if booking.start_date > cursor:
+                windows.append((cursor, booking.start_date - timedelta(days=1)))
+            cursor = max(cursor, booking.end_date + timedelta(days=1))
+        
+        if cursor <= end_date:
+            windows.append((cursor, end_date))
+        
+        return [
+            (window_start, window_end) for window_start, window_end in windows
+            if (window_end - window_start).days + 1 >= min_days
+        ]
+    
+    def __len__(self) -> int:
+        return sum(len(bookings) for bookings in self._bookings.values())
+
+
+class RentalIndex:
+    """
+    Index secondaires des locations par client, par véhicule et par statut.
+    
+    Chaque index associe une clé à l'ensemble ordonné (ordre d'insertion)
+    des IDs de locations correspondantes. Les recherches sont ainsi
+    proportionnelles à la taille du résultat et non à l'historique complet.
+    
+    Un tas (max-heap paresseux) suit le nombre de locations par véhicule
+    pour obtenir le véhicule le plus loué sans tout recompter.
+    """
+    
+    def __init__(self):
+        self._by_customer: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self._by_vehicle: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self._by_status: Dict[RentalStatus, Dict[str, None]] = defaultdict(dict)
+        self._vehicle_order: Dict[str, int] = {}
+        self._vehicle_heap: List[Tuple[int, int, str]] = []
+    
+    def add(self, rental: Rental) -> None:
+        """Indexe une nouvelle location."""
+        self._by_customer[rental.customer_id][rental.id] = None
+        self._by_vehicle[rental.vehicle_id][rental.id] = None
+        self._by_status[rental.status][rental.id] = None
+        
+        # Les entrées périmées du tas sont ignorées à la lecture
+        order = self._vehicle_order.setdefault(rental.vehicle_id, len(self._vehicle_order))
+        count = len(self._by_vehicle[rental.vehicle_id])
+        heapq.heappush(self._vehicle_heap, (-count, order, rental.vehicle_id))
+    
+    def update_status(self, rental: Rental, old_status: RentalStatus) -> None:
+        """Déplace une location après un changement de statut."""
+        if rental.status == old_status:
+            return
+        self._by_status[old_status].pop(rental.id, None)
+        self._by_status[rental.status][rental.id] = None
+    
+    def customer_rental_ids(self, customer_id: str) -> List[str]:
+        """Retourne les IDs des locations d'un client."""
+        return list(self._by_customer.get(customer_id, ()))
+    
+    def vehicle_rental_ids(self, vehicle_id: str) -> List[str]:
+        """Retourne les IDs des locations d'un véhicule."""
+        return list(self._by_vehicle.get(vehicle_id, ()))
+    
+    def status_rental_ids(self, status: RentalStatus) -> List[str]:
+        """Retourne les IDs des locations ayant un statut donné."""
+        return list(self._by_status.get(status, ()))
+    
+    def count_by_status(self, status: RentalStatus) -> int:
+        """Retourne le nombre de locations ayant un statut donné."""
+        return len(self._by_status.get(status, ()))
+    
+    def count_by_vehicle(self, vehicle_id: str) -> int:
+        """Retourne le nombre de locations d'un véhicule."""
+        return len(self._by_vehicle.get(vehicle_id, ()))
+    
+    def count_by_customer(self, customer_id: str) -> int:
+        """Retourne le nombre de locations d'un client."""
+        return len(self._by_customer.get(customer_id, ()))
+    
+    def most_rented_vehicle(self) -> Optional[Tuple[str, int]]:
+        """
+        Retourne le véhicule le plus loué et son nombre de locations.
+        
+        En cas d'égalité, le véhicule loué en premier l'emporte.
+        """
+        heap = self._vehicle_heap
+        while heap:
+            negative_count, _, vehicle_id = heap[0]
+            if -negative_count == self.count_by_vehicle(vehicle_id):
+                return vehicle_id, -negative_count
+            heapq.heappop(heap)
+        return None
+
+
+class MaintenanceQueue:
+    """
+    File de priorité des véhicules par kilomètres restants avant entretien.
+    
+    Un tas (min-heap paresseux) contient une entrée par mise à jour; seule
+    l'entrée correspondant à la valeur courante d'un véhicule est valide,
+    les autres sont ignorées à la lecture puis éliminées par compactage.
+    La lecture ne modifie pas le tas: elle peut s'exécuter hors du thread
+    qui effectue les mises à jour.
+    """
+    
+    def __init__(self):
+        self._remaining: Dict[str, float] = {}
+        self._order: Dict[str, int] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+    
+    def update(self, vehicle) -> None:
+        """Met à jour un véhicule (après un retour, un entretien...)."""
+        remaining = vehicle.km_until_maintenance()
+        if self._remaining.get(vehicle.id) == remaining:
+            return
+        self._remaining[vehicle.id] = remaining
+        order = self._order.setdefault(vehicle.id, len(self._order))
+        heapq.heappush(self._heap, (remaining, order, vehicle.id))
+        
+        # Les entrées périmées ne doivent pas dominer le tas
+        if len(self._heap) > 2 * len(self._remaining) + 16:
+            self._compact()
+    
+    def remove(self, vehicle_id: str) -> None:
+        """Retire un véhicule de la file."""
+        self._remaining.pop(vehicle_id, None)
+    
+    def _compact(self) -> None:
+        """Reconstruit le tas avec les seules entrées valides."""
+        heap = [
+            (remaining, self._order[vehicle_id], vehicle_id)
+            for vehicle_id, remaining in self._remaining.items()
+        ]
+        heapq.heapify(heap)
+        # Nouvelle liste: un lecteur en cours garde l'ancienne
+        self._heap = heap
+    
+    def due_within(self, km: float = 0.0) -> List[Tuple[str, float]]:
+        """
+        Véhicules dont l'entretien est dû dans moins de km kilomètres.
+        
+        Le tas est parcouru à partir de sa racine sans être modifié, en
+        O(k log n) pour k résultats (hors entrées périmées).
+        
+        Returns:
+            Liste de tuples (ID du véhicule, kilomètres restants), du plus
+            urgent au moins urgent
+        """
+        heap = self._heap
+        if not heap:
+            return []
+        
+        due = []
+        seen = set()
+        frontier = [(heap[0], 0)]
+        while frontier:
+            (remaining, _, vehicle_id), position = heapq.heappop(frontier)
+            if remaining > km:
+                break
+            if vehicle_id not in seen and self._remaining.get(vehicle_id) == remaining:
+                seen.add(vehicle_id)
+                due.append((vehicle_id, remaining))
+            for child in (2 * position + 1, 2 * position + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+        return due
+    
+    def __len__(self) -> int:
+        return len(self._remaining)
+
+
+class SearchIndex:
+    """
+    Index de recherche textuelle par trigrammes.
+    
+    Les champs de chaque document sont normalisés une seule fois (sans
+    accents, en minuscules) et chacun de leurs trigrammes pointe vers les
+    documents qui le contiennent. Une requête ne vérifie que les documents
+    possédant tous les trigrammes de ses termes; les termes de moins de
+    trois caractères sont vérifiés sur les textes déjà normalisés.
+    """
+    
+    GRAM_SIZE = 3
+    
+    def __init__(self, fields: Tuple[str, ...]):
+        self._fields = fields
+        self._documents: Dict[str, Dict[str, str]] = {}
+        self._order: Dict[str, int] = {}
+        self._grams: Dict[str, Set[str]] = defaultdict(set)
+        self._next_order = 0
+    
+    def _document_grams(self, texts: Dict[str, str]) -> Set[str]:
+        """Trigrammes de tous les champs d'un document."""
+        size = self.GRAM_SIZE
+        return {
+            text[i:i + size]
+            for text in texts.values()
+            for i in range(len(text) - size + 1)
+        }
+    
+    def add(self, doc_id: str, values: Dict[str, str]) -> None:
+        """
+        Indexe (ou réindexe) un document.
+        
+        Args:
+            doc_id: Identifiant du document
+            values: Valeurs des champs {champ: texte}
+        """
+        if doc_id in self._documents:
+            self._drop(doc_id)
+        else:
+            self._order[doc_id] = self._next_order
+            self._next_order += 1
+        
+        texts = {field: normalize_search_text(values.get(field) or "") for field in self._fields}
+        self._documents[doc_id] = texts
+        for gram in self._document_grams(texts):
+            self._grams[gram].add(doc_id)
+    
+    def remove(self, doc_id: str) -> bool:
+        """
+        Retire un document de l'index.
+        
+        Returns:
+            True si le document était indexé
+        """
+        if doc_id not in self._documents:
+            return False
+        self._drop(doc_id)
+        del self._order[doc_id]
+        return True
+    
+    def _drop(self, doc_id: str) -> None:
+        """Retire les trigrammes et les textes d'un document."""
+        for gram in self._document_grams(self._documents.pop(doc_id)):
+            postings = self._grams[gram]
+            postings.discard(doc_id)
+            if not postings:
+                del self._grams[gram]
+    
+    def _candidates(self, term: str) -> Optional[Set[str]]:
+        """Documents contenant tous les trigrammes d'un terme (None: tous)."""
+        size = self.GRAM_SIZE
+        if len(term) < size:
+            return None
+        
+        postings = []
+        for i in range(len(term) - size + 1):
+            gram_postings = self._grams.get(term[i:i + size])
+            if not gram_postings:
+                return set()
+            postings.append(gram_postings)
+        
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for gram_postings in postings[1:]:
+            candidates &= gram_postings
+        return candidates
+    
+    @staticmethod
+    def _term_score(text: str, term: str) -> int:
+        """
+        Score d'un terme dans un champ.
+        
+        Returns:
+            3 si le champ est égal au terme, 2 si un mot du champ commence
+            par le terme, 1 si le terme apparaît ailleurs, 0 sinon
+        """
+        if text == term:
+            return 3
+        position = text.find(term)
+        if position < 0:
+            return 0
+        while position >= 0:
+            if position == 0 or not text[position - 1].isalnum():
+                return 2
+            position = text.find(term, position + 1)
+        return 1
+    
+    def search(
+        self,
+        query: str,
+        fields: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None
+    ) -> List[str]:
+        """
+        Recherche les documents contenant tous les termes de la requête.
+        
+        Args:
+            query: Texte recherché (accents et casse ignorés)
+            fields: Champs dans lesquels chercher (tous par défaut)
+            limit: Nombre maximum de résultats
+            
+        Returns:
+            IDs des documents, les plus pertinents en premier (à
+            pertinence égale, dans l'ordre d'indexation)
+        """
+        terms = normalize_search_text(query).split()
+        if not terms:
+            ids = list(self._documents)
+            return ids[:limit] if limit is not None else ids
+        
+        fields = tuple(fields) if fields is not None else self._fields
+        
+        candidates: Optional[Set[str]] = None
+        for term in sorted(terms, key=len, reverse=True):
+            term_candidates = self._candidates(term)
+            if term_candidates is None:
+                continue
+            candidates = term_candidates if candidates is None else candidates & term_candidates
+            if not candidates:
+                return []
+        
+        scored = []
+        for doc_id in (candidates if candidates is not None else self._documents):
+            texts = self._documents[doc_id]
+            total = 0
+            for term in terms:
+                best = max(self._term_score(texts[field], term) for field in fields)
+                if not best:
+                    break
+                total += best
+            else:
+                scored.append((-total, self._order[doc_id], doc_id))
+        
+        if limit is not None:
+            scored = heapq.nsmallest(limit, scored)
+        else:
+            scored.sort()
+        return [doc_id for _, _, doc_id in scored]
+    
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._documents
+    
+    def __len__(self) -> int:
+        return len(self._documents)
+
+
+class _RevenueBucket:
+    """Cumuls de chiffre d'affaires d'un jour ou d'un mois."""
+    
+    def __init__(self):
+        self.revenue = 0.0
+        self.base = 0.0
+        self.penalties = 0.0
+        self.count = 0
+        self.by_type: Dict[str, float] = defaultdict(float)
+    
+    def add(self, revenue: float, base: float, penalty: float,
+            vehicle_type: Optional[str], count: int = 1) -> None:
+        self.revenue += revenue
+        self.base += base
+        self.penalties += penalty
+        self.count += count
+        if vehicle_type:
+            self.by_type[vehicle_type] += revenue
+    
+    def merge(self, other: '_RevenueBucket') -> None:
+        self.add(other.revenue, other.base, other.penalties, None, other.count)
+        for vehicle_type, revenue in other.by_type.items():
+            self.by_type[vehicle_type] += revenue
+
+
+class RevenueAggregates:
+    """
+    Cumuls incrémentaux du chiffre d'affaires des locations terminées.
+    
+    Les montants sont enregistrés à la clôture de chaque location dans un
+    cumul mensuel et un cumul journalier (clé: date de retour effective).
+    Un rapport sur une période additionne les cumuls des mois entièrement
+    couverts et les cumuls journaliers des mois partiels, sans parcourir
+    l'historique des locations.
+    
+    Le chiffre d'affaires total de chaque client et de chaque véhicule est
+    aussi cumulé, pour les classements.
+    """
+    
+    def __init__(self):
+        self._months: Dict[str, _RevenueBucket] = {}
+        self._days: Dict[str, Dict[date, _RevenueBucket]] = defaultdict(dict)
+        self._by_customer: Dict[str, float] = defaultdict(float)
+        self._by_vehicle: Dict[str, float] = defaultdict(float)
+    
+    def record(self, rental: Rental, vehicle_type: Optional[str]) -> None:
+        """Enregistre une location terminée."""
+        return_date = rental.actual_return_date
+        if return_date is None:
+            return
+        
+        revenue = rental.total_cost
+        base = rental.calculate_base_cost()
+        penalty = rental.penalty
+        
+        month_key = return_date.strftime("%Y-%m")
+        self._months.setdefault(month_key, _RevenueBucket()).add(
+            revenue, base, penalty, vehicle_type
+        )
+        self._days[month_key].setdefault(return_date, _RevenueBucket()).add(
+            revenue, base, penalty, vehicle_type
+        )
+        self._by_customer[rental.customer_id] += revenue
+        self._by_vehicle[rental.vehicle_id] += revenue
+    
+    def customer_revenue(self, customer_id: str) -> float:
+        """Retourne le chiffre d'affaires total d'un client."""
+        return self._by_customer.get(customer_id, 0.0)
+    
+    def vehicle_revenue(self, vehicle_id: str) -> float:
+        """Retourne le chiffre d'affaires total d'un véhicule."""
+        return self._by_vehicle.get(vehicle_id, 0.0)
+    
+    def summarize(self, start_date: date, end_date: date) -> Dict:
+        """
+        Agrège le chiffre d'affaires des retours entre deux dates incluses.
+        
+        Returns:
+            Dictionnaire avec les totaux, le détail par type de véhicule
+            et le détail par mois
+        """
+        total = _RevenueBucket()
+        revenue_by_month: Dict[str, float] = {}
+        first_key = start_date.strftime("%Y-%m")
+        last_key = end_date.strftime("%Y-%m")
+        
+        for month_key in sorted(self._months):
+            if not first_key <= month_key <= last_key:
+                continue
+            
+            year, month = int(month_key[:4]), int(month_key[5:])
+            month_start = date(year, month, 1)
+            month_end = date(year, month, monthrange(year, month)[1])
+            
+            if start_date <= month_start and month_end <= end_date:
+                bucket = self._months[month_key]
+            else:
+                # Mois partiellement couvert: sommer les jours concernés
+                bucket = _RevenueBucket()
+                for day, day_bucket in self._days[month_key].items():
+                    if start_date <= day <= end_date:
+                        bucket.merge(day_bucket)
+            
+            if bucket.count:
+                total.merge(bucket)
+                revenue_by_month[month_key] = bucket.revenue
+        
+        return {
+            'total_revenue': total.revenue,
+            'total_base_revenue': total.base,
+            'total_penalties': total.penalties,
+            'total_rentals_completed': total.count,
+            'revenue_by_vehicle_type': dict(total.by_type),
+            'revenue_by_month': revenue_by_month
+        }
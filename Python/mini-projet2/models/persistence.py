@@ -1,13 +1,14 @@
 """
 Module de persistance pour le système de location de voitures.
-Gère la sauvegarde et le chargement des données en JSON.
+Gère la sauvegarde et le chargement des données en JSON, avec un journal
+optionnel des modifications (une ligne JSON par modification).
 """
 
 import json
 import logging
 from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Set
 
 from models import vehicle as vehicle_module
 from models.customer import Customer
@@ -52,27 +53,69 @@ class DataPersistence:
     
     Permet de sauvegarder et charger l'état complet du système en JSON.
     
+    Mode journal: plutôt que de réécrire les fichiers complets après chaque
+    modification, chaque entité modifiée est ajoutée en une ligne compacte
+    au journal (journal_vehicle, journal_customer, journal_rental,
+    journal_delete). Les fichiers complets servent d'instantané: compact()
+    les réécrit et vide le journal. load_all() rejoue le journal sur
+    l'instantané.
+    
+    Les locations peuvent être stockées au format JSON Lines (une location
+    par ligne, voir convert_rentals_to_json_lines): elles sont alors lues et
+    écrites une à une. Le format tableau est lui aussi lu en flux.
+    
+    Seules les entités modifiées (is_dirty) sont écrites: save_all() ne
+    réécrit que les fichiers dont le contenu a changé et save_changes()
+    journalise uniquement les entités modifiées ou supprimées.
+    
     Attributes:
         data_dir: Répertoire de stockage des données
         vehicles_file: Fichier des véhicules
         customers_file: Fichier des clients
         rentals_file: Fichier des locations
+        journal_file: Journal des modifications depuis le dernier instantané
+        compaction_threshold: Nombre d'entrées du journal déclenchant la compaction
+        entities_written: Nombre d'entités écrites par la dernière sauvegarde
     """
     
     DEFAULT_DATA_DIR = "data"
     VEHICLES_FILE = "vehicles.json"
     CUSTOMERS_FILE = "customers.json"
     RENTALS_FILE = "rentals.json"
+    RENTALS_LINES_FILE = "rentals.jsonl"
+    READ_CHUNK_SIZE = 64 * 1024
+    JOURNAL_FILE = "journal.jsonl"
+    DEFAULT_COMPACTION_THRESHOLD = 500
     
-    def __init__(self, data_dir: str | Path = DEFAULT_DATA_DIR):
+    # Types d'entités journalisées
+    VEHICLE = "vehicle"
+    CUSTOMER = "customer"
+    RENTAL = "rental"
+    
+    def __init__(
+        self,
+        data_dir: str | Path = DEFAULT_DATA_DIR,
+        compaction_threshold: int = DEFAULT_COMPACTION_THRESHOLD
+    ):
         """
         Initialise le gestionnaire de persistance.
         
         Args:
             data_dir: Répertoire de stockage des données
+            compaction_threshold: Taille du journal au-delà de laquelle
+                compact_if_needed() réécrit l'instantané
         """
         self.data_dir = Path(data_dir)
+        self.compaction_threshold = compaction_threshold
+        self.entities_written = 0
+        # IDs des entités connues du stockage, par type d'entité
+        self._persisted_ids: Dict[str, Set[str]] = {
+            self.VEHICLE: set(), self.CUSTOMER: set(), self.RENTAL: set()
+        }
+        # Position d'une dernière ligne incomplète du journal, à tronquer
+        self._partial_tail: Optional[int] = None
         self._ensure_data_dir()
+        self._journal_size = self._count_journal_entries()
     
     def _ensure_data_dir(self) -> None:
         """Crée le répertoire de données s'il n'existe pas."""
@@ -90,8 +133,88 @@ class DataPersistence:
     def rentals_path(self) -> Path:
         return self.data_dir / self.RENTALS_FILE
     
+    @property
+    def rentals_lines_path(self) -> Path:
+        return self.data_dir / self.RENTALS_LINES_FILE
+    
+    @property
+    def rentals_storage_path(self) -> Path:
+        """Fichier des locations utilisé: JSON Lines s'il existe, sinon tableau JSON."""
+        if self.rentals_lines_path.exists():
+            return self.rentals_lines_path
+        return self.rentals_path
+    
+    @property
+    def journal_path(self) -> Path:
+        return self.data_dir / self.JOURNAL_FILE
+    
+    @property
+    def journal_size(self) -> int:
+        """Nombre d'entrées du journal depuis le dernier instantané."""
+        return self._journal_size
+    
+    # === Sérialisation ===
+    
+    def _vehicle_to_dict(self, vehicle: Any) -> Dict:
+        """Convertit un véhicule en dictionnaire avec sa classe concrète."""
+        vehicle_data = vehicle.to_dict()
+        # Ajouter les informations spécifiques selon le type
+        if isinstance(vehicle, Car):
+            vehicle_data['_class'] = 'Car'
+            vehicle_data['num_doors'] = vehicle.num_doors
+            vehicle_data['num_seats'] = vehicle.num_seats
+            vehicle_data['fuel_type'] = vehicle.fuel_type
+            vehicle_data['transmission'] = vehicle.transmission
+        elif isinstance(vehicle, Truck):
+            vehicle_data['_class'] = 'Truck'
+            vehicle_data['cargo_capacity'] = vehicle.cargo_capacity
+            vehicle_data['max_weight'] = vehicle.max_weight
+            vehicle_data['has_tail_lift'] = vehicle.has_tail_lift
+        elif isinstance(vehicle, Motorcycle):
+            vehicle_data['_class'] = 'Motorcycle'
+            vehicle_data['engine_size'] = vehicle.engine_size
+            vehicle_data['motorcycle_type'] = vehicle.motorcycle_type
+        return vehicle_data
+    
+    def _customer_to_dict(self, customer: Customer) -> Dict:
+        """Convertit un client en dictionnaire, état compris."""
+        return {
+            'id': customer.id,
+            'first_name': customer.first_name,
+            'last_name': customer.last_name,
+            'birth_date': customer.birth_date.isoformat(),
+            'license_number': customer.license_number,
+            'license_types': list(customer.license_types),
+            'license_date': customer.license_date.isoformat(),
+            'email': customer.email,
+            'phone': customer.phone,
+            'address': customer.address,
+            'rental_history': customer.rental_history,
+            'active_rentals': customer.active_rentals,
+            'is_blocked': customer.is_blocked,
+            'blocked_reason': customer.blocked_reason
+        }
+    
+    def _rental_to_dict(self, rental: Rental) -> Dict:
+        """Convertit une location en dictionnaire."""
+        rental_data = rental.to_dict()
+        rental_data['_status'] = rental.status.name  # Sauver le nom de l'enum
+        return rental_data
+    
     # === Sauvegarde ===
     
+    def _mark_saved(self, kind: str, entities: Dict[str, Any]) -> None:
+        """Enregistre l'état persisté d'une collection et la marque propre."""
+        self._persisted_ids[kind] = set(entities)
+        for entity in entities.values():
+            entity.mark_clean()
+    
+    def _has_changes(self, kind: str, entities: Dict[str, Any], path: Path) -> bool:
+        """Indique si une collection diffère de ce qui a été persisté."""
+        if not path.exists() or set(entities) != self._persisted_ids[kind]:
+            return True
+        return any(entity.is_dirty for entity in entities.values())
+    
     def save_vehicles(self, vehicles: Dict[str, Any]) -> bool:
         """
         Sauvegarde les véhicules dans un fichier JSON.
@@ -103,31 +226,12 @@ class DataPersistence:
             True si la sauvegarde a réussi
         """
         try:
-            data = []
-            for vehicle in vehicles.values():
-                vehicle_data = vehicle.to_dict()
-                # Ajouter les informations spécifiques selon le type
-                if isinstance(vehicle, Car):
-                    vehicle_data['_class'] = 'Car'
-                    vehicle_data['num_doors'] = vehicle.num_doors
-                    vehicle_data['num_seats'] = vehicle.num_seats
-                    vehicle_data['fuel_type'] = vehicle.fuel_type
-                    vehicle_data['transmission'] = vehicle.transmission
-                elif isinstance(vehicle, Truck):
-                    vehicle_data['_class'] = 'Truck'
-                    vehicle_data['cargo_capacity'] = vehicle.cargo_capacity
-                    vehicle_data['max_weight'] = vehicle.max_weight
-                    vehicle_data['has_tail_lift'] = vehicle.has_tail_lift
-                elif isinstance(vehicle, Motorcycle):
-                    vehicle_data['_class'] = 'Motorcycle'
-                    vehicle_data['engine_size'] = vehicle.engine_size
-                    vehicle_data['motorcycle_type'] = vehicle.motorcycle_type
-                
-                data.append(vehicle_data)
+            data = [self._vehicle_to_dict(vehicle) for vehicle in vehicles.values()]
             
             with open(self.vehicles_path, 'w', encoding='utf-8') as f:
                 json.dump(data, f, cls=DateTimeEncoder, indent=2, ensure_ascii=False)
             
+            self._mark_saved(self.VEHICLE, vehicles)
             logger.info(f"Sauvegarde de {len(data)} véhicules réussie")
             return True
             
@@ -146,29 +250,12 @@ class DataPersistence:
             True si la sauvegarde a réussi
         """
         try:
-            data = []
-            for customer in customers.values():
-                customer_data = {
-                    'id': customer.id,
-                    'first_name': customer.first_name,
-                    'last_name': customer.last_name,
-                    'birth_date': customer.birth_date.isoformat(),
-                    'license_number': customer.license_number,
-                    'license_types': list(customer.license_types),
-                    'license_date': customer.license_date.isoformat(),
-                    'email': customer.email,
-                    'phone': customer.phone,
-                    'address': customer.address,
-                    'rental_history': customer.rental_history,
-                    'active_rentals': customer.active_rentals,
-                    'is_blocked': customer.is_blocked,
-                    'blocked_reason': customer.blocked_reason
-                }
-                data.append(customer_data)
+            data = [self._customer_to_dict(customer) for customer in customers.values()]
             
             with open(self.customers_path, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
             
+            self._mark_saved(self.CUSTOMER, customers)
             logger.info(f"Sauvegarde de {len(data)} clients réussie")
             return True
             
@@ -180,28 +267,32 @@ class DataPersistence:
         """
         Sauvegarde les locations dans un fichier JSON.
         
+        Au format JSON Lines, les locations sont écrites une à une.
+        
         Args:
             rentals: Dictionnaire des locations {id: rental}
             
         Returns:
             True si la sauvegarde a réussi
         """
+        path = self.rentals_storage_path
         try:
-            data = []
-            for rental in rentals.values():
-                rental_data = rental.to_dict()
-                rental_data['_status'] = rental.status.name  # Sauver le nom de l'enum
-                data.append(rental_data)
-            
-            with open(self.rentals_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if path == self.rentals_lines_path:
+                self._write_json_lines(
+                    path, (self._rental_to_dict(rental) for rental in rentals.values())
+                )
+            else:
+                data = [self._rental_to_dict(rental) for rental in rentals.values()]
+                with open(path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
             
-            logger.info(f"Sauvegarde de {len(data)} locations réussie")
+            self._mark_saved(self.RENTAL, rentals)
+            logger.info(f"Sauvegarde de {len(rentals)} locations réussie")
             return True
             
         except Exception as e:
             logger.error(f"Erreur lors de la sauvegarde des locations: {e}")
-            raise DataSaveError(str(self.rentals_path), str(e))
+            raise DataSaveError(str(path), str(e))
     
     def save_all(
         self,
@@ -212,6 +303,13 @@ class DataPersistence:
         """
         Sauvegarde toutes les données du système.
         
+        Un fichier n'est réécrit que si l'une de ses entités a été modifiée,
+        ajoutée ou supprimée depuis la dernière sauvegarde.
+        
+        Si un journal existe, l'instantané complet est réécrit et le journal
+        vidé (voir compact()): ses entrées, plus anciennes, écraseraient
+        sinon les données sauvegardées au prochain chargement.
+        
         Args:
             vehicles: Dictionnaire des véhicules
             customers: Dictionnaire des clients
@@ -220,12 +318,320 @@ class DataPersistence:
         Returns:
             True si toutes les sauvegardes ont réussi
         """
+        if self.journal_path.exists():
+            return self.compact(vehicles, customers, rentals)
+        
+        success = True
+        written = 0
+        
+        for kind, entities, path, save in (
+            (self.VEHICLE, vehicles, self.vehicles_path, self.save_vehicles),
+            (self.CUSTOMER, customers, self.customers_path, self.save_customers),
+            (self.RENTAL, rentals, self.rentals_storage_path, self.save_rentals)
+        ):
+            if self._has_changes(kind, entities, path):
+                success = save(entities) and success
+                written += len(entities)
+        
+        self.entities_written = written
+        return success
+    
+    def save_changes(
+        self,
+        vehicles: Dict[str, Any],
+        customers: Dict[str, Customer],
+        rentals: Dict[str, Rental]
+    ) -> int:
+        """
+        Journalise uniquement les entités modifiées depuis la dernière sauvegarde.
+        
+        Les entités absentes des dictionnaires mais connues du stockage
+        (chargées ou sauvegardées auparavant) sont journalisées comme
+        supprimées.
+        
+        Returns:
+            Nombre d'entités écrites
+        """
+        written = 0
+        
+        for kind, entities, journal in (
+            (self.VEHICLE, vehicles, self.journal_vehicle),
+            (self.CUSTOMER, customers, self.journal_customer),
+            (self.RENTAL, rentals, self.journal_rental)
+        ):
+            for entity_id in self._persisted_ids[kind] - set(entities):
+                self.journal_delete(kind, entity_id)
+                written += 1
+            
+            for entity in entities.values():
+                if entity.is_dirty or entity.id not in self._persisted_ids[kind]:
+                    journal(entity)
+                    written += 1
+            
+            self._mark_saved(kind, entities)
+        
+        self.entities_written = written
+        logger.info(f"Sauvegarde incrémentale: {written} entités écrites")
+        return written
+    
+    # === Format JSON Lines ===
+    
+    def _write_json_lines(self, path: Path, records: Iterable[Dict]) -> int:
+        """
+        Écrit des enregistrements au format JSON Lines.
+        
+        Le fichier est écrit à côté puis renommé pour ne jamais laisser
+        de fichier partiel.
+        
+        Returns:
+            Nombre d'enregistrements écrits
+        """
+        temp_path = path.with_name(path.name + '.tmp')
+        count = 0
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, cls=DateTimeEncoder, ensure_ascii=False,
+                                   separators=(',', ':')))
+                f.write('\n')
+                count += 1
+        temp_path.replace(path)
+        return count
+    
+    def _iter_json_lines(self, path: Path) -> Iterator[Dict]:
+        """Lit un fichier JSON Lines enregistrement par enregistrement."""
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    
+    def _iter_json_array(self, path: Path) -> Iterator[Dict]:
+        """
+        Lit un tableau JSON élément par élément.
+        
+        Le fichier est lu par blocs: seul l'élément en cours de décodage
+        est gardé en mémoire, pas l'arbre JSON complet.
+        """
+        decoder = json.JSONDecoder()
+        with open(path, 'r', encoding='utf-8') as f:
+            buffer = ''
+            position = 0
+            started = False
+            eof = False
+            
+            while True:
+                # Sauter les blancs et les séparateurs
+                while position < len(buffer) and buffer[position] in ' \t\r\n,':
+                    position += 1
+                
+                if position < len(buffer):
+                    if not started:
+                        if buffer[position] != '[':
+                            raise json.JSONDecodeError("Tableau JSON attendu", buffer, position)
+                        started = True
+                        position += 1
+                        continue
+                    if buffer[position] == ']':
+                        return
+                    try:
+                        item, end = decoder.raw_decode(buffer, position)
+                        # Un élément qui touche la fin du bloc peut être tronqué
+                        if end < len(buffer) or eof:
+                            yield item
+                            position = end
+                            continue
+                    except json.JSONDecodeError:
+                        if eof:
+                            raise
+                elif eof:
+                    if not started:
+                        return
+                    raise json.JSONDecodeError("Fin de tableau JSON manquante", buffer, position)
+                
+                chunk = f.read(self.READ_CHUNK_SIZE)
+                eof = not chunk
+                buffer = buffer[position:] + chunk
+                position = 0
+    
+    def _iter_records(self, path: Path) -> Iterator[Dict]:
+        """Lit les enregistrements d'un fichier selon son format."""
+        if path.suffix == '.jsonl':
+            return self._iter_json_lines(path)
+        return self._iter_json_array(path)
+    
+    def convert_rentals_to_json_lines(self) -> int:
+        """
+        Convertit le fichier des locations du format tableau au format JSON Lines.
+        
+        La conversion se fait en flux; le fichier tableau est supprimé une
+        fois le nouveau fichier écrit.
+        
+        Returns:
+            Nombre de locations converties
+        """
+        if not self.rentals_path.exists():
+            return 0
+        
+        try:
+            count = self._write_json_lines(
+                self.rentals_lines_path, self._iter_json_array(self.rentals_path)
+            )
+        except json.JSONDecodeError as e:
+            logger.error(f"Erreur de décodage JSON: {e}")
+            raise DataLoadError(str(self.rentals_path), f"JSON invalide: {e}")
+        except Exception as e:
+            logger.error(f"Erreur lors de la conversion des locations: {e}")
+            raise DataSaveError(str(self.rentals_lines_path), str(e))
+        
+        self.rentals_path.unlink()
+        logger.info(f"Conversion de {count} locations au format JSON Lines réussie")
+        return count
+    
+    # === Journal ===
+    
+    def _append_journal(self, entry: Dict) -> bool:
+        """Ajoute une entrée compacte en fin de journal."""
+        try:
+            line = json.dumps(entry, cls=DateTimeEncoder, ensure_ascii=False,
+                              separators=(',', ':'))
+            self._truncate_partial_tail()
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+            self._journal_size += 1
+            return True
+        
+        except Exception as e:
+            logger.error(f"Erreur lors de l'écriture du journal: {e}")
+            raise DataSaveError(str(self.journal_path), str(e))
+    
+    def journal_vehicle(self, vehicle: Any) -> bool:
+        """Journalise l'état courant d'un véhicule (ajout ou modification)."""
+        return self._append_journal({
+            'op': 'put', 'kind': self.VEHICLE, 'data': self._vehicle_to_dict(vehicle)
+        })
+    
+    def journal_customer(self, customer: Customer) -> bool:
+        """Journalise l'état courant d'un client (ajout, blocage, historique...)."""
+        return self._append_journal({
+            'op': 'put', 'kind': self.CUSTOMER, 'data': self._customer_to_dict(customer)
+        })
+    
+    def journal_rental(self, rental: Rental) -> bool:
+        """Journalise l'état courant d'une location (création, clôture, annulation...)."""
+        return self._append_journal({
+            'op': 'put', 'kind': self.RENTAL, 'data': self._rental_to_dict(rental)
+        })
+    
+    def journal_delete(self, kind: str, entity_id: str) -> bool:
+        """
+        Journalise la suppression d'une entité.
+        
+        Args:
+            kind: Type d'entité (VEHICLE, CUSTOMER ou RENTAL)
+            entity_id: ID de l'entité supprimée
+        """
+        if kind not in (self.VEHICLE, self.CUSTOMER, self.RENTAL):
+            raise ValueError(f"Type d'entité inconnu: {kind}")
+        return self._append_journal({'op': 'delete', 'kind': kind, 'id': entity_id})
+    
+    def compact(
+        self,
+        vehicles: Dict[str, Any],
+        customers: Dict[str, Customer],
+        rentals: Dict[str, Rental]
+    ) -> bool:
+        """
+        Réécrit l'instantané complet puis vide le journal.
+        
+        Si l'opération est interrompue avant la suppression du journal, le
+        rejouer sur le nouvel instantané redonne le même état.
+        """
+        # Instantané complet: les fichiers inchangés depuis la dernière
+        # sauvegarde ne contiennent pas les entrées du journal
         success = True
         success = self.save_vehicles(vehicles) and success
         success = self.save_customers(customers) and success
         success = self.save_rentals(rentals) and success
+        self.entities_written = len(vehicles) + len(customers) + len(rentals)
+        if self.journal_path.exists():
+            self.journal_path.unlink()
+        self._journal_size = 0
+        self._partial_tail = None
+        logger.info("Compaction du journal réussie")
         return success
     
+    def compact_if_needed(
+        self,
+        vehicles: Dict[str, Any],
+        customers: Dict[str, Customer],
+        rentals: Dict[str, Rental]
+    ) -> bool:
+        """
+        Compacte le journal s'il a atteint le seuil de compaction.
+        
+        Returns:
+            True si une compaction a eu lieu
+        """
+        if self._journal_size < self.compaction_threshold:
+            return False
+        return self.compact(vehicles, customers, rentals)
+    
+    def _count_journal_entries(self) -> int:
+        """
+        Compte les entrées complètes du journal existant, sans le modifier.
+        
+        Une dernière ligne sans fin de ligne (écriture interrompue) n'est
+        pas comptée: sa position est retenue pour la tronquer au premier
+        ajout (voir _truncate_partial_tail).
+        """
+        self._partial_tail = None
+        if not self.journal_path.exists():
+            return 0
+        
+        count = 0
+        offset = 0
+        with open(self.journal_path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    logger.warning("Dernière entrée du journal incomplète ignorée")
+                    self._partial_tail = offset
+                    break
+                offset += len(line)
+                if line.strip():
+                    count += 1
+        return count
+    
+    def _truncate_partial_tail(self) -> None:
+        """Tronque la dernière ligne incomplète du journal avant un ajout."""
+        if self._partial_tail is None:
+            return
+        if self.journal_path.exists():
+            with open(self.journal_path, 'r+b') as f:
+                f.truncate(self._partial_tail)
+        self._partial_tail = None
+    
+    def _read_journal(self) -> List[Dict]:
+        """
+        Lit les entrées du journal.
+        
+        Une dernière ligne incomplète (écriture interrompue) est ignorée.
+        """
+        if not self.journal_path.exists():
+            return []
+        
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            lines = [line for line in f if line.strip()]
+        
+        entries = []
+        for number, line in enumerate(lines, start=1):
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                if number == len(lines):
+                    logger.warning(f"Dernière entrée du journal incomplète ignorée: {e}")
+                    break
+                raise DataLoadError(str(self.journal_path), f"Ligne {number} invalide: {e}")
+        return entries
+    
     # === Chargement ===
     
     def load_vehicles(self) -> Dict[str, Any]:
@@ -243,15 +649,8 @@ class DataPersistence:
             with open(self.vehicles_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
             
-            vehicles = {}
-            for item in data:
-                vehicle = self._create_vehicle_from_dict(item)
-                if vehicle:
-                    vehicles[vehicle.id] = vehicle
-            
-            logger.info(f"Chargement de {len(vehicles)} véhicules réussi")
-            return vehicles
-            
+            return self._build_vehicles(data)
+        
         except json.JSONDecodeError as e:
             logger.error(f"Erreur de décodage JSON: {e}")
             raise DataLoadError(str(self.vehicles_path), f"JSON invalide: {e}")
@@ -259,6 +658,18 @@ class DataPersistence:
             logger.error(f"Erreur lors du chargement des véhicules: {e}")
             raise DataLoadError(str(self.vehicles_path), str(e))
     
+    def _build_vehicles(self, data: Iterable[Dict]) -> Dict[str, Any]:
+        """Crée les véhicules à partir de leurs dictionnaires."""
+        vehicles = {}
+        for item in data:
+            vehicle = self._create_vehicle_from_dict(item)
+            if vehicle:
+                vehicles[vehicle.id] = vehicle
+        
+        self._mark_saved(self.VEHICLE, vehicles)
+        logger.info(f"Chargement de {len(vehicles)} véhicules réussi")
+        return vehicles
+    
     def _create_vehicle_from_dict(self, data: Dict) -> Optional[Any]:
         """Crée un véhicule à partir d'un dictionnaire."""
         vehicle_class = data.get('_class', data.get('type', ''))
@@ -344,34 +755,8 @@ class DataPersistence:
             with open(self.customers_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
             
-            customers = {}
-            for item in data:
-                customer = Customer(
-                    first_name=item['first_name'],
-                    last_name=item['last_name'],
-                    birth_date=date.fromisoformat(item['birth_date']),
-                    license_number=item['license_number'],
-                    license_types=set(item['license_types']),
-                    license_date=date.fromisoformat(item['license_date']),
-                    email=item['email'],
-                    phone=item['phone'],
-                    address=item.get('address', ''),
-                    customer_id=item['id']
-                )
-                
-                # Restaurer l'état
-                customer.restore_state(
-                    rental_history=item.get('rental_history', []),
-                    active_rentals=item.get('active_rentals', []),
-                    is_blocked=item.get('is_blocked', False),
-                    blocked_reason=item.get('blocked_reason')
-                )
-                
-                customers[customer.id] = customer
-            
-            logger.info(f"Chargement de {len(customers)} clients réussi")
-            return customers
-            
+            return self._build_customers(data)
+        
         except json.JSONDecodeError as e:
             logger.error(f"Erreur de décodage JSON: {e}")
             raise DataLoadError(str(self.customers_path), f"JSON invalide: {e}")
@@ -379,81 +764,173 @@ class DataPersistence:
             logger.error(f"Erreur lors du chargement des clients: {e}")
             raise DataLoadError(str(self.customers_path), str(e))
     
+    def _build_customers(self, data: Iterable[Dict]) -> Dict[str, Customer]:
+        """Crée les clients à partir de leurs dictionnaires."""
+        customers = {}
+        for item in data:
+            customer = Customer(
+                first_name=item['first_name'],
+                last_name=item['last_name'],
+                birth_date=date.fromisoformat(item['birth_date']),
+                license_number=item['license_number'],
+                license_types=set(item['license_types']),
+                license_date=date.fromisoformat(item['license_date']),
+                email=item['email'],
+                phone=item['phone'],
+                address=item.get('address', ''),
+                customer_id=item['id']
+            )
+            
+            # Restaurer l'état
+            customer.restore_state(
+                rental_history=item.get('rental_history', []),
+                active_rentals=item.get('active_rentals', []),
+                is_blocked=item.get('is_blocked', False),
+                blocked_reason=item.get('blocked_reason')
+            )
+            
+            customers[customer.id] = customer
+        
+        self._mark_saved(self.CUSTOMER, customers)
+        logger.info(f"Chargement de {len(customers)} clients réussi")
+        return customers
+    
     def load_rentals(self) -> Dict[str, Rental]:
         """
         Charge les locations depuis le fichier JSON.
         
-        Note: Les locations passées ne peuvent pas être recréées avec des dates
-        dans le passé. Seules les locations futures sont restaurées.
+        Toutes les locations sont restaurées avec leurs dates et leur statut
+        réels, y compris l'historique des locations terminées ou annulées.
+        
+        Le fichier est lu en flux (JSON Lines ou tableau): chaque location
+        est créée dès que son enregistrement est décodé.
         
         Returns:
             Dictionnaire des locations {id: rental}
         """
-        if not self.rentals_path.exists():
+        path = self.rentals_storage_path
+        if not path.exists():
             logger.info("Aucun fichier de locations trouvé")
             return {}
         
         try:
-            with open(self.rentals_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            rentals = {}
-            skipped = 0
-            
-            for item in data:
-                start_date = date.fromisoformat(item['start_date'])
-                end_date = date.fromisoformat(item['end_date'])
-                
-                # Ignorer les locations passées (ne peuvent pas être recréées)
-                if start_date < date.today() and item.get('_status') not in ['ACTIVE', 'RESERVED']:
-                    skipped += 1
-                    continue
-                
-                # Pour les locations passées actives, ajuster la date de début
-                if start_date < date.today():
-                    start_date = date.today()
-                
-                try:
-                    rental = Rental(
-                        customer_id=item['customer_id'],
-                        vehicle_id=item['vehicle_id'],
-                        start_date=start_date,
-                        end_date=end_date,
-                        daily_rate=item['daily_rate'],
-                        start_mileage=item.get('start_mileage', 0),
-                        rental_id=item['id']
-                    )
-                    
-                    # Restaurer la réduction appliquée
-                    if item.get('discount_applied', 0) > 0:
-                        rental.apply_discount(item['discount_applied'])
-                    
-                    rentals[rental.id] = rental
-                    
-                except Exception as e:
-                    logger.warning(f"Impossible de restaurer la location {item['id']}: {e}")
-                    skipped += 1
-            
-            logger.info(f"Chargement de {len(rentals)} locations réussi ({skipped} ignorées)")
-            return rentals
-            
+            return self._build_rentals(self._iter_records(path))
+        
         except json.JSONDecodeError as e:
             logger.error(f"Erreur de décodage JSON: {e}")
-            raise DataLoadError(str(self.rentals_path), f"JSON invalide: {e}")
+            raise DataLoadError(str(path), f"JSON invalide: {e}")
         except Exception as e:
             logger.error(f"Erreur lors du chargement des locations: {e}")
-            raise DataLoadError(str(self.rentals_path), str(e))
+            raise DataLoadError(str(path), str(e))
+    
+    def _build_rentals(self, data: Iterable[Dict], mark_saved: bool = True) -> Dict[str, Rental]:
+        """
+        Crée les locations à partir de leurs dictionnaires.
+        
+        Args:
+            data: Dictionnaires des locations
+            mark_saved: Enregistrer les locations comme l'état persisté;
+                False pour un chargement partiel, qui ne doit pas remplacer
+                l'ensemble des locations connues du stockage
+        """
+        rentals = {}
+        skipped = 0
+        
+        for item in data:
+            try:
+                rental = Rental.restore(item)
+                rentals[rental.id] = rental
+            
+            except Exception as e:
+                logger.warning(f"Impossible de restaurer la location {item.get('id')}: {e}")
+                skipped += 1
+        
+        if mark_saved:
+            self._mark_saved(self.RENTAL, rentals)
+        logger.info(f"Chargement de {len(rentals)} locations réussi ({skipped} ignorées)")
+        return rentals
+    
+    def _iter_snapshot(self, path: Path, overrides: Dict[str, Optional[Dict]]) -> Iterator[Dict]:
+        """
+        Lit un fichier d'instantané en flux en lui appliquant le journal.
+        
+        Args:
+            path: Fichier d'instantané
+            overrides: État final de chaque entité journalisée
+                {id: dictionnaire, ou None si supprimée}
+        
+        Yields:
+            Dictionnaires des entités: celles de l'instantané (remplacées
+            par leur version journalisée), puis celles créées par le journal
+        """
+        pending = dict(overrides)
+        if path.exists():
+            try:
+                for item in self._iter_records(path):
+                    if item['id'] in pending:
+                        item = pending.pop(item['id'])
+                        if item is None:
+                            continue
+                    yield item
+            except json.JSONDecodeError as e:
+                logger.error(f"Erreur de décodage JSON: {e}")
+                raise DataLoadError(str(path), f"JSON invalide: {e}")
+        
+        for item in pending.values():
+            if item is not None:
+                yield item
     
     def load_all(self) -> tuple[Dict, Dict, Dict]:
         """
         Charge toutes les données du système.
         
+        Si un journal existe, il est lu en premier pour connaître l'état
+        final de chaque entité journalisée; l'instantané est ensuite lu en
+        flux et chaque enregistrement remplacé à la volée par sa version
+        journalisée.
+        
         Returns:
             Tuple (vehicles, customers, rentals)
         """
-        vehicles = self.load_vehicles()
-        customers = self.load_customers()
-        rentals = self.load_rentals()
+        if not self.journal_path.exists():
+            vehicles = self.load_vehicles()
+            customers = self.load_customers()
+            rentals = self.load_rentals()
+            return vehicles, customers, rentals
+        
+        overrides: Dict[str, Dict[str, Optional[Dict]]] = {
+            self.VEHICLE: {}, self.CUSTOMER: {}, self.RENTAL: {}
+        }
+        
+        entries = self._read_journal()
+        for entry in entries:
+            kind_overrides = overrides.get(entry.get('kind'))
+            if kind_overrides is None:
+                logger.warning(f"Entrée de journal ignorée: {entry}")
+                continue
+            if entry.get('op') == 'delete':
+                kind_overrides[entry['id']] = None
+            else:
+                kind_overrides[entry['data']['id']] = entry['data']
+        
+        logger.info(f"{len(entries)} entrées du journal rejouées")
+        
+        try:
+            vehicles = self._build_vehicles(
+                self._iter_snapshot(self.vehicles_path, overrides[self.VEHICLE])
+            )
+            customers = self._build_customers(
+                self._iter_snapshot(self.customers_path, overrides[self.CUSTOMER])
+            )
+            rentals = self._build_rentals(
+                self._iter_snapshot(self.rentals_storage_path, overrides[self.RENTAL])
+            )
+        except DataLoadError:
+            raise
+        except Exception as e:
+            logger.error(f"Erreur lors du rejeu du journal: {e}")
+            raise DataLoadError(str(self.journal_path), str(e))
+        
         return vehicles, customers, rentals
     
     def clear_all_data(self) -> bool:
@@ -464,9 +941,12 @@ class DataPersistence:
             True si la suppression a réussi
         """
         try:
-            for path in [self.vehicles_path, self.customers_path, self.rentals_path]:
+            for path in [self.vehicles_path, self.customers_path, self.rentals_path,
+                         self.rentals_lines_path, self.journal_path]:
                 if path.exists():
                     path.unlink()
+            self._journal_size = 0
+            self._partial_tail = None
             logger.info("Toutes les données ont été supprimées")
             return True
         except Exception as e:
@@ -478,5 +958,7 @@ class DataPersistence:
         return any(p.exists() for p in [
             self.vehicles_path,
             self.customers_path, 
-            self.rentals_path
+            self.rentals_path,
+            self.rentals_lines_path,
+            self.journal_path
         ])
@@ -3,7 +3,7 @@ Module de gestion des locations.
 """
 
 from datetime import date, datetime, timedelta
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 from enum import Enum
 import uuid
 
@@ -45,6 +45,14 @@ class Rental:
         end_mileage (Optional[float]): Kilométrage au retour
     """
     
+    # Attributs fixes: pas de __dict__ par instance
+    __slots__ = (
+        '_id', '_customer_id', '_vehicle_id', '_start_date', '_end_date',
+        '_actual_return_date', '_status', '_daily_rate', '_start_mileage',
+        '_end_mileage', '_penalty', '_created_at', '_notes', '_discount_applied',
+        '_dirty', '_cost_cache'
+    )
+    
     # Constantes pour les pénalités
     LATE_RETURN_PENALTY_PER_DAY = _LATE_RETURN_PENALTY_PER_DAY
     CANCELLATION_FEE_PERCENT = _CANCELLATION_FEE_PERCENT
@@ -85,6 +93,10 @@ class Rental:
         self._created_at = datetime.now()
         self._notes: str = ""
         self._discount_applied = 0.0
+        self._dirty = True
+        
+        # Coûts (base, total) calculés à la demande, figés à la clôture
+        self._cost_cache: Optional[Tuple[float, float]] = None
     
     # Propriétés
     @property
@@ -112,6 +124,8 @@ class Rental:
         if value < self._start_date:
             raise ValueError("La date de fin ne peut pas être antérieure à la date de début")
         self._end_date = value
+        self._cost_cache = None
+        self._dirty = True
     
     @property
     def actual_return_date(self) -> Optional[date]:
@@ -144,11 +158,21 @@ class Rental:
     @notes.setter
     def notes(self, value: str):
         self._notes = value
+        self._dirty = True
     
     @property
     def discount_applied(self) -> float:
         return self._discount_applied
     
+    @property
+    def is_dirty(self) -> bool:
+        """Indique si la location a été modifiée depuis la dernière sauvegarde."""
+        return self._dirty
+    
+    def mark_clean(self) -> None:
+        """Marque la location comme sauvegardée."""
+        self._dirty = False
+    
     # Méthodes de calcul
     @property
     def planned_duration(self) -> int:
@@ -178,6 +202,29 @@ class Rental:
     
     def calculate_base_cost(self) -> float:
         """Calcule le coût de base de la location."""
+        return self._costs()[0]
+    
+    def calculate_total_cost(self) -> float:
+        """Calcule le coût total incluant les pénalités."""
+        return self._costs()[1]
+    
+    def _costs(self) -> Tuple[float, float]:
+        """
+        Retourne les coûts (base, total), mémorisés.
+        
+        Le cache est vidé par toute modification des données du calcul
+        (date de fin, réduction, retour, pénalité); pour une location
+        terminée ou annulée, il est rempli à la clôture et ne change plus.
+        """
+        if self._cost_cache is None:
+            base_cost = self._compute_base_cost()
+            # Réduction fidélité puis pénalités
+            total_cost = base_cost * (1 - self._discount_applied) + self._penalty
+            self._cost_cache = (base_cost, total_cost)
+        return self._cost_cache
+    
+    def _compute_base_cost(self) -> float:
+        """Calcule le coût de base selon la durée effective ou prévue."""
         duration = self.actual_duration or self.planned_duration
         base_cost = self._daily_rate * duration
         
@@ -189,16 +236,6 @@ class Rental:
         
         return base_cost
     
-    def calculate_total_cost(self) -> float:
-        """Calcule le coût total incluant les pénalités."""
-        base_cost = self.calculate_base_cost()
-        
-        # Application de la réduction fidélité
-        cost_after_discount = base_cost * (1 - self._discount_applied)
-        
-        # Ajout des pénalités
-        return cost_after_discount + self._penalty
-    
     @property
     def total_cost(self) -> float:
         return self.calculate_total_cost()
@@ -207,6 +244,8 @@ class Rental:
         """Applique une réduction au coût de la location."""
         if 0 <= discount_percent <= 1:
             self._discount_applied = discount_percent
+            self._cost_cache = None
+            self._dirty = True
     
     # Méthodes de gestion du cycle de vie
     def start_rental(self) -> bool:
@@ -214,6 +253,7 @@ class Rental:
         if self._status == RentalStatus.RESERVED:
             if self._start_date <= date.today():
                 self._status = RentalStatus.ACTIVE
+                self._dirty = True
                 return True
         return False
     
@@ -247,6 +287,10 @@ class Rental:
             self._penalty = days_late * self.LATE_RETURN_PENALTY_PER_DAY
         
         self._status = RentalStatus.COMPLETED
+        self._dirty = True
+        
+        # Figer le coût final
+        self._cost_cache = None
         return self.calculate_total_cost()
     
     def cancel_rental(self) -> float:
@@ -280,6 +324,11 @@ class Rental:
         
         self._penalty = cancellation_fee
         self._status = RentalStatus.CANCELLED
+        self._dirty = True
+        
+        # Figer le coût final
+        self._cost_cache = None
+        self._costs()
         return cancellation_fee
     
     def extend_rental(self, new_end_date: date) -> bool:
@@ -299,6 +348,8 @@ class Rental:
             return False
         
         self._end_date = new_end_date
+        self._cost_cache = None
+        self._dirty = True
         return True
     
     def is_overdue(self) -> bool:
@@ -343,3 +394,47 @@ class Rental:
             'notes': self._notes,
             'created_at': self._created_at.isoformat()
         }
+    
+    @classmethod
+    def restore(cls, data: Dict[str, Any]) -> 'Rental':
+        """
+        Recrée une location sauvegardée, sans les validations du constructeur.
+        
+        Contrairement au constructeur, accepte les dates passées: les
+        locations terminées ou annulées sont restaurées avec leurs dates,
+        pénalités, kilométrages et statut réels.
+        
+        Args:
+            data: Dictionnaire produit par to_dict (le nom du statut peut
+                être fourni sous la clé '_status')
+            
+        Returns:
+            La location restaurée
+        """
+        def parse_date(value: Optional[str]) -> Optional[date]:
+            return date.fromisoformat(value) if value else None
+        
+        if data.get('_status'):
+            status = RentalStatus[data['_status']]
+        else:
+            status = RentalStatus(data.get('status', RentalStatus.RESERVED.value))
+        
+        rental = cls.__new__(cls)
+        rental._id = data['id']
+        rental._customer_id = data['customer_id']
+        rental._vehicle_id = data['vehicle_id']
+        rental._start_date = date.fromisoformat(data['start_date'])
+        rental._end_date = date.fromisoformat(data['end_date'])
+        rental._actual_return_date = parse_date(data.get('actual_return_date'))
+        rental._status = status
+        rental._daily_rate = data['daily_rate']
+        rental._start_mileage = data.get('start_mileage', 0.0)
+        rental._end_mileage = data.get('end_mileage')
+        rental._penalty = data.get('penalty', 0.0)
+        created_at = data.get('created_at')
+        rental._created_at = datetime.fromisoformat(created_at) if created_at else datetime.now()
+        rental._notes = data.get('notes', "")
+        rental._discount_applied = data.get('discount_applied', 0.0)
+        rental._dirty = False
+        rental._cost_cache = None
+        return rental
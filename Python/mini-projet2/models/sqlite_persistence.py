@@ -0,0 +1,410 @@
+"""
+Module de persistance SQLite pour le système de location de voitures.
+Même interface que DataPersistence, stockage dans une base SQLite indexée.
+"""
+
+import json
+import logging
+import sqlite3
+from collections import defaultdict
+from datetime import date
+from pathlib import Path
+from typing import Callable, Dict, Any, Iterable, List, Optional, Tuple
+
+from models.customer import Customer
+from models.rental import Rental, RentalStatus
+from models.persistence import DataPersistence, DateTimeEncoder
+from models.exceptions import DataLoadError, DataSaveError
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS vehicles (
+    id TEXT PRIMARY KEY,
+    vehicle_type TEXT,
+    category TEXT,
+    state TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS customers (
+    id TEXT PRIMARY KEY,
+    last_name TEXT,
+    is_blocked INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rentals (
+    id TEXT PRIMARY KEY,
+    customer_id TEXT NOT NULL,
+    vehicle_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    actual_return_date TEXT,
+    base_cost REAL,
+    penalty REAL,
+    total_cost REAL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_vehicles_state ON vehicles (state);
+CREATE INDEX IF NOT EXISTS idx_rentals_customer ON rentals (customer_id);
+CREATE INDEX IF NOT EXISTS idx_rentals_vehicle ON rentals (vehicle_id);
+CREATE INDEX IF NOT EXISTS idx_rentals_status ON rentals (status);
+CREATE INDEX IF NOT EXISTS idx_rentals_period ON rentals (start_date, end_date);
+CREATE INDEX IF NOT EXISTS idx_rentals_return ON rentals (status, actual_return_date);
+"""
+
+
+def _dumps(data: Dict) -> str:
+    """Sérialise un dictionnaire en JSON compact."""
+    return json.dumps(data, cls=DateTimeEncoder, ensure_ascii=False,
+                      separators=(',', ':'))
+
+
+class SQLitePersistence(DataPersistence):
+    """
+    Persistance des données dans une base SQLite.
+    
+    Expose les mêmes méthodes load_*/save_* que DataPersistence. Chaque
+    entité est une ligne (données complètes en JSON et colonnes indexées
+    pour les recherches); les sauvegardes n'écrivent que les entités
+    modifiées (is_dirty) ou absentes de la base, par upsert. Les méthodes
+    journal_* écrivent directement la ligne concernée.
+    
+    Attributes:
+        data_dir: Répertoire de stockage des données
+        database_file: Fichier de la base SQLite
+        entities_written: Nombre de lignes écrites ou supprimées par la
+            dernière sauvegarde
+    """
+    
+    DATABASE_FILE = "rental.db"
+    
+    _VEHICLE_COLUMNS = ['id', 'vehicle_type', 'category', 'state', 'data']
+    _CUSTOMER_COLUMNS = ['id', 'last_name', 'is_blocked', 'data']
+    _RENTAL_COLUMNS = [
+        'id', 'customer_id', 'vehicle_id', 'status', 'start_date', 'end_date',
+        'actual_return_date', 'base_cost', 'penalty', 'total_cost', 'data'
+    ]
+    _TABLES = {
+        DataPersistence.VEHICLE: 'vehicles',
+        DataPersistence.CUSTOMER: 'customers',
+        DataPersistence.RENTAL: 'rentals'
+    }
+    
+    def __init__(self, data_dir: str | Path = DataPersistence.DEFAULT_DATA_DIR):
+        """
+        Initialise la base et crée le schéma si nécessaire.
+        
+        Args:
+            data_dir: Répertoire de stockage des données
+        """
+        super().__init__(data_dir)
+        try:
+            self._connection = sqlite3.connect(self.database_path)
+            self._connection.executescript(_SCHEMA)
+        except sqlite3.Error as e:
+            logger.error(f"Erreur lors de l'ouverture de la base: {e}")
+            raise DataLoadError(str(self.database_path), str(e))
+    
+    @property
+    def database_path(self) -> Path:
+        return self.data_dir / self.DATABASE_FILE
+    
+    def close(self) -> None:
+        """Ferme la connexion à la base."""
+        self._connection.close()
+    
+    # === Lignes ===
+    
+    def _vehicle_row(self, vehicle: Any) -> Tuple:
+        data = self._vehicle_to_dict(vehicle)
+        return (data['id'], data['type'], data['category'], data['state'], _dumps(data))
+    
+    def _customer_row(self, customer: Customer) -> Tuple:
+        data = self._customer_to_dict(customer)
+        return (data['id'], data['last_name'], int(data['is_blocked']), _dumps(data))
+    
+    def _rental_row(self, rental: Rental) -> Tuple:
+        data = self._rental_to_dict(rental)
+        return (
+            data['id'], data['customer_id'], data['vehicle_id'], data['_status'],
+            data['start_date'], data['end_date'], data['actual_return_date'],
+            data['base_cost'], data['penalty'], data['total_cost'], _dumps(data)
+        )
+    
+    def _upsert(self, table: str, columns: List[str], rows: Iterable[Tuple]) -> int:
+        """
+        Insère ou met à jour des lignes.
+        
+        Une ligne existante n'est réécrite que si ses données ont changé.
+        
+        Returns:
+            Nombre de lignes insérées ou modifiées
+        """
+        placeholders = ", ".join("?" for _ in columns)
+        updates = ", ".join(f"{column} = excluded.{column}" for column in columns[1:])
+        query = (
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders}) "
+            f"ON CONFLICT(id) DO UPDATE SET {updates} "
+            f"WHERE {table}.data IS NOT excluded.data"
+        )
+        before = self._connection.total_changes
+        self._connection.executemany(query, rows)
+        return self._connection.total_changes - before
+    
+    def _save_table(
+        self,
+        kind: str,
+        entities: Dict[str, Any],
+        to_row: Callable[[Any], Tuple],
+        columns: List[str]
+    ) -> bool:
+        """
+        Synchronise une table avec une collection d'entités.
+        
+        Seules les entités modifiées ou absentes de la base sont sérialisées;
+        les lignes des entités disparues sont supprimées.
+        """
+        table = self._TABLES[kind]
+        try:
+            with self._connection:
+                existing = {row[0] for row in self._connection.execute(f"SELECT id FROM {table}")}
+                rows = [
+                    to_row(entity) for entity in entities.values()
+                    if entity.is_dirty or entity.id not in existing
+                ]
+                written = self._upsert(table, columns, rows)
+                
+                # Retirer les entités qui n'existent plus
+                removed = [(entity_id,) for entity_id in existing - set(entities)]
+                self._connection.executemany(f"DELETE FROM {table} WHERE id = ?", removed)
+            
+            self._mark_saved(kind, entities)
+            self.entities_written = written + len(removed)
+            logger.info(f"Sauvegarde {table}: {written} lignes écrites, {len(removed)} supprimées")
+            return True
+        
+        except sqlite3.Error as e:
+            logger.error(f"Erreur lors de la sauvegarde de {table}: {e}")
+            raise DataSaveError(str(self.database_path), str(e))
+    
+    def _save_row(self, table: str, columns: List[str], row: Tuple) -> bool:
+        """Écrit une seule ligne."""
+        try:
+            with self._connection:
+                self._upsert(table, columns, [row])
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Erreur lors de l'écriture dans {table}: {e}")
+            raise DataSaveError(str(self.database_path), str(e))
+    
+    # === Sauvegarde ===
+    
+    def save_vehicles(self, vehicles: Dict[str, Any]) -> bool:
+        """Synchronise la table des véhicules."""
+        return self._save_table(self.VEHICLE, vehicles, self._vehicle_row, self._VEHICLE_COLUMNS)
+    
+    def save_customers(self, customers: Dict[str, Customer]) -> bool:
+        """Synchronise la table des clients."""
+        return self._save_table(self.CUSTOMER, customers, self._customer_row, self._CUSTOMER_COLUMNS)
+    
+    def save_rentals(self, rentals: Dict[str, Rental]) -> bool:
+        """Synchronise la table des locations."""
+        return self._save_table(self.RENTAL, rentals, self._rental_row, self._RENTAL_COLUMNS)
+    
+    def save_all(
+        self,
+        vehicles: Dict[str, Any],
+        customers: Dict[str, Customer],
+        rentals: Dict[str, Rental]
+    ) -> bool:
+        """
+        Synchronise toutes les tables.
+        
+        Returns:
+            True si toutes les sauvegardes ont réussi
+        """
+        success = True
+        written = 0
+        for entities, save in (
+            (vehicles, self.save_vehicles),
+            (customers, self.save_customers),
+            (rentals, self.save_rentals)
+        ):
+            success = save(entities) and success
+            written += self.entities_written
+        
+        self.entities_written = written
+        return success
+    
+    # === Écritures unitaires (interface du journal) ===
+    
+    def journal_vehicle(self, vehicle: Any) -> bool:
+        """Écrit la ligne d'un véhicule."""
+        return self._save_row('vehicles', self._VEHICLE_COLUMNS, self._vehicle_row(vehicle))
+    
+    def journal_customer(self, customer: Customer) -> bool:
+        """Écrit la ligne d'un client."""
+        return self._save_row('customers', self._CUSTOMER_COLUMNS, self._customer_row(customer))
+    
+    def journal_rental(self, rental: Rental) -> bool:
+        """Écrit la ligne d'une location."""
+        return self._save_row('rentals', self._RENTAL_COLUMNS, self._rental_row(rental))
+    
+    def journal_delete(self, kind: str, entity_id: str) -> bool:
+        """Supprime la ligne d'une entité."""
+        table = self._TABLES.get(kind)
+        if table is None:
+            raise ValueError(f"Type d'entité inconnu: {kind}")
+        try:
+            with self._connection:
+                self._connection.execute(f"DELETE FROM {table} WHERE id = ?", (entity_id,))
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Erreur lors de la suppression dans {table}: {e}")
+            raise DataSaveError(str(self.database_path), str(e))
+    
+    def compact(
+        self,
+        vehicles: Dict[str, Any],
+        customers: Dict[str, Customer],
+        rentals: Dict[str, Rental]
+    ) -> bool:
+        """Synchronise toutes les tables (pas de journal à compacter)."""
+        return self.save_all(vehicles, customers, rentals)
+    
+    def compact_if_needed(
+        self,
+        vehicles: Dict[str, Any],
+        customers: Dict[str, Customer],
+        rentals: Dict[str, Rental]
+    ) -> bool:
+        """Les écritures sont déjà unitaires: aucune compaction nécessaire."""
+        return False
+    
+    # === Chargement ===
+    
+    def _select_data(self, query: str, params: Tuple = ()) -> List[Dict]:
+        """Retourne les données JSON des lignes sélectionnées."""
+        try:
+            return [json.loads(row[0]) for row in self._connection.execute(query, params)]
+        except (sqlite3.Error, json.JSONDecodeError) as e:
+            logger.error(f"Erreur lors de la lecture de la base: {e}")
+            raise DataLoadError(str(self.database_path), str(e))
+    
+    def load_vehicles(self) -> Dict[str, Any]:
+        """Charge les véhicules depuis la base."""
+        return self._build_vehicles(self._select_data("SELECT data FROM vehicles"))
+    
+    def load_customers(self) -> Dict[str, Customer]:
+        """Charge les clients depuis la base."""
+        return self._build_customers(self._select_data("SELECT data FROM customers"))
+    
+    def load_rentals(self) -> Dict[str, Rental]:
+        """Charge les locations depuis la base."""
+        return self._build_rentals(self._select_data("SELECT data FROM rentals"))
+    
+    def load_all(self) -> tuple[Dict, Dict, Dict]:
+        """
+        Charge toutes les données du système.
+        
+        Returns:
+            Tuple (vehicles, customers, rentals)
+        """
+        return self.load_vehicles(), self.load_customers(), self.load_rentals()
+    
+    def load_rentals_between(
+        self,
+        start_date: date,
+        end_date: date,
+        vehicle_id: Optional[str] = None
+    ) -> Dict[str, Rental]:
+        """
+        Charge les locations dont la période chevauche l'intervalle donné.
+        
+        Args:
+            start_date: Début de l'intervalle (inclus)
+            end_date: Fin de l'intervalle (incluse)
+            vehicle_id: Limiter à un véhicule
+        
+        Chargement partiel: l'état persisté suivi pour les sauvegardes
+        incrémentales n'est pas modifié.
+        """
+        query = "SELECT data FROM rentals WHERE start_date <= ? AND end_date >= ?"
+        params: Tuple = (end_date.isoformat(), start_date.isoformat())
+        if vehicle_id:
+            query += " AND vehicle_id = ?"
+            params += (vehicle_id,)
+        return self._build_rentals(self._select_data(query, params), mark_saved=False)
+    
+    def revenue_summary(self, start_date: date, end_date: date) -> Dict:
+        """
+        Calcule le chiffre d'affaires des retours entre deux dates incluses.
+        
+        L'agrégation est faite par SQLite sur l'index des retours; le
+        résultat a la même forme que celui de RevenueAggregates.summarize.
+        """
+        query = """
+            SELECT substr(r.actual_return_date, 1, 7), v.vehicle_type,
+                   COUNT(*), SUM(r.total_cost), SUM(r.base_cost), SUM(r.penalty)
+            FROM rentals r LEFT JOIN vehicles v ON v.id = r.vehicle_id
+            WHERE r.status = ? AND r.actual_return_date BETWEEN ? AND ?
+            GROUP BY 1, 2
+        """
+        params = (RentalStatus.COMPLETED.name, start_date.isoformat(), end_date.isoformat())
+        try:
+            rows = self._connection.execute(query, params).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Erreur lors du calcul du chiffre d'affaires: {e}")
+            raise DataLoadError(str(self.database_path), str(e))
+        
+        total_revenue = total_base = total_penalties = 0.0
+        total_count = 0
+        revenue_by_type = defaultdict(float)
+        revenue_by_month = defaultdict(float)
+        
+        for month_key, vehicle_type, count, revenue, base, penalties in rows:
+            total_count += count
+            total_revenue += revenue
+            total_base += base
+            total_penalties += penalties
+            revenue_by_month[month_key] += revenue
+            if vehicle_type:
+                revenue_by_type[vehicle_type] += revenue
+        
+        return {
+            'total_revenue': total_revenue,
+            'total_base_revenue': total_base,
+            'total_penalties': total_penalties,
+            'total_rentals_completed': total_count,
+            'revenue_by_vehicle_type': dict(revenue_by_type),
+            'revenue_by_month': dict(sorted(revenue_by_month.items()))
+        }
+    
+    # === Utilitaires ===
+    
+    def clear_all_data(self) -> bool:
+        """
+        Vide toutes les tables.
+        
+        Returns:
+            True si la suppression a réussi
+        """
+        try:
+            with self._connection:
+                for table in self._TABLES.values():
+                    self._connection.execute(f"DELETE FROM {table}")
+            logger.info("Toutes les données ont été supprimées")
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Erreur lors de la suppression des données: {e}")
+            return False
+    
+    def data_exists(self) -> bool:
+        """Vérifie si des données existent."""
+        return any(
+            self._connection.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone()
+            for table in self._TABLES.values()
+        )
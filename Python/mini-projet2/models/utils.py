@@ -2,6 +2,7 @@
 Module utilitaire avec des fonctions helpers réutilisables.
 """
 
+import unicodedata
 from datetime import date
 from typing import Tuple
 
@@ -69,6 +70,23 @@ def format_currency(amount: float, currency: str = "€") -> str:
     return f"{amount:.2f} {currency}"
 
 
+def normalize_search_text(text: str) -> str:
+    """
+    Normalise un texte pour la recherche.
+    
+    Supprime les accents, passe en minuscules et réduit les espaces.
+    
+    Args:
+        text: Texte à normaliser
+        
+    Returns:
+        Texte normalisé (ex: "Éloïse  Dupré" -> "eloise dupre")
+    """
+    decomposed = unicodedata.normalize('NFKD', text)
+    folded = ''.join(c for c in decomposed if not unicodedata.combining(c))
+    return ' '.join(folded.casefold().split())
+
+
 def calculate_rental_discount(days: int, base_cost: float) -> Tuple[float, float]:
     """
     Calcule la réduction applicable selon la durée de location.
@@ -73,6 +73,13 @@ class Vehicle(ABC):
         maintenance_history (List[dict]): Historique d'entretien
     """
     
+    # Attributs fixes: pas de __dict__ par instance
+    __slots__ = (
+        '_id', '_brand', '_model', '_category', '_daily_rate', '_state', '_year',
+        '_license_plate', '_mileage', '_maintenance_history', '_last_maintenance_date',
+        '_last_maintenance_mileage', '_dirty'
+    )
+    
     def __init__(
         self,
         brand: str,
@@ -95,6 +102,9 @@ class Vehicle(ABC):
         self._mileage = mileage
         self._maintenance_history: List[dict] = []
         self._last_maintenance_date: Optional[date] = None
+        # Kilométrage au dernier entretien terminé (0 si jamais entretenu)
+        self._last_maintenance_mileage = 0.0
+        self._dirty = True
     
     # Propriétés avec getters
     @property
@@ -122,6 +132,7 @@ class Vehicle(ABC):
         if value < 0:
             raise ValueError(f"Le tarif journalier ne peut pas être négatif ({value})")
         self._daily_rate = value
+        self._dirty = True
     
     @property
     def state(self) -> VehicleState:
@@ -130,6 +141,7 @@ class Vehicle(ABC):
     @state.setter
     def state(self, value: VehicleState):
         self._state = value
+        self._dirty = True
     
     @property
     def year(self) -> int:
@@ -148,6 +160,7 @@ class Vehicle(ABC):
         if value < self._mileage:
             raise ValueError(f"Le kilométrage ne peut pas diminuer ({self._mileage} -> {value})")
         self._mileage = value
+        self._dirty = True
     
     @property
     def maintenance_history(self) -> List[dict]:
@@ -157,6 +170,19 @@ class Vehicle(ABC):
     def last_maintenance_date(self) -> Optional[date]:
         return self._last_maintenance_date
     
+    @property
+    def last_maintenance_mileage(self) -> float:
+        return self._last_maintenance_mileage
+    
+    @property
+    def is_dirty(self) -> bool:
+        """Indique si le véhicule a été modifié depuis la dernière sauvegarde."""
+        return self._dirty
+    
+    def mark_clean(self) -> None:
+        """Marque le véhicule comme sauvegardé."""
+        self._dirty = False
+    
     # Méthodes
     def is_available(self) -> bool:
         """Vérifie si le véhicule est disponible à la location."""
@@ -166,6 +192,7 @@ class Vehicle(ABC):
         """Marque le véhicule comme loué."""
         if self.is_available():
             self._state = VehicleState.RENTED
+            self._dirty = True
             return True
         return False
     
@@ -175,6 +202,7 @@ class Vehicle(ABC):
             if new_mileage is not None:
                 self.mileage = new_mileage
             self._state = VehicleState.AVAILABLE
+            self._dirty = True
             return True
         return False
     
@@ -188,6 +216,7 @@ class Vehicle(ABC):
                 'type': 'début maintenance',
                 'mileage': self._mileage
             })
+            self._dirty = True
             return True
         return False
     
@@ -196,6 +225,7 @@ class Vehicle(ABC):
         if self._state == VehicleState.MAINTENANCE:
             self._state = VehicleState.AVAILABLE
             self._last_maintenance_date = date.today()
+            self._last_maintenance_mileage = self._mileage
             self._maintenance_history.append({
                 'date': datetime.now(),
                 'description': description,
@@ -203,21 +233,17 @@ class Vehicle(ABC):
                 'cost': cost,
                 'mileage': self._mileage
             })
+            self._dirty = True
             return True
         return False
     
+    def km_until_maintenance(self, km_threshold: float = _MAINTENANCE_KM_THRESHOLD) -> float:
+        """Kilomètres restants avant la prochaine maintenance (négatif si dépassée)."""
+        return km_threshold - (self._mileage - self._last_maintenance_mileage)
+    
     def needs_maintenance(self, km_threshold: float = _MAINTENANCE_KM_THRESHOLD) -> bool:
         """Vérifie si le véhicule nécessite une maintenance."""
-        if not self._maintenance_history:
-            return self._mileage >= km_threshold
-        
-        last_maintenance_mileage = 0
-        for record in reversed(self._maintenance_history):
-            if record['type'] == 'fin maintenance':
-                last_maintenance_mileage = record.get('mileage', 0)
-                break
-        
-        return (self._mileage - last_maintenance_mileage) >= km_threshold
+        return self.km_until_maintenance(km_threshold) <= 0
     
     @abstractmethod
     def get_vehicle_type(self) -> str:
@@ -284,6 +310,8 @@ class Car(Vehicle):
         transmission (str): Type de transmission
     """
     
+    __slots__ = ('_num_doors', '_num_seats', '_fuel_type', '_transmission')
+    
     def __init__(
         self,
         brand: str,
@@ -361,6 +389,8 @@ class Truck(Vehicle):
         has_tail_lift (bool): Présence d'un hayon élévateur
     """
     
+    __slots__ = ('_cargo_capacity', '_max_weight', '_has_tail_lift')
+    
     def __init__(
         self,
         brand: str,
@@ -433,6 +463,8 @@ class Motorcycle(Vehicle):
         motorcycle_type (str): Type de moto (sport, touring, etc.)
     """
     
+    __slots__ = ('_engine_size', '_motorcycle_type')
+    
     def __init__(
         self,
         brand: str,
@@ -2,6 +2,8 @@
 Tests unitaires pour la classe CarRentalSystem.
 """
 
+import threading
+
 import pytest
 from datetime import date, timedelta
 
@@ -11,7 +13,8 @@ sys.path.insert(0, '..')
 from car_rental_system import CarRentalSystem
 from models.vehicle import Car, Truck, Motorcycle, VehicleCategory, VehicleState
 from models.customer import Customer
-from models.rental import RentalStatus
+from models.rental import Rental, RentalStatus
+from models.events import ChangeEvent, ChangeType
 
 
 class TestCarRentalSystem:
@@ -133,6 +136,45 @@ class TestCarRentalSystem:
         economy = populated_system.get_available_vehicles(category=VehicleCategory.ECONOMY)
         assert len(economy) == 1
     
+    def test_get_free_windows_without_bookings(self, populated_system):
+        """Test des créneaux libres sans réservation."""
+        start = date.today() + timedelta(days=7)
+        end = start + timedelta(days=6)
+        
+        windows = populated_system.get_free_windows(start, end, min_days=3)
+        assert windows == {"CAR001": [(start, end)], "TRK001": [(start, end)]}
+    
+    def test_get_free_windows_between_bookings(self, populated_system):
+        """Test des créneaux libres entre réservations."""
+        start = date.today() + timedelta(days=7)
+        end = start + timedelta(days=9)
+        populated_system.create_rental(
+            "CUST001", "CAR001", start - timedelta(days=2), start + timedelta(days=1)
+        )
+        populated_system.create_rental(
+            "CUST001", "CAR001", start + timedelta(days=4), start + timedelta(days=5)
+        )
+        
+        windows = populated_system.get_free_windows(start, end, vehicle_type="Voiture")
+        assert windows == {"CAR001": [
+            (start + timedelta(days=2), start + timedelta(days=3)),
+            (start + timedelta(days=6), end)
+        ]}
+        
+        # Le premier trou (2 jours) est trop court
+        windows = populated_system.get_free_windows(
+            start, end, min_days=3, category=VehicleCategory.ECONOMY
+        )
+        assert windows == {"CAR001": [(start + timedelta(days=6), end)]}
+    
+    def test_get_free_windows_excludes_maintenance(self, populated_system):
+        """Test que les véhicules en maintenance n'ont pas de créneau."""
+        populated_system.get_vehicle("TRK001").send_to_maintenance("Vidange")
+        start = date.today() + timedelta(days=1)
+        
+        windows = populated_system.get_free_windows(start, start + timedelta(days=3))
+        assert list(windows) == ["CAR001"]
+    
     def test_search_vehicles_by_brand(self, populated_system):
         """Test de recherche par marque."""
         results = populated_system.search_vehicles(brand="Renault")
@@ -143,6 +185,15 @@ class TestCarRentalSystem:
         results = populated_system.search_vehicles(max_daily_rate=50.0)
         assert len(results) == 1
     
+    def test_find_vehicles_ranked(self, populated_system):
+        """Test de la recherche plein texte classée des véhicules."""
+        assert [v.id for v in populated_system.find_vehicles("renault")] == ["CAR001", "TRK001"]
+        assert [v.id for v in populated_system.find_vehicles("ma")] == ["TRK001"]
+        assert [v.id for v in populated_system.find_vehicles("tr-456")] == ["TRK001"]
+        
+        populated_system.remove_vehicle("TRK001")
+        assert populated_system.find_vehicles("master") == []
+    
     # === Tests de gestion des clients ===
     
     def test_add_customer(self, system, sample_customer):
@@ -171,6 +222,24 @@ class TestCarRentalSystem:
         results = populated_system.search_customers(name="Jean")
         assert len(results) == 1
     
+    def test_find_customers_ignores_accents(self, populated_system, young_customer):
+        """Test de la recherche sans accents et du classement par pertinence."""
+        young_customer.last_name = "Dupré"
+        populated_system.add_customer(young_customer)
+        
+        assert [c.id for c in populated_system.find_customers("dupre")] == ["CUST002"]
+        assert [c.id for c in populated_system.find_customers("DUP")] == ["CUST001", "CUST002"]
+        assert [c.id for c in populated_system.find_customers("marie dup")] == ["CUST002"]
+        assert [c.id for c in populated_system.search_customers(name="Dupré")] == ["CUST002"]
+    
+    def test_reindex_customer_after_edit(self, populated_system, sample_customer):
+        """Test de la mise à jour de l'index après modification d'un client."""
+        sample_customer.email = "j.durand@email.com"
+        assert populated_system.reindex_customer("CUST001")
+        
+        assert populated_system.search_customers(email="durand") == [sample_customer]
+        assert populated_system.search_customers(email="dupont") == []
+    
     # === Tests de gestion des locations ===
     
     def test_create_rental_success(self, populated_system):
@@ -236,6 +305,28 @@ class TestCarRentalSystem:
         assert rental is None
         assert "âge" in message.lower()
     
+    def test_eligible_vehicles_by_requirement_class(self, populated_system, young_customer):
+        """Test de l'éligibilité évaluée une fois par classe de véhicule."""
+        populated_system.add_customer(young_customer)
+        populated_system.add_vehicle(Motorcycle(
+            brand="Honda", model="CB125R", category=VehicleCategory.ECONOMY,
+            daily_rate=35.0, year=2022, license_plate="MO-125-TO",
+            engine_size=125, motorcycle_type="standard", vehicle_id="MOTO001"
+        ))
+        eligibility = populated_system._eligibility
+        
+        # Voiture et camion léger partagent la classe (B, 21 ans)
+        assert populated_system.get_eligible_vehicles("CUST002") == []
+        assert eligibility.evaluations == 2
+        populated_system.get_eligible_vehicles("CUST002")
+        assert eligibility.evaluations == 2
+        
+        # Un nouveau permis invalide les résultats du client
+        young_customer.add_license_type("A1")
+        eligible = populated_system.get_eligible_vehicles("CUST002")
+        assert [v.id for v in eligible] == ["MOTO001"]
+        assert eligibility.evaluations == 4
+    
     def test_create_rental_vehicle_not_available(self, populated_system):
         """Test de location avec véhicule non disponible."""
         start = date.today() + timedelta(days=1)
@@ -302,6 +393,72 @@ class TestCarRentalSystem:
         
         assert success == True
     
+    def test_extend_rental_blocked_by_next_booking(self, populated_system):
+        """Test de prolongation empêchée par une réservation suivante."""
+        start = date.today() + timedelta(days=1)
+        end = start + timedelta(days=3)
+        rental, _ = populated_system.create_rental("CUST001", "CAR001", start, end)
+        
+        next_start = end + timedelta(days=2)
+        populated_system.create_rental(
+            "CUST001", "CAR001", next_start, next_start + timedelta(days=2)
+        )
+        
+        success, _ = populated_system.extend_rental(rental.id, next_start)
+        assert success == False
+        
+        success, _ = populated_system.extend_rental(rental.id, end + timedelta(days=1))
+        assert success == True
+    
+    def test_vehicle_available_after_cancel(self, populated_system):
+        """Test de disponibilité du véhicule après annulation."""
+        start = date.today() + timedelta(days=10)
+        end = start + timedelta(days=3)
+        rental, _ = populated_system.create_rental("CUST001", "CAR001", start, end)
+        
+        assert populated_system.get_available_vehicles(start_date=start, end_date=end) == [
+            populated_system.get_vehicle("TRK001")
+        ]
+        
+        populated_system.cancel_rental(rental.id)
+        
+        available = populated_system.get_available_vehicles(start_date=start, end_date=end)
+        assert len(available) == 2
+    
+    def test_vehicle_available_after_complete(self, populated_system):
+        """Test de disponibilité du véhicule après retour."""
+        start = date.today()
+        end = start + timedelta(days=5)
+        rental, _ = populated_system.create_rental("CUST001", "CAR001", start, end)
+        
+        populated_system.complete_rental(rental.id, date.today(), 100.0)
+        
+        new_rental, _ = populated_system.create_rental(
+            "CUST001", "CAR001", start + timedelta(days=1), end
+        )
+        assert new_rental is not None
+    
+    def test_overlap_detection_between_bookings(self, populated_system):
+        """Test de détection de chevauchement entre plusieurs réservations."""
+        base = date.today() + timedelta(days=5)
+        populated_system.create_rental("CUST001", "CAR001", base, base + timedelta(days=2))
+        populated_system.create_rental(
+            "CUST001", "CAR001", base + timedelta(days=10), base + timedelta(days=12)
+        )
+        
+        # Trou entre les deux réservations
+        gap, _ = populated_system.create_rental(
+            "CUST001", "CAR001", base + timedelta(days=3), base + timedelta(days=9)
+        )
+        assert gap is not None
+        
+        # Chevauche la dernière réservation
+        overlap, message = populated_system.create_rental(
+            "CUST001", "CAR001", base + timedelta(days=12), base + timedelta(days=14)
+        )
+        assert overlap is None
+        assert "disponible" in message.lower()
+    
     def test_get_active_rentals(self, populated_system):
         """Test de récupération des locations actives."""
         start = date.today()
@@ -322,6 +479,49 @@ class TestCarRentalSystem:
         rentals = populated_system.get_customer_rentals("CUST001")
         assert len(rentals) == 1
     
+    def test_get_vehicle_rentals(self, populated_system):
+        """Test de récupération des locations d'un véhicule."""
+        start = date.today() + timedelta(days=1)
+        populated_system.create_rental("CUST001", "CAR001", start, start + timedelta(days=2))
+        populated_system.create_rental(
+            "CUST001", "CAR001", start + timedelta(days=5), start + timedelta(days=6)
+        )
+        
+        assert len(populated_system.get_vehicle_rentals("CAR001")) == 2
+        assert populated_system.get_vehicle_rentals("TRK001") == []
+    
+    def test_rentals_by_status_follow_lifecycle(self, populated_system):
+        """Test de l'index par statut au fil du cycle de vie."""
+        today = date.today()
+        active, _ = populated_system.create_rental(
+            "CUST001", "CAR001", today, today + timedelta(days=2)
+        )
+        reserved, _ = populated_system.create_rental(
+            "CUST001", "CAR001", today + timedelta(days=5), today + timedelta(days=7)
+        )
+        
+        assert populated_system.count_rentals_by_status(RentalStatus.ACTIVE) == 1
+        assert populated_system.get_rentals_by_status(RentalStatus.RESERVED) == [reserved]
+        
+        populated_system.complete_rental(active.id, today, 15100)
+        populated_system.cancel_rental(reserved.id)
+        
+        assert populated_system.count_rentals_by_status(RentalStatus.ACTIVE) == 0
+        assert populated_system.count_rentals_by_status(RentalStatus.RESERVED) == 0
+        assert populated_system.get_rentals_by_status(RentalStatus.COMPLETED) == [active]
+        assert populated_system.get_rentals_by_status(RentalStatus.CANCELLED) == [reserved]
+    
+    def test_get_overdue_rentals_only_active(self, populated_system):
+        """Test que seules les locations actives dépassées sont en retard."""
+        today = date.today()
+        rental, _ = populated_system.create_rental(
+            "CUST001", "CAR001", today, today + timedelta(days=2)
+        )
+        assert populated_system.get_overdue_rentals() == []
+        
+        rental._end_date = today - timedelta(days=1)
+        assert populated_system.get_overdue_rentals() == [rental]
+    
     # === Tests des rapports ===
     
     def test_generate_available_vehicles_report(self, populated_system):
@@ -350,6 +550,97 @@ class TestCarRentalSystem:
         assert report['report_type'] == "Chiffre d'affaires"
         assert 'total_revenue' in report
     
+    def test_generate_revenue_report_after_completion(self, populated_system):
+        """Test que le rapport reflète les locations terminées."""
+        today = date.today()
+        rental, _ = populated_system.create_rental(
+            "CUST001", "CAR001", today, today + timedelta(days=2)
+        )
+        total_cost, _ = populated_system.complete_rental(rental.id, today)
+        
+        report = populated_system.generate_revenue_report(today, today)
+        assert report['total_rentals_completed'] == 1
+        assert report['total_revenue'] == pytest.approx(total_cost)
+        assert report['total_base_revenue'] == pytest.approx(rental.calculate_base_cost())
+        assert report['revenue_by_vehicle_type'] == {"Voiture": pytest.approx(total_cost)}
+        assert report['revenue_by_month'] == {
+            today.strftime("%Y-%m"): pytest.approx(total_cost)
+        }
+    
+    def test_restore_data_rebuilds_reports(self, populated_system):
+        """Test que les données restaurées alimentent index et rapports."""
+        today = date.today()
+        rental, _ = populated_system.create_rental(
+            "CUST001", "CAR001", today, today + timedelta(days=2)
+        )
+        total_cost, _ = populated_system.complete_rental(rental.id, today)
+        
+        restored = CarRentalSystem()
+        restored.restore_data(
+            {v.id: v for v in populated_system.get_all_vehicles()},
+            {c.id: c for c in populated_system.get_all_customers()},
+            {rental.id: rental}
+        )
+        
+        report = restored.generate_revenue_report(today, today)
+        assert report['total_revenue'] == pytest.approx(total_cost)
+        assert restored.count_rentals_by_status(RentalStatus.COMPLETED) == 1
+        assert restored.get_customer_rentals("CUST001") == [rental]
+    
+    def test_generate_revenue_report_period_bounds(self, populated_system):
+        """Test du découpage par période des cumuls de chiffre d'affaires."""
+        today = date.today()
+        rental, _ = populated_system.create_rental(
+            "CUST001", "TRK001", today, today + timedelta(days=1)
+        )
+        late_return = today + timedelta(days=40)
+        total_cost, _ = populated_system.complete_rental(rental.id, late_return)
+        
+        # Période entière sur plusieurs mois
+        report = populated_system.generate_revenue_report(today, late_return)
+        assert report['total_revenue'] == pytest.approx(total_cost)
+        assert report['total_penalties'] == pytest.approx(rental.penalty)
+        
+        # Période s'arrêtant la veille du retour
+        report = populated_system.generate_revenue_report(
+            today, late_return - timedelta(days=1)
+        )
+        assert report['total_rentals_completed'] == 0
+        assert report['revenue_by_month'] == {}
+    
+    @pytest.mark.parametrize("vectorized", [True, False], ids=["numpy", "python"])
+    def test_occupancy_rate(self, populated_system, monkeypatch, vectorized):
+        """Test du taux d'occupation calculé sur le stockage en colonnes."""
+        if vectorized:
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr("models.columnar.np", None)
+        today = date.today()
+        period_end = today + timedelta(days=9)
+        
+        # Aucune location: colonnes vides
+        assert populated_system.get_vehicle_booked_days(today, period_end) == {}
+        assert populated_system.get_occupancy_rate(today, period_end) == 0.0
+        
+        rental, _ = populated_system.create_rental(
+            "CUST001", "CAR001", today, today + timedelta(days=2)
+        )
+        cancelled, _ = populated_system.create_rental(
+            "CUST001", "TRK001", today + timedelta(days=5), today + timedelta(days=6)
+        )
+        populated_system.cancel_rental(cancelled.id)
+        
+        assert populated_system.get_vehicle_booked_days(today, period_end) == {"CAR001": 3}
+        # 3 jours loués sur 2 véhicules × 10 jours
+        assert populated_system.get_occupancy_rate(today, period_end) == pytest.approx(15.0)
+        
+        populated_system.extend_rental(rental.id, today + timedelta(days=4))
+        assert populated_system.get_vehicle_booked_days(today, period_end) == {"CAR001": 5}
+        
+        # Retour anticipé: seuls les jours effectifs comptent
+        populated_system.complete_rental(rental.id, today)
+        assert populated_system.get_occupancy_rate(today, period_end) == pytest.approx(5.0)
+    
     def test_generate_statistics_report(self, populated_system):
         """Test du rapport de statistiques."""
         report = populated_system.generate_statistics_report()
@@ -358,6 +649,265 @@ class TestCarRentalSystem:
         assert report['fleet']['total_vehicles'] == 2
         assert report['customers']['total_customers'] == 1
     
+    def test_statistics_report_cached_until_change(self, populated_system):
+        """Test du cache du rapport de statistiques."""
+        report = populated_system.generate_statistics_report()
+        assert populated_system.generate_statistics_report() is report
+        
+        start = date.today()
+        populated_system.create_rental("CUST001", "CAR001", start, start + timedelta(days=2))
+        
+        updated = populated_system.generate_statistics_report()
+        assert updated is not report
+        assert updated['rentals']['active_rentals'] == 1
+        assert updated['fleet']['by_state'][VehicleState.RENTED.value] == 1
+    
+    def test_statistics_report_after_direct_change(self, populated_system):
+        """Test de l'invalidation explicite après une modification directe."""
+        populated_system.generate_statistics_report()
+        populated_system.get_vehicle("TRK001").send_to_maintenance("Freins")
+        populated_system.mark_changed()
+        
+        report = populated_system.generate_statistics_report()
+        assert report['fleet']['by_state'][VehicleState.MAINTENANCE.value] == 1
+    
+    def test_statistics_most_rented_vehicle(self, populated_system):
+        """Test du véhicule le plus loué."""
+        start = date.today() + timedelta(days=1)
+        populated_system.create_rental("CUST001", "TRK001", start, start + timedelta(days=1))
+        populated_system.create_rental("CUST001", "CAR001", start, start + timedelta(days=1))
+        populated_system.create_rental(
+            "CUST001", "CAR001", start + timedelta(days=3), start + timedelta(days=4)
+        )
+        
+        highlights = populated_system.generate_statistics_report()['highlights']
+        assert highlights['most_rented_vehicle'] == str(populated_system.get_vehicle("CAR001"))
+        assert highlights['most_rented_count'] == 2
+    
+    def test_top_customers(self, populated_system, young_customer):
+        """Test du classement des clients par locations et par chiffre d'affaires."""
+        populated_system.add_customer(young_customer)
+        start = date.today()
+        rental, _ = populated_system.create_rental("CUST001", "CAR001", start, start + timedelta(days=2))
+        populated_system.complete_rental(rental.id, start + timedelta(days=2), 10100.0)
+        
+        top = populated_system.get_top_customers(1)
+        assert [(c.id, count) for c, count in top] == [("CUST001", 1)]
+        
+        by_revenue = populated_system.get_top_customers(by_revenue=True)
+        assert [c.id for c, _ in by_revenue] == ["CUST001", young_customer.id]
+        assert by_revenue[0][1] == rental.total_cost
+        assert by_revenue[1][1] == 0
+    
+    def test_top_vehicles(self, populated_system):
+        """Test du classement des véhicules."""
+        start = date.today() + timedelta(days=1)
+        populated_system.create_rental("CUST001", "TRK001", start, start + timedelta(days=1))
+        populated_system.create_rental("CUST001", "TRK001", start + timedelta(days=3), start + timedelta(days=4))
+        populated_system.create_rental("CUST001", "CAR001", start, start + timedelta(days=1))
+        
+        top = populated_system.get_top_vehicles(2)
+        assert [(v.id, count) for v, count in top] == [("TRK001", 2), ("CAR001", 1)]
+        assert populated_system.get_top_vehicles(2, by_revenue=True)[0][1] == 0
+    
+    def test_vehicles_due_for_maintenance(self, populated_system):
+        """Test de la file des véhicules à entretenir."""
+        car = populated_system.get_vehicle("CAR001")
+        truck = populated_system.get_vehicle("TRK001")
+        assert populated_system.get_vehicles_due_for_maintenance() == []
+        
+        start = date.today()
+        rental, _ = populated_system.create_rental("CUST001", "CAR001", start, start + timedelta(days=1))
+        populated_system.complete_rental(rental.id, start + timedelta(days=1), car.mileage + 9500)
+        
+        due = populated_system.get_vehicles_due_for_maintenance(within_km=1000)
+        assert due == [(car, car.km_until_maintenance())]
+        assert populated_system.get_vehicles_due_for_maintenance(within_km=20000)[0][0] is car
+        assert len(populated_system.get_vehicles_due_for_maintenance(within_km=20000)) == 2
+        
+        assert populated_system.send_vehicle_to_maintenance("TRK001", "Freins")
+        assert populated_system.complete_vehicle_maintenance("TRK001", "Freins", 250.0)
+        assert truck.km_until_maintenance() == 10000
+        assert not populated_system.complete_vehicle_maintenance("TRK001", "Freins")
+    
+    def test_occupancy_after_automatic_start(self, populated_system):
+        """Test que le démarrage automatique met à jour les colonnes."""
+        today = date.today()
+        reserved = Rental.restore({
+            'id': "R-LATE", 'customer_id': "CUST001", 'vehicle_id': "CAR001",
+            'start_date': (today - timedelta(days=3)).isoformat(),
+            'end_date': (today - timedelta(days=1)).isoformat(),
+            'daily_rate': 45.0
+        })
+        populated_system.restore_data(
+            {v.id: v for v in populated_system.get_all_vehicles()},
+            {c.id: c for c in populated_system.get_all_customers()},
+            {reserved.id: reserved}
+        )
+        populated_system.check_and_update_rentals()
+        
+        # Location en cours et en retard: le véhicule reste occupé aujourd'hui
+        assert reserved.status == RentalStatus.ACTIVE
+        assert populated_system.get_vehicle_booked_days(today - timedelta(days=3), today) == {"CAR001": 4}
+    
+    def test_report_snapshot(self, populated_system):
+        """Test de l'instantané consolidé des rapports."""
+        start = date.today()
+        rental, _ = populated_system.create_rental("CUST001", "CAR001", start, start + timedelta(days=2))
+        populated_system.complete_rental(rental.id, start, 10100.0)
+        
+        steps = []
+        snapshot = populated_system.generate_report_snapshot(
+            start, start, progress=lambda done, total: steps.append((done, total))
+        )
+        
+        assert steps[0] == (0, 7) and steps[-1] == (7, 7)
+        assert snapshot['statistics'] is populated_system.generate_statistics_report()
+        assert snapshot['period_revenue']['total_rentals_completed'] == 1
+        assert snapshot['occupancy'] == pytest.approx(50.0)
+        top_customer, rental_count = snapshot['top_customers'][0]
+        assert top_customer.id == "CUST001"
+        assert rental_count == 1
+        assert snapshot['generation'] == populated_system.generation
+    
+    def test_report_snapshot_cancelled(self, populated_system):
+        """Test de l'abandon du calcul de l'instantané."""
+        steps = []
+        snapshot = populated_system.generate_report_snapshot(
+            progress=lambda done, total: steps.append(done),
+            is_cancelled=lambda: len(steps) == 2
+        )
+        
+        assert snapshot is None
+        assert steps == [0, 1]
+    
+    def test_report_snapshot_blocks_mutations(self, populated_system):
+        """Test qu'une modification attend la fin de l'étape de rapport en cours."""
+        entered, release = threading.Event(), threading.Event()
+        original = populated_system.generate_available_vehicles_report
+        
+        def slow_report():
+            entered.set()
+            release.wait(5)
+            return original()
+        
+        populated_system.generate_available_vehicles_report = slow_report
+        worker = threading.Thread(target=populated_system.generate_report_snapshot)
+        worker.start()
+        assert entered.wait(5)
+        
+        writer = threading.Thread(
+            target=populated_system.block_customer, args=("CUST001", "Impayé")
+        )
+        writer.start()
+        writer.join(0.1)
+        assert writer.is_alive()
+        
+        release.set()
+        worker.join(5)
+        writer.join(5)
+        assert populated_system.get_customer("CUST001").is_blocked
+    
+    # === Tests des notifications de changement ===
+    
+    def test_events_for_rental_lifecycle(self, populated_system):
+        """Test des événements publiés à la création et à la fin d'une location."""
+        batches = []
+        populated_system.events.subscribe(batches.append)
+        
+        start = date.today()
+        rental, _ = populated_system.create_rental("CUST001", "CAR001", start, start + timedelta(days=2))
+        assert [event.change_type for event in batches[0]] == [
+            ChangeType.RENTAL_CREATED, ChangeType.CUSTOMER_UPDATED, ChangeType.VEHICLE_UPDATED
+        ]
+        assert batches[0][0].details == {'customer_id': "CUST001", 'vehicle_id': "CAR001"}
+        
+        populated_system.complete_rental(rental.id, date.today(), 10100.0)
+        status_event = batches[1][0]
+        assert status_event == ChangeEvent(
+            ChangeType.RENTAL_STATUS_CHANGED, rental.id,
+            old_status=RentalStatus.ACTIVE, new_status=RentalStatus.COMPLETED
+        )
+    
+    def test_update_rental(self, populated_system):
+        """Test de la modification d'une location via le système."""
+        start = date.today() + timedelta(days=1)
+        rental, _ = populated_system.create_rental(
+            "CUST001", "CAR001", start, start + timedelta(days=5), "Siège bébé"
+        )
+        populated_system.create_rental(
+            "CUST001", "CAR001", start + timedelta(days=7), start + timedelta(days=8)
+        )
+        assert rental.notes == "Siège bébé"
+        batches = []
+        populated_system.events.subscribe(batches.append)
+        generation = populated_system.generation
+        
+        assert populated_system.update_rental(rental.id, start + timedelta(days=2), "Retour à Lyon")[0]
+        assert rental.end_date == start + timedelta(days=2)
+        assert rental.notes == "Retour à Lyon"
+        assert populated_system.generation > generation
+        assert batches == [[ChangeEvent(ChangeType.RENTAL_UPDATED, rental.id)]]
+        assert populated_system.get_vehicle_booked_days(start, start + timedelta(days=5)) == {"CAR001": 3}
+        
+        # La période libérée est de nouveau réservable
+        assert populated_system.create_rental(
+            "CUST001", "CAR001", start + timedelta(days=4), start + timedelta(days=5)
+        )[0] is not None
+        assert not populated_system.update_rental(rental.id, start + timedelta(days=4))[0]
+        assert not populated_system.update_rental(rental.id, start - timedelta(days=1))[0]
+    
+    def test_events_coalesced_in_batch(self, system, sample_car, sample_customer):
+        """Test du regroupement d'une rafale de changements en un seul lot."""
+        batches = []
+        system.events.subscribe(batches.append)
+        
+        with system.events.batch():
+            system.add_vehicle(sample_car)
+            system.reindex_vehicle("CAR001")
+            system.add_customer(sample_customer)
+            system.reindex_customer("CUST001")
+            system.reindex_customer("CUST001")
+        
+        assert len(batches) == 1
+        assert [event.key for event in batches[0]] == [
+            (ChangeType.VEHICLE_ADDED, "CAR001"), (ChangeType.CUSTOMER_ADDED, "CUST001")
+        ]
+    
+    def test_events_deferred_by_scheduler(self, populated_system):
+        """Test de la livraison différée par un planificateur."""
+        batches = []
+        scheduled = []
+        populated_system.events.subscribe(batches.append)
+        populated_system.events.set_scheduler(scheduled.append)
+        
+        populated_system.block_customer("CUST001", "Impayé")
+        populated_system.unblock_customer("CUST001")
+        populated_system.block_customer("CUST001", "Fraude")
+        assert batches == [] and len(scheduled) == 1
+        
+        scheduled[0]()
+        # Le dernier changement est livré en dernier
+        assert batches == [[
+            ChangeEvent(ChangeType.CUSTOMER_UNBLOCKED, "CUST001"),
+            ChangeEvent(ChangeType.CUSTOMER_BLOCKED, "CUST001", reason="Fraude"),
+        ]]
+        assert populated_system.get_customer("CUST001").is_blocked
+    
+    def test_events_keep_last_occurrence_order(self, system, sample_car):
+        """Test qu'un ajout, une suppression puis un ajout restent dans l'ordre."""
+        batches = []
+        system.events.subscribe(batches.append)
+        
+        with system.events.batch():
+            system.add_vehicle(sample_car)
+            system.remove_vehicle("CAR001")
+            system.add_vehicle(sample_car)
+        
+        assert [event.key for event in batches[0]] == [
+            (ChangeType.VEHICLE_REMOVED, "CAR001"), (ChangeType.VEHICLE_ADDED, "CAR001")
+        ]
+    
     def test_get_summary(self, populated_system):
         """Test du résumé."""
         summary = populated_system.get_summary()
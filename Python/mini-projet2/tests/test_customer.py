@@ -180,6 +180,42 @@ class TestCustomer:
         
         assert sample_customer.get_loyalty_discount() == 0.15
     
+    def test_customer_loyalty_cache_follows_history(self, sample_customer):
+        """Test de l'invalidation des valeurs mémorisées par l'historique."""
+        assert sample_customer.get_loyalty_discount() == 0.0
+        assert not sample_customer.is_loyal_customer()
+        
+        for i in range(5):
+            sample_customer.add_rental(f"R{i:03d}")
+        assert sample_customer.get_loyalty_discount() == 0.05
+        assert sample_customer.is_loyal_customer()
+        
+        sample_customer.restore_state([], [], False, None)
+        assert sample_customer.get_loyalty_discount() == 0.0
+    
+    def test_customer_age_recomputed_next_day(self, monkeypatch):
+        """Test du recalcul de l'âge au changement de jour."""
+        import models.customer as customer_module
+        
+        class FakeDate(date):
+            current = date(2024, 5, 14)
+            
+            @classmethod
+            def today(cls):
+                return cls.current
+        
+        monkeypatch.setattr(customer_module, "date", FakeDate)
+        customer = Customer(
+            first_name="Jean", last_name="Dupont", birth_date=date(1990, 5, 15),
+            license_number="123456789012", license_types={"B"},
+            license_date=date(2023, 5, 15), email="jean.dupont@email.com",
+            phone="0612345678"
+        )
+        assert (customer.age, customer.years_of_license) == (33, 0)
+        
+        FakeDate.current = date(2024, 5, 15)
+        assert (customer.age, customer.years_of_license) == (34, 1)
+    
     def test_customer_to_dict(self, sample_customer):
         """Test de la conversion en dictionnaire."""
         data = sample_customer.to_dict()
@@ -209,6 +245,32 @@ class TestCustomer:
         assert sample_customer.last_name == "Martin"
         assert sample_customer.full_name == "Jacques Martin"
         assert sample_customer.email == "jacques@test.com"
+    
+    def test_customer_dirty_tracking(self, sample_customer):
+        """Test que chaque modification persistée marque le client."""
+        assert sample_customer.is_dirty
+        
+        changes = [
+            lambda: setattr(sample_customer, 'email', "jean@exemple.fr"),
+            lambda: setattr(sample_customer, 'phone', "0698765432"),
+            lambda: setattr(sample_customer, 'address', "1 Rue de Lyon"),
+            lambda: sample_customer.add_license_type("A"),
+            lambda: sample_customer.add_rental("RENT001"),
+            lambda: sample_customer.complete_rental("RENT001"),
+            lambda: sample_customer.block("Impayé"),
+            sample_customer.unblock,
+            lambda: sample_customer.restore_state(["RENT001"], [], False, None),
+        ]
+        for change in changes:
+            sample_customer.mark_clean()
+            change()
+            assert sample_customer.is_dirty
+        
+        # Une opération refusée ou une lecture ne marque rien
+        sample_customer.mark_clean()
+        assert not sample_customer.complete_rental("INCONNUE")
+        sample_customer.get_loyalty_discount()
+        assert not sample_customer.is_dirty
 
 
 if __name__ == "__main__":
@@ -0,0 +1,370 @@
+"""
+Tests unitaires pour la classe DataPersistence.
+"""
+
+import pytest
+from datetime import date, timedelta
+
+import sys
+sys.path.insert(0, '..')
+
+from models.persistence import DataPersistence
+from models.sqlite_persistence import SQLitePersistence
+from models.vehicle import Car, VehicleCategory
+from models.customer import Customer
+from models.rental import Rental
+from models.exceptions import DataLoadError
+
+
+@pytest.fixture
+def sample_car():
+    """Crée une voiture de test."""
+    return Car(
+        brand="Renault",
+        model="Clio",
+        category=VehicleCategory.ECONOMY,
+        daily_rate=45.0,
+        year=2022,
+        license_plate="AB-123-CD",
+        vehicle_id="CAR001"
+    )
+
+
+@pytest.fixture
+def sample_customer():
+    """Crée un client de test."""
+    return Customer(
+        first_name="Jean",
+        last_name="Dupont",
+        birth_date=date(1990, 5, 15),
+        license_number="123456789012",
+        license_types={"B"},
+        license_date=date(2010, 6, 20),
+        email="jean.dupont@email.com",
+        phone="0612345678",
+        customer_id="CUST001"
+    )
+
+
+class TestDataPersistence:
+    """Tests pour la classe DataPersistence."""
+    
+    @pytest.fixture
+    def persistence(self, tmp_path):
+        """Crée un gestionnaire de persistance dans un répertoire temporaire."""
+        return DataPersistence(tmp_path, compaction_threshold=3)
+    
+    @pytest.fixture
+    def sample_rental(self):
+        """Crée une location future de test."""
+        start = date.today() + timedelta(days=2)
+        return Rental(
+            customer_id="CUST001",
+            vehicle_id="CAR001",
+            start_date=start,
+            end_date=start + timedelta(days=3),
+            daily_rate=45.0,
+            rental_id="RENT001"
+        )
+    
+    def test_save_and_load_all(self, persistence, sample_car, sample_customer, sample_rental):
+        """Test de sauvegarde et chargement complets."""
+        persistence.save_all(
+            {sample_car.id: sample_car},
+            {sample_customer.id: sample_customer},
+            {sample_rental.id: sample_rental}
+        )
+        
+        vehicles, customers, rentals = persistence.load_all()
+        assert list(vehicles) == ["CAR001"]
+        assert list(customers) == ["CUST001"]
+        assert list(rentals) == ["RENT001"]
+    
+    def test_journal_replayed_on_load(self, persistence, sample_car, sample_customer, sample_rental):
+        """Test du rejeu du journal sans instantané."""
+        persistence.journal_vehicle(sample_car)
+        persistence.journal_customer(sample_customer)
+        persistence.journal_rental(sample_rental)
+        
+        sample_customer.block("Impayé")
+        persistence.journal_customer(sample_customer)
+        
+        assert persistence.journal_size == 4
+        vehicles, customers, rentals = persistence.load_all()
+        assert list(vehicles) == ["CAR001"]
+        assert customers["CUST001"].is_blocked
+        assert rentals["RENT001"].end_date == sample_rental.end_date
+    
+    def test_journal_over_snapshot(self, persistence, sample_car, sample_customer):
+        """Test du rejeu du journal sur un instantané existant."""
+        persistence.save_all({sample_car.id: sample_car}, {sample_customer.id: sample_customer}, {})
+        persistence.journal_delete(DataPersistence.VEHICLE, "CAR001")
+        
+        vehicles, customers, _ = persistence.load_all()
+        assert vehicles == {}
+        assert list(customers) == ["CUST001"]
+    
+    def test_journal_applied_to_streamed_snapshot(self, persistence, sample_rental):
+        """Test du rejeu du journal sur un instantané lu en flux."""
+        persistence.READ_CHUNK_SIZE = 16
+        rentals = {}
+        for number in range(1, 4):
+            data = sample_rental.to_dict()
+            data['id'] = f"RENT00{number}"
+            rentals[data['id']] = Rental.restore(data)
+        persistence.save_all({}, {}, rentals)
+        
+        rentals["RENT002"].extend_rental(rentals["RENT002"].end_date + timedelta(days=2))
+        persistence.journal_rental(rentals["RENT002"])
+        persistence.journal_delete(DataPersistence.RENTAL, "RENT001")
+        data = sample_rental.to_dict()
+        data['id'] = "RENT004"
+        persistence.journal_rental(Rental.restore(data))
+        
+        _, _, loaded = persistence.load_all()
+        assert list(loaded) == ["RENT002", "RENT003", "RENT004"]
+        assert loaded["RENT002"].end_date == rentals["RENT002"].end_date
+    
+    def test_journal_delete_unknown_kind(self, persistence):
+        """Test de suppression avec un type d'entité inconnu."""
+        with pytest.raises(ValueError):
+            persistence.journal_delete("garage", "X")
+    
+    def test_compact_if_needed(self, persistence, sample_car, sample_customer):
+        """Test de la compaction au-delà du seuil."""
+        vehicles = {sample_car.id: sample_car}
+        customers = {sample_customer.id: sample_customer}
+        
+        persistence.journal_vehicle(sample_car)
+        persistence.journal_customer(sample_customer)
+        assert not persistence.compact_if_needed(vehicles, customers, {})
+        
+        persistence.journal_customer(sample_customer)
+        assert persistence.compact_if_needed(vehicles, customers, {})
+        assert persistence.journal_size == 0
+        assert not persistence.journal_path.exists()
+        
+        loaded_vehicles, loaded_customers, _ = persistence.load_all()
+        assert list(loaded_vehicles) == ["CAR001"]
+        assert list(loaded_customers) == ["CUST001"]
+    
+    def test_truncated_journal_tail_ignored(self, persistence, sample_car):
+        """Test qu'une dernière ligne incomplète du journal est ignorée."""
+        persistence.journal_vehicle(sample_car)
+        with open(persistence.journal_path, 'a', encoding='utf-8') as f:
+            f.write('{"op":"put","kind":"vehicle","da')
+        
+        vehicles, _, _ = persistence.load_all()
+        assert list(vehicles) == ["CAR001"]
+        
+        # La réouverture ne modifie pas le journal; la ligne incomplète
+        # n'est tronquée qu'au premier ajout
+        content = persistence.journal_path.read_bytes()
+        reopened = DataPersistence(persistence.data_dir)
+        assert reopened.journal_size == 1
+        assert persistence.journal_path.read_bytes() == content
+        reopened.journal_delete(DataPersistence.VEHICLE, "CAR001")
+        vehicles, _, _ = reopened.load_all()
+        assert vehicles == {}
+    
+    def test_save_all_skips_unchanged_files(self, persistence, sample_car, sample_customer):
+        """Test que save_all ne réécrit que les collections modifiées."""
+        vehicles = {sample_car.id: sample_car}
+        customers = {sample_customer.id: sample_customer}
+        
+        persistence.save_all(vehicles, customers, {})
+        assert persistence.entities_written == 2
+        assert not sample_car.is_dirty
+        
+        persistence.save_all(vehicles, customers, {})
+        assert persistence.entities_written == 0
+        
+        sample_customer.block("Impayé")
+        persistence.save_all(vehicles, customers, {})
+        assert persistence.entities_written == 1
+    
+    def test_save_changes_journals_dirty_entities(self, persistence, sample_car, sample_customer):
+        """Test de la sauvegarde incrémentale dans le journal."""
+        vehicles = {sample_car.id: sample_car}
+        customers = {sample_customer.id: sample_customer}
+        persistence.save_all(vehicles, customers, {})
+        
+        sample_car.rent()
+        assert persistence.save_changes(vehicles, customers, {}) == 1
+        assert persistence.journal_size == 1
+        
+        del customers[sample_customer.id]
+        assert persistence.save_changes(vehicles, customers, {}) == 1
+        
+        loaded_vehicles, loaded_customers, _ = persistence.load_all()
+        assert loaded_vehicles["CAR001"].state == sample_car.state
+        assert loaded_customers == {}
+        assert not loaded_vehicles["CAR001"].is_dirty
+    
+    def test_save_all_after_journal(self, persistence, sample_car, sample_customer):
+        """Test que save_all n'est pas écrasé par un journal plus ancien."""
+        vehicles = {sample_car.id: sample_car}
+        customers = {sample_customer.id: sample_customer}
+        persistence.save_all(vehicles, customers, {})
+        
+        sample_car.daily_rate = 40
+        persistence.save_changes(vehicles, customers, {})
+        sample_car.daily_rate = 50
+        persistence.save_all(vehicles, customers, {})
+        
+        assert not persistence.journal_path.exists()
+        loaded_vehicles, _, _ = persistence.load_all()
+        assert loaded_vehicles["CAR001"].daily_rate == 50.0
+    
+    def test_streamed_array_loading(self, persistence, sample_rental):
+        """Test de la lecture en flux d'un tableau JSON sur plusieurs blocs."""
+        persistence.READ_CHUNK_SIZE = 16
+        persistence.save_rentals({sample_rental.id: sample_rental})
+        
+        rentals = persistence.load_rentals()
+        assert list(rentals) == ["RENT001"]
+        assert rentals["RENT001"].end_date == sample_rental.end_date
+    
+    def test_truncated_array_rejected(self, persistence):
+        """Test du rejet d'un tableau JSON incomplet."""
+        persistence.rentals_path.write_text('[{"id": "RENT001"}, {"id": ', encoding='utf-8')
+        
+        with pytest.raises(DataLoadError):
+            persistence.load_rentals()
+    
+    def test_convert_rentals_to_json_lines(self, persistence, sample_rental):
+        """Test de la conversion au format JSON Lines."""
+        persistence.save_rentals({sample_rental.id: sample_rental})
+        
+        assert persistence.convert_rentals_to_json_lines() == 1
+        assert not persistence.rentals_path.exists()
+        assert persistence.rentals_storage_path == persistence.rentals_lines_path
+        assert list(persistence.load_rentals()) == ["RENT001"]
+        
+        # Les sauvegardes suivantes restent au format JSON Lines
+        sample_rental.notes = "Siège bébé"
+        persistence.save_rentals({sample_rental.id: sample_rental})
+        assert not persistence.rentals_path.exists()
+        assert persistence.load_rentals()["RENT001"].id == "RENT001"
+        assert len(persistence.rentals_lines_path.read_text(encoding='utf-8').splitlines()) == 1
+    
+    def test_past_rentals_restored(self, persistence, sample_rental):
+        """Test de la restauration sans perte des locations passées."""
+        data = persistence._rental_to_dict(sample_rental)
+        data['start_date'] = (date.today() - timedelta(days=10)).isoformat()
+        data['end_date'] = (date.today() - timedelta(days=7)).isoformat()
+        data['actual_return_date'] = data['end_date']
+        data['_status'] = "COMPLETED"
+        persistence._write_json_lines(persistence.rentals_lines_path, [data])
+        
+        rentals = persistence.load_rentals()
+        rental = rentals["RENT001"]
+        assert rental.status.name == "COMPLETED"
+        assert rental.start_date == date.today() - timedelta(days=10)
+        assert rental.discount_applied == sample_rental.discount_applied
+    
+    def test_journal_size_restored(self, tmp_path, sample_car):
+        """Test du comptage du journal existant à l'ouverture."""
+        DataPersistence(tmp_path).journal_vehicle(sample_car)
+        assert DataPersistence(tmp_path).journal_size == 1
+
+
+class TestSQLitePersistence:
+    """Tests pour la classe SQLitePersistence."""
+    
+    @pytest.fixture
+    def persistence(self, tmp_path):
+        """Crée une base SQLite dans un répertoire temporaire."""
+        persistence = SQLitePersistence(tmp_path)
+        yield persistence
+        persistence.close()
+    
+    @pytest.fixture
+    def completed_rental(self):
+        """Crée une location terminée aujourd'hui."""
+        rental = Rental(
+            customer_id="CUST001",
+            vehicle_id="CAR001",
+            start_date=date.today(),
+            end_date=date.today() + timedelta(days=2),
+            daily_rate=45.0,
+            rental_id="RENT002"
+        )
+        rental.start_rental()
+        rental.complete_rental(date.today())
+        return rental
+    
+    def test_save_and_load_all(self, persistence, sample_car, sample_customer, completed_rental):
+        """Test de sauvegarde et chargement des trois collections."""
+        persistence.save_all(
+            {sample_car.id: sample_car},
+            {sample_customer.id: sample_customer},
+            {completed_rental.id: completed_rental}
+        )
+        
+        vehicles, customers, rentals = persistence.load_all()
+        assert list(vehicles) == ["CAR001"]
+        assert vehicles["CAR001"].model == "Clio"
+        assert customers["CUST001"].full_name == sample_customer.full_name
+        assert rentals["RENT002"].total_cost == pytest.approx(completed_rental.total_cost)
+    
+    def test_unchanged_rows_not_rewritten(self, persistence, sample_car):
+        """Test que seules les lignes modifiées sont réécrites."""
+        vehicles = {sample_car.id: sample_car}
+        persistence.save_vehicles(vehicles)
+        assert persistence.entities_written == 1
+        
+        persistence.save_vehicles(vehicles)
+        assert persistence.entities_written == 0
+        
+        sample_car.daily_rate = 42.0
+        persistence.save_vehicles(vehicles)
+        assert persistence.entities_written == 1
+    
+    def test_removed_entities_deleted(self, persistence, sample_car):
+        """Test de la suppression des entités retirées."""
+        persistence.save_vehicles({sample_car.id: sample_car})
+        persistence.save_vehicles({})
+        
+        assert persistence.load_vehicles() == {}
+        assert not persistence.data_exists()
+    
+    def test_revenue_summary(self, persistence, sample_car, completed_rental):
+        """Test du chiffre d'affaires calculé par SQLite."""
+        persistence.journal_vehicle(sample_car)
+        persistence.journal_rental(completed_rental)
+        today = date.today()
+        
+        summary = persistence.revenue_summary(today, today)
+        assert summary['total_rentals_completed'] == 1
+        assert summary['total_revenue'] == pytest.approx(completed_rental.total_cost)
+        assert summary['revenue_by_vehicle_type'] == {
+            "Voiture": pytest.approx(completed_rental.total_cost)
+        }
+        
+        yesterday = today - timedelta(days=1)
+        assert persistence.revenue_summary(yesterday, yesterday)['total_rentals_completed'] == 0
+    
+    def test_load_rentals_between(self, persistence):
+        """Test du chargement des locations sur un intervalle."""
+        start = date.today() + timedelta(days=10)
+        rental = Rental(
+            customer_id="CUST001",
+            vehicle_id="CAR001",
+            start_date=start,
+            end_date=start + timedelta(days=2),
+            daily_rate=45.0,
+            rental_id="RENT003"
+        )
+        persistence.save_rentals({rental.id: rental})
+        
+        later = start + timedelta(days=5)
+        assert list(persistence.load_rentals_between(start + timedelta(days=2), later)) == ["RENT003"]
+        assert persistence.load_rentals_between(start + timedelta(days=3), later) == {}
+        
+        # Un chargement partiel ne fait pas oublier les locations sauvegardées
+        assert persistence.save_changes({}, {}, {rental.id: rental}) == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
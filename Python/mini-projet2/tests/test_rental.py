@@ -116,6 +116,22 @@ class TestRental:
         expected = base_cost * 0.90
         assert sample_rental.calculate_total_cost() == expected
     
+    def test_rental_cost_cache_invalidation(self, sample_rental, future_date):
+        """Test de l'invalidation du coût mémorisé."""
+        assert sample_rental.total_cost == 300.0
+        
+        sample_rental.extend_rental(future_date + timedelta(days=6))
+        assert sample_rental.total_cost == 350.0 * 0.9
+        
+        sample_rental.apply_discount(0.10)
+        assert sample_rental.total_cost == pytest.approx(350.0 * 0.9 * 0.9)
+    
+    def test_rental_cost_frozen_at_completion(self, active_rental):
+        """Test du coût figé à la clôture."""
+        cost = active_rental.complete_rental(date.today() + timedelta(days=1))
+        assert active_rental._cost_cache == (100.0, cost)
+        assert active_rental.total_cost == cost == 100.0
+    
     def test_rental_start(self):
         """Test du démarrage d'une location."""
         rental = Rental(
@@ -237,6 +253,49 @@ class TestRental:
         string = str(sample_rental)
         assert "Location" in string
         assert "réservée" in string
+    
+    def test_rental_dirty_tracking(self, sample_rental, active_rental, future_date):
+        """Test que chaque modification persistée marque la location."""
+        assert sample_rental.is_dirty
+        
+        changes = [
+            lambda: setattr(sample_rental, 'notes', "Siège enfant"),
+            lambda: sample_rental.apply_discount(0.1),
+            lambda: sample_rental.extend_rental(future_date + timedelta(days=10)),
+            lambda: setattr(sample_rental, 'end_date', future_date + timedelta(days=5)),
+            sample_rental.cancel_rental,
+        ]
+        for change in changes:
+            sample_rental.mark_clean()
+            change()
+            assert sample_rental.is_dirty
+        
+        active_rental.mark_clean()
+        active_rental.complete_rental(date.today() + timedelta(days=5), 10500.0)
+        assert active_rental.is_dirty
+        
+        # Une opération refusée ou une lecture ne marque rien
+        sample_rental.mark_clean()
+        assert not sample_rental.start_rental()
+        sample_rental.calculate_total_cost()
+        assert not sample_rental.is_dirty
+    
+    def test_rental_restore_past_completed(self, active_rental):
+        """Test de la restauration d'une location terminée dans le passé."""
+        active_rental.complete_rental(date.today() + timedelta(days=1), 1500)
+        data = active_rental.to_dict()
+        data['start_date'] = (date.today() - timedelta(days=30)).isoformat()
+        data['end_date'] = (date.today() - timedelta(days=25)).isoformat()
+        data['actual_return_date'] = (date.today() - timedelta(days=24)).isoformat()
+        data['_status'] = active_rental.status.name
+        
+        restored = Rental.restore(data)
+        assert restored.id == active_rental.id
+        assert restored.status == RentalStatus.COMPLETED
+        assert restored.start_date == date.today() - timedelta(days=30)
+        assert restored.days_late == 1
+        assert restored.end_mileage == 1500
+        assert not restored.is_dirty
 
 
 if __name__ == "__main__":
@@ -193,6 +193,41 @@ class TestCar:
         assert sample_car.needs_maintenance() == False
         sample_car._mileage = 10000
         assert sample_car.needs_maintenance() == True
+    
+    def test_car_km_until_maintenance(self, sample_car):
+        """Test des kilomètres restants avant maintenance."""
+        sample_car.mileage = 12000
+        assert sample_car.km_until_maintenance() == -2000
+        
+        sample_car.send_to_maintenance("Vidange")
+        sample_car.complete_maintenance("Vidange", 80.0)
+        assert sample_car.last_maintenance_mileage == 12000
+        assert sample_car.km_until_maintenance() == 10000
+        assert not sample_car.needs_maintenance()
+    
+    def test_car_dirty_tracking(self, sample_car):
+        """Test que chaque modification persistée marque le véhicule."""
+        assert sample_car.is_dirty
+        
+        changes = [
+            lambda: setattr(sample_car, 'daily_rate', 50.0),
+            lambda: setattr(sample_car, 'mileage', sample_car.mileage + 100),
+            sample_car.rent,
+            lambda: sample_car.return_vehicle(sample_car.mileage + 200),
+            lambda: sample_car.send_to_maintenance("Vidange"),
+            lambda: sample_car.complete_maintenance("Vidange", 80.0),
+            lambda: setattr(sample_car, 'state', VehicleState.OUT_OF_SERVICE),
+        ]
+        for change in changes:
+            sample_car.mark_clean()
+            change()
+            assert sample_car.is_dirty
+        
+        # Une opération refusée ou une lecture ne marque rien
+        sample_car.mark_clean()
+        assert not sample_car.complete_maintenance("Rien")
+        sample_car.calculate_rental_cost(3)
+        assert not sample_car.is_dirty
 
 
 class TestTruck: